@@ -95,6 +95,42 @@ class Settings(BaseSettings):
         alias="DATABASE_REQUIRE_TLS",
         description="Whether to force TLS when connecting to the primary database.",
     )
+    database_pool_size: int = Field(
+        default=20,
+        alias="DATABASE_POOL_SIZE",
+        description="Number of persistent connections kept in the database pool.",
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        alias="DATABASE_MAX_OVERFLOW",
+        description="Extra connections the pool may open beyond DATABASE_POOL_SIZE under load.",
+    )
+    database_pool_pre_ping: bool = Field(
+        default=True,
+        alias="DATABASE_POOL_PRE_PING",
+        description=(
+            "Issue a liveness probe on every pool checkout (on by default) so connections "
+            "dropped by the server or pgbouncer are replaced; false saves one round trip."
+        ),
+    )
+    database_pool_timeout: int = Field(
+        default=30,
+        alias="DATABASE_POOL_TIMEOUT",
+        description="Seconds to wait for a free pooled connection before failing the request.",
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        alias="DATABASE_POOL_RECYCLE",
+        description="Seconds after which pooled connections are replaced; -1 disables.",
+    )
+    database_pgbouncer: bool = Field(
+        default=False,
+        alias="DATABASE_PGBOUNCER",
+        description=(
+            "Disable server-side prepared statements so DATABASE_URL can point at "
+            "pgbouncer in transaction-pool mode."
+        ),
+    )
     redis_url: str | None = Field(
         default=None,
         validation_alias=AliasChoices("REDIS_URL", "REDIS_TLS_URL"),
@@ -153,6 +189,16 @@ class Settings(BaseSettings):
     ocr_provider: Literal["tesseract", "textract"] = Field(
         default="tesseract", alias="OCR_PROVIDER"
     )
+    ocr_workers: int = Field(
+        default=0,
+        alias="OCR_WORKERS",
+        description="Tesseract worker processes; 0 uses a quarter of the available CPUs.",
+    )
+    ocr_max_pages: int = Field(
+        default=3,
+        alias="OCR_MAX_PAGES",
+        description="Most PDF pages rasterized for one sale ticket; longer PDFs are rejected.",
+    )
     zap_ticket_finalized_url: str | None = Field(default=None, alias="ZAP_TICKET_FINALIZED_URL")
     zap_po_received_url: str | None = Field(default=None, alias="ZAP_PO_RECEIVED_URL")
     zap_delivery_completed_url: str | None = Field(default=None, alias="ZAP_DELIVERY_COMPLETED_URL")
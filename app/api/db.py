@@ -6,6 +6,7 @@ from collections.abc import AsyncIterator
 
 from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from .config import get_settings
 from .utils.logging import sanitize_connection_url
@@ -40,6 +41,39 @@ def _ensure_async_driver(database_url: str, *, require_tls: bool = False) -> str
         return str(url)
 
 
+def _pool_options(database_url: str) -> dict[str, object]:
+    """Return connection pool tuning arguments for ``create_async_engine``.
+
+    SQLite relies on SQLAlchemy's default pool selection, which does not accept
+    sizing arguments for in-memory databases. Other backends pin the asyncio-aware
+    queue pool; the synchronous ``QueuePool`` would block the event loop on checkout.
+    """
+
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+
+
+def _connect_args(database_url: str) -> dict[str, object]:
+    """Return driver arguments for ``create_async_engine``.
+
+    pgbouncer in transaction-pool mode hands each transaction a different server
+    connection, so psycopg's automatically prepared statements would not be found
+    there; ``prepare_threshold=None`` turns them off.
+    """
+
+    if settings.database_pgbouncer and make_url(database_url).get_backend_name() == "postgresql":
+        return {"prepare_threshold": None}
+    return {}
+
+
 engine = create_async_engine(
     _ensure_async_driver(
         settings.database_url,
@@ -47,6 +81,8 @@ engine = create_async_engine(
     ),
     echo=settings.sqlalchemy_echo,
     future=True,
+    connect_args=_connect_args(settings.database_url),
+    **_pool_options(settings.database_url),
 )
 logger.debug(
     "Configured async engine", extra={"database_url": sanitize_connection_url(settings.database_url)}
@@ -66,3 +102,9 @@ async def get_session() -> AsyncIterator[AsyncSession]:
         raise
     finally:
         await session.close()
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Provide the session factory for handlers that fan out across sessions."""
+
+    return SessionLocal
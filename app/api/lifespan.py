@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -10,9 +11,10 @@ from fastapi import FastAPI
 
 from .config import get_settings
 from .db import engine
+from .services.ocr.tesseract import get_ocr_executor, get_tesseract_provider
 from .services.redis import get_redis_client
 from .utils.logging import log_startup_settings
-from .utils.schema import ensure_runtime_schema
+from .utils.schema import ensure_runtime_schema, refresh_known_tables
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +28,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Shared resources available through ``app.state``.
     app.state.db_engine = engine
     app.state.redis = get_redis_client()
+    app.state.ocr_executor = get_ocr_executor()
 
     await ensure_runtime_schema()
+    await refresh_known_tables()
     if settings.log_startup_summary:
         log_startup_settings(settings)
     logger.info(
@@ -44,6 +48,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             get_redis_client.cache_clear()
             app.state.redis = None
 
+        ocr_executor = getattr(app.state, "ocr_executor", None)
+        if ocr_executor is not None:
+            # shutdown() joins the worker processes, so it runs off the event loop.
+            await asyncio.to_thread(ocr_executor.shutdown, cancel_futures=True)
+            get_tesseract_provider.cache_clear()
+            get_ocr_executor.cache_clear()
+            app.state.ocr_executor = None
+
         db_engine = getattr(app.state, "db_engine", None)
         if db_engine is not None:
             await db_engine.dispose()
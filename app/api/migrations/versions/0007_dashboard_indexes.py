@@ -0,0 +1,57 @@
+"""Add partial and covering indexes for dashboard summary queries."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007_dashboard_indexes"
+down_revision = "0006_sale_editing_fields"
+branch_labels = None
+depends_on = None
+
+
+DASHBOARD_INDEXES = (
+    ("idx_sale_open_sale_date", "sale", "sale_date DESC", "status = 'open'", None),
+    ("idx_sale_open_created", "sale", "created_at DESC", "status = 'open'", None),
+    (
+        "idx_sale_draft_ocr_created",
+        "sale",
+        "created_at DESC",
+        "status = 'draft' AND source = 'ocr_ticket'",
+        None,
+    ),
+    ("idx_po_inbound_created", "po", "created_at DESC", "status IN ('open', 'partial')", None),
+    (
+        "idx_receiving_received_at",
+        "receiving",
+        "received_at DESC",
+        None,
+        ["received_by", "receipt_id"],
+    ),
+    ("idx_receiving_created", "receiving", "created_at DESC", None, ["received_by"]),
+)
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, column, where, include in DASHBOARD_INDEXES:
+            predicate = sa.text(where) if where else None
+            op.create_index(
+                name,
+                table,
+                [sa.text(column)],
+                postgresql_where=predicate,
+                postgresql_include=include or [],
+                postgresql_concurrently=is_postgres,
+                sqlite_where=predicate,
+            )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, _column, _where, _include in reversed(DASHBOARD_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=is_postgres)
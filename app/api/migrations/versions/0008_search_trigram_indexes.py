@@ -0,0 +1,47 @@
+"""Add pg_trgm GIN indexes for substring search on items, vendors and bills."""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0008_search_trigram_indexes"
+down_revision = "0007_dashboard_indexes"
+branch_labels = None
+depends_on = None
+
+
+TRIGRAM_INDEXES = (
+    ("idx_item_sku_trgm", "item", "sku"),
+    ("idx_item_description_trgm", "item", "description"),
+    ("idx_item_short_code_trgm", "item", "short_code"),
+    ("idx_vendor_name_trgm", "vendor", "name"),
+    ("idx_bill_invoice_no_trgm", "bill", "invoice_no"),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name, table, _column in reversed(TRIGRAM_INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
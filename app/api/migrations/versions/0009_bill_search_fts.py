@@ -0,0 +1,36 @@
+"""Add a full-text GIN index for invoice search."""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0009_bill_search_fts"
+down_revision = "0008_search_trigram_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Enum-to-text casts are not IMMUTABLE, so Postgres rejects ``status::text`` in an
+# index expression. Comparing against enum labels is, so map each label explicitly.
+STATUS_TEXT = (
+    "CASE status WHEN 'draft' THEN 'draft' WHEN 'exported' THEN 'exported' "
+    "WHEN 'paid' THEN 'paid' ELSE '' END"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bill_search_fts ON bill USING gin "
+            f"((to_tsvector('simple', coalesce(invoice_no, '') || ' ' || {STATUS_TEXT})))"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_bill_search_fts")
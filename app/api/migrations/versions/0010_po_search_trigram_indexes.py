@@ -0,0 +1,44 @@
+"""Add pg_trgm GIN indexes for purchase order line search."""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0010_po_search_trigram_indexes"
+down_revision = "0009_bill_search_fts"
+branch_labels = None
+depends_on = None
+
+
+TRIGRAM_INDEXES = (
+    ("idx_po_line_description_trgm", "po_line", "description"),
+    ("idx_po_notes_trgm", "po", "notes"),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name, table, _column in reversed(TRIGRAM_INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,43 @@
+"""Add partial indexes for open purchase orders and lines with remaining quantity."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0011_po_open_line_indexes"
+down_revision = "0010_po_search_trigram_indexes"
+branch_labels = None
+depends_on = None
+
+
+OPEN_PO_INDEXES = (
+    ("idx_po_open_status", "po", "status IN ('open', 'partial')"),
+    (
+        "idx_po_line_open_remaining",
+        "po_line",
+        "qty_ordered - COALESCE(qty_received, 0) > 0",
+    ),
+)
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, where in OPEN_PO_INDEXES:
+            op.create_index(
+                name,
+                table,
+                ["po_id"],
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=is_postgres,
+                sqlite_where=sa.text(where),
+            )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, _where in reversed(OPEN_PO_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=is_postgres)
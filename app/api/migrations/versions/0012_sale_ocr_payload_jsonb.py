@@ -0,0 +1,55 @@
+"""Store sale OCR payloads as JSONB with a GIN index."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0012_sale_ocr_payload_jsonb"
+down_revision = "0011_po_open_line_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "sale",
+        "ocr_payload",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="ocr_payload::jsonb",
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_sale_ocr_payload",
+            "sale",
+            ["ocr_payload"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_sale_ocr_payload",
+            table_name="sale",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.alter_column(
+        "sale",
+        "ocr_payload",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="ocr_payload::json",
+    )
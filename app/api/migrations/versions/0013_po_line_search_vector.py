@@ -0,0 +1,121 @@
+"""Add a trigger-maintained full-text search vector to PO lines."""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0013_po_line_search_vector"
+down_revision = "0012_sale_ocr_payload_jsonb"
+branch_labels = None
+depends_on = None
+
+
+# The document spans item, po and vendor, so a generated column cannot express
+# it; triggers on each source table keep po_line.search_vec current instead.
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION po_line_search_vector(
+    p_item_id integer, p_po_id integer, p_description text
+) RETURNS tsvector LANGUAGE sql STABLE AS $$
+    SELECT to_tsvector(
+        'simple',
+        coalesce(
+            (SELECT coalesce(sku, '') || ' ' || coalesce(description, '')
+             FROM item WHERE item_id = p_item_id),
+            ''
+        )
+        || ' ' || coalesce(p_description, '')
+        || ' ' || coalesce(
+            (SELECT coalesce(po.notes, '') || ' ' || coalesce(vendor.name, '')
+             FROM po LEFT JOIN vendor ON vendor.vendor_id = po.vendor_id
+             WHERE po.po_id = p_po_id),
+            ''
+        )
+    )
+$$
+"""
+
+PO_LINE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION po_line_search_vec_refresh() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vec := po_line_search_vector(NEW.item_id, NEW.po_id, NEW.description);
+    RETURN NEW;
+END
+$$
+"""
+
+SOURCE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION po_line_search_vec_sync() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'item' THEN
+        UPDATE po_line
+        SET search_vec = po_line_search_vector(item_id, po_id, description)
+        WHERE item_id = NEW.item_id;
+    ELSIF TG_TABLE_NAME = 'po' THEN
+        UPDATE po_line
+        SET search_vec = po_line_search_vector(item_id, po_id, description)
+        WHERE po_id = NEW.po_id;
+    ELSE
+        UPDATE po_line
+        SET search_vec = po_line_search_vector(item_id, po_id, description)
+        WHERE po_id IN (SELECT po_id FROM po WHERE vendor_id = NEW.vendor_id);
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+TRIGGERS = (
+    (
+        "po_line_search_vec_refresh",
+        "po_line",
+        "BEFORE INSERT OR UPDATE OF item_id, po_id, description",
+        "po_line_search_vec_refresh",
+    ),
+    (
+        "item_po_line_search_vec",
+        "item",
+        "AFTER UPDATE OF sku, description",
+        "po_line_search_vec_sync",
+    ),
+    ("po_po_line_search_vec", "po", "AFTER UPDATE OF notes, vendor_id", "po_line_search_vec_sync"),
+    ("vendor_po_line_search_vec", "vendor", "AFTER UPDATE OF name", "po_line_search_vec_sync"),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE po_line ADD COLUMN IF NOT EXISTS search_vec tsvector")
+    op.execute(SEARCH_VECTOR_FUNCTION)
+    op.execute(PO_LINE_TRIGGER_FUNCTION)
+    op.execute(SOURCE_TRIGGER_FUNCTION)
+    for name, table, timing, function in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+        op.execute(
+            f"CREATE TRIGGER {name} {timing} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {function}()"
+        )
+    op.execute(
+        "UPDATE po_line SET search_vec = po_line_search_vector(item_id, po_id, description)"
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_po_line_search_vec "
+            "ON po_line USING gin (search_vec)"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_po_line_search_vec")
+    for name, table, _timing, _function in reversed(TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS po_line_search_vec_sync()")
+    op.execute("DROP FUNCTION IF EXISTS po_line_search_vec_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS po_line_search_vector(integer, integer, text)")
+    op.execute("ALTER TABLE po_line DROP COLUMN IF EXISTS search_vec")
@@ -0,0 +1,33 @@
+"""Add a partial index for the draft sales listing."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0014_sale_draft_index"
+down_revision = "0013_po_line_search_vector"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    predicate = sa.text("status = 'draft'")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_sale_draft",
+            "sale",
+            ["sale_id"],
+            postgresql_where=predicate,
+            postgresql_include=["ocr_confidence", "total"],
+            postgresql_concurrently=is_postgres,
+            sqlite_where=predicate,
+        )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        op.drop_index("idx_sale_draft", table_name="sale", postgresql_concurrently=is_postgres)
@@ -0,0 +1,44 @@
+"""Add pg_trgm GIN indexes for vendor email and phone search."""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0015_vendor_contact_trigram_indexes"
+down_revision = "0014_sale_draft_index"
+branch_labels = None
+depends_on = None
+
+
+TRIGRAM_INDEXES = (
+    ("idx_vendor_email_trgm", "vendor", "email"),
+    ("idx_vendor_phone_trgm", "vendor", "phone"),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name, table, _column in reversed(TRIGRAM_INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
@@ -19,7 +19,9 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -190,6 +192,20 @@ class PurchaseOrder(Base, TimestampMixin):
     incoming_trucks: Mapped[list["IncomingTruck"]] = relationship(back_populates="po")
 
 
+Index(
+    "idx_po_inbound_created",
+    PurchaseOrder.created_at.desc(),
+    postgresql_where=PurchaseOrder.status.in_(["open", "partial"]),
+    sqlite_where=PurchaseOrder.status.in_(["open", "partial"]),
+)
+Index(
+    "idx_po_open_status",
+    PurchaseOrder.po_id,
+    postgresql_where=PurchaseOrder.status.in_(["open", "partial"]),
+    sqlite_where=PurchaseOrder.status.in_(["open", "partial"]),
+)
+
+
 class POLine(Base, TimestampMixin):
     __tablename__ = "po_line"
 
@@ -208,6 +224,14 @@ class POLine(Base, TimestampMixin):
     item: Mapped[Item] = relationship()
 
 
+Index(
+    "idx_po_line_open_remaining",
+    POLine.po_id,
+    postgresql_where=POLine.qty_ordered - func.coalesce(POLine.qty_received, 0) > 0,
+    sqlite_where=POLine.qty_ordered - func.coalesce(POLine.qty_received, 0) > 0,
+)
+
+
 class Receiving(Base, TimestampMixin):
     __tablename__ = "receiving"
 
@@ -222,6 +246,18 @@ class Receiving(Base, TimestampMixin):
     lines: Mapped[list["ReceivingLine"]] = relationship(back_populates="receiving", cascade="all, delete-orphan")
 
 
+Index(
+    "idx_receiving_received_at",
+    Receiving.received_at.desc(),
+    postgresql_include=["received_by", "receipt_id"],
+)
+Index(
+    "idx_receiving_created",
+    Receiving.created_at.desc(),
+    postgresql_include=["received_by"],
+)
+
+
 class ReceivingLine(Base, TimestampMixin):
     __tablename__ = "receiving_line"
 
@@ -248,6 +284,12 @@ class Customer(Base, TimestampMixin):
 
 class Sale(Base, TimestampMixin):
     __tablename__ = "sale"
+    __table_args__ = (
+        # GIN indexes need JSONB, so the index only exists on PostgreSQL.
+        Index("idx_sale_ocr_payload", "ocr_payload", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     sale_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     customer_id: Mapped[Optional[int]] = mapped_column(ForeignKey("customer.customer_id"))
@@ -261,7 +303,7 @@ class Sale(Base, TimestampMixin):
     source: Mapped[Optional[str]]
     external_ref: Mapped[Optional[str]] = mapped_column(String(100))
     ocr_confidence: Mapped[Optional[float]] = mapped_column(Numeric(5, 4))
-    ocr_payload: Mapped[Optional[dict]] = mapped_column(JSON)
+    ocr_payload: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB(), "postgresql"))
     delivery_requested: Mapped[bool] = mapped_column(Boolean, default=False)
     delivery_status: Mapped[Optional[str]] = mapped_column(delivery_status_enum)
     payment_method: Mapped[Optional[str]] = mapped_column(String(50))
@@ -272,6 +314,34 @@ class Sale(Base, TimestampMixin):
     lines: Mapped[list["SaleLine"]] = relationship(back_populates="sale", cascade="all, delete-orphan")
 
 
+Index(
+    "idx_sale_open_sale_date",
+    Sale.sale_date.desc(),
+    postgresql_where=Sale.status == "open",
+    sqlite_where=Sale.status == "open",
+)
+Index(
+    "idx_sale_open_created",
+    Sale.created_at.desc(),
+    postgresql_where=Sale.status == "open",
+    sqlite_where=Sale.status == "open",
+)
+# Locates every draft sale for the listing; idx_sale_draft_ocr_created only holds OCR drafts.
+Index(
+    "idx_sale_draft",
+    Sale.sale_id,
+    postgresql_where=Sale.status == "draft",
+    postgresql_include=["ocr_confidence", "total"],
+    sqlite_where=Sale.status == "draft",
+)
+Index(
+    "idx_sale_draft_ocr_created",
+    Sale.created_at.desc(),
+    postgresql_where=(Sale.status == "draft") & (Sale.source == "ocr_ticket"),
+    sqlite_where=(Sale.status == "draft") & (Sale.source == "ocr_ticket"),
+)
+
+
 class SaleLine(Base, TimestampMixin):
     __tablename__ = "sale_line"
 
@@ -0,0 +1,20 @@
+"""Response classes shared by API routes."""
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticResponse(JSONResponse):
+    """JSON response serialized by pydantic-core.
+
+    Routes that already build schema instances can return them wrapped in this
+    response to skip FastAPI's ``jsonable_encoder`` walk and ``json.dumps``.
+    Models, lists of models, decimals and datetimes are all handled natively.
+    Field aliases are used, matching FastAPI's ``response_model`` serialization.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, by_alias=True)
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from datetime import datetime, timedelta, timezone
+from itertools import chain
 
 from fastapi import APIRouter, Depends
 from psycopg.errors import UndefinedTable
-from sqlalchemy import func, select
-from sqlalchemy.exc import ProgrammingError
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session, selectinload
-
-from ..db import get_session
-from ..models.domain import PurchaseOrder, Receiving, Sale
+from sqlalchemy import String, cast, func, literal, select, text
+from sqlalchemy.exc import CompileError, ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import defer, selectinload
+
+from ..db import get_session, get_session_factory
+from ..models.domain import Customer, PurchaseOrder, Receiving, Sale
+from ..responses import PydanticResponse
 from ..schemas.dashboard import (
     DashboardActivity,
     DashboardDrilldownItem,
@@ -23,68 +26,101 @@ from ..schemas.dashboard import (
     DashboardSystemStatus,
 )
 from ..utils.datetime import utc_now
+from ..utils.schema import forget_table, table_exists
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Below this many rows an exact ``COUNT(*)`` is cheap enough to always run.
+ESTIMATE_MIN_ROWS = 1000
+
 
 def _is_missing_table_error(exc: ProgrammingError) -> bool:
     """Return True when the underlying DBAPI error indicates a missing table."""
 
-    orig = getattr(exc, "orig", None)
-    if isinstance(orig, UndefinedTable):
-        return True
-    message = str(orig or exc).lower()
-    return "does not exist" in message or "undefined table" in message
+    return isinstance(getattr(exc, "orig", None), UndefinedTable)
 
 
 async def _safe_scalar(
-    session: AsyncSession, statement, default: int | float = 0
+    session: AsyncSession, statement, default: int | float = 0, *, table: str
 ) -> int | float:
     """Execute a scalar statement and swallow missing-table errors."""
 
+    if not await table_exists(table):
+        return default
     try:
         result = await session.scalar(statement)
     except ProgrammingError as exc:
         if _is_missing_table_error(exc):
+            forget_table(table)
             await session.rollback()
             return default
         raise
-    return result or default
+    return default if result is None else result
 
 
-async def _safe_scalars(session: AsyncSession, statement) -> list:
+async def _safe_scalars(session: AsyncSession, statement, *, table: str) -> list:
     """Execute a statement returning ORM rows and swallow missing-table errors."""
 
+    if not await table_exists(table):
+        return []
     try:
         result = await session.execute(statement)
     except ProgrammingError as exc:
         if _is_missing_table_error(exc):
+            forget_table(table)
             await session.rollback()
             return []
         raise
     return result.scalars().all()
 
 
-async def _safe_all(session: AsyncSession, statement) -> list:
+async def _safe_all(session: AsyncSession, statement, *, table: str) -> list:
     """Execute a statement returning raw rows and swallow missing-table errors."""
 
+    if not await table_exists(table):
+        return []
     try:
         result = await session.execute(statement)
     except ProgrammingError as exc:
         if _is_missing_table_error(exc):
+            forget_table(table)
             await session.rollback()
             return []
         raise
     return result.all()
 
 
-def _humanize_delta(now: datetime, past: datetime) -> str:
-    if past.tzinfo is None:
-        past = past.replace(tzinfo=timezone.utc)
-    if now.tzinfo is None:
-        now = now.replace(tzinfo=timezone.utc)
-    delta = now - past
-    seconds = int(delta.total_seconds())
+async def _estimate_count(session: AsyncSession, statement, *, table: str) -> tuple[int, bool]:
+    """Return ``(count, approximate)`` for the rows matched by ``statement``.
+
+    On PostgreSQL the planner's row estimate from ``EXPLAIN`` is used when it
+    exceeds :data:`ESTIMATE_MIN_ROWS`, rounded to the nearest 10. Smaller tables
+    and other databases fall back to an exact ``COUNT(*)``.
+    """
+
+    if not await table_exists(table):
+        return 0, False
+
+    dialect = session.get_bind().dialect
+    if dialect.name == "postgresql":
+        try:
+            compiled = statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        except CompileError:
+            compiled = None
+        if compiled is not None:
+            plan = await _safe_scalar(
+                session, text(f"EXPLAIN (FORMAT JSON) {compiled}"), default=None, table=table
+            )
+            if plan:
+                estimate = int(plan[0]["Plan"]["Plan Rows"])
+                if estimate >= ESTIMATE_MIN_ROWS:
+                    return round(estimate, -1), True
+
+    count_stmt = statement.with_only_columns(func.count(), maintain_column_froms=True)
+    return int(await _safe_scalar(session, count_stmt, default=0, table=table)), False
+
+
+def _humanize_seconds(seconds: int) -> str:
     if seconds < 60:
         return "Just now"
     minutes = seconds // 60
@@ -97,6 +133,27 @@ def _humanize_delta(now: datetime, past: datetime) -> str:
     return f"{days} day{'s' if days != 1 else ''} ago"
 
 
+def _humanize_delta(now: datetime, past: datetime) -> str:
+    if past.tzinfo is None:
+        past = past.replace(tzinfo=timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return _humanize_seconds(int((now - past).total_seconds()))
+
+
+# Drilldown rows share a handful of string shapes; binding ``str.format`` once
+# avoids re-parsing f-strings per row. Decimal totals format directly without a
+# float round-trip.
+_format_customer_total = "{} • ${:,.2f}".format
+_format_sale_meta = "Created {} by {}".format
+_format_captured = "Captured {}".format
+_format_captured_with_confidence = "Captured {} • Confidence {:.0%}".format
+_format_po_subtitle = "{} • {} receipt(s)".format
+_format_po_meta = "{} • Created by {}".format
+_format_receiver_subtitle = "{} receipt(s) this shift".format
+_format_last_scan = "Last scan {}".format
+
+
 BADGE_STYLES = {
     "sky": "border border-sky-400/30 bg-sky-400/10 text-sky-200",
     "emerald": "border border-emerald-400/30 bg-emerald-400/10 text-emerald-200",
@@ -154,39 +211,43 @@ def _format_eta(now: datetime, target: datetime | None) -> str:
         return f"Due in {delta_days} days"
     return f"Arrived {_humanize_delta(now, target)}"
 
-async def _table_exists(session: AsyncSession, table_name: str) -> bool:
-    """Return True if the requested table exists in the bound database."""
 
-    def _has_table(sync_session: Session) -> bool:
-        inspector = inspect(sync_session.get_bind())
-        return inspector.has_table(table_name)
+async def _run_isolated(session_factory: async_sessionmaker[AsyncSession], query, *args, **kwargs):
+    """Run ``query`` in a dedicated session so it can be gathered with other queries."""
+
+    async with session_factory() as session:
+        return await query(session, *args, **kwargs)
 
-    return await session.run_sync(_has_table)
 
+async def _sequential_scalars(session: AsyncSession, *statements) -> list[int | float]:
+    """Run ``(statement, table)`` scalar queries one after another on ``session``."""
 
-@router.get("/summary", response_model=DashboardSummaryResponse)
+    return [
+        await _safe_scalar(session, statement, default=0, table=table)
+        for statement, table in statements
+    ]
+
+
+@router.get(
+    "/summary", response_model=DashboardSummaryResponse, response_class=PydanticResponse
+)
 async def get_dashboard_summary(
     session: AsyncSession = Depends(get_session),
-) -> DashboardSummaryResponse:
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> PydanticResponse:
     now = utc_now()
     last_24h = now - timedelta(hours=24)
     worker_window = now - timedelta(hours=4)
 
-    open_sales_stmt = select(func.count()).select_from(Sale).where(Sale.status == "open")
-    open_sales = await _safe_scalar(session, open_sales_stmt, default=0)
+    open_sales_stmt = select(Sale.sale_id).where(Sale.status == "open")
     open_sales_today_stmt = (
         select(func.count())
         .select_from(Sale)
         .where(Sale.status == "open", Sale.created_at >= last_24h)
     )
-    open_sales_today = await _safe_scalar(session, open_sales_today_stmt, default=0)
-
-    draft_ocr_stmt = (
-        select(func.count())
-        .select_from(Sale)
-        .where(Sale.status == "draft", Sale.source == "ocr_ticket")
+    draft_ocr_stmt = select(Sale.sale_id).where(
+        Sale.status == "draft", Sale.source == "ocr_ticket"
     )
-    draft_ocr = await _safe_scalar(session, draft_ocr_stmt, default=0)
     draft_ocr_new_stmt = (
         select(func.count())
         .select_from(Sale)
@@ -196,27 +257,40 @@ async def get_dashboard_summary(
             Sale.created_at >= last_24h,
         )
     )
-    draft_ocr_new = await _safe_scalar(session, draft_ocr_new_stmt, default=0)
-
-    inbound_stmt = (
-        select(func.count())
-        .select_from(PurchaseOrder)
-        .where(PurchaseOrder.status.in_(["open", "partial"]))
+    inbound_stmt = select(PurchaseOrder.po_id).where(
+        PurchaseOrder.status.in_(["open", "partial"])
     )
-    inbound = await _safe_scalar(session, inbound_stmt, default=0)
     recent_receivings_stmt = (
         select(func.count())
         .select_from(Receiving)
         .where(Receiving.created_at >= last_24h)
     )
-    recent_receivings = await _safe_scalar(session, recent_receivings_stmt, default=0)
-
     worker_activity_stmt = (
         select(func.count(func.distinct(Receiving.received_by)))
         .select_from(Receiving)
         .where(Receiving.created_at >= worker_window)
     )
-    active_workers = await _safe_scalar(session, worker_activity_stmt, default=0)
+
+    # Only the three headline estimates, which may scan whole tables, get their own
+    # pooled connections; the cheap 24h counts run in turn on the request session
+    # alongside them, so one dashboard load holds at most four connections.
+    (
+        (open_sales, open_sales_approximate),
+        (draft_ocr, draft_ocr_approximate),
+        (inbound, inbound_approximate),
+        (open_sales_today, draft_ocr_new, recent_receivings, active_workers),
+    ) = await asyncio.gather(
+        _run_isolated(session_factory, _estimate_count, open_sales_stmt, table="sale"),
+        _run_isolated(session_factory, _estimate_count, draft_ocr_stmt, table="sale"),
+        _run_isolated(session_factory, _estimate_count, inbound_stmt, table="po"),
+        _sequential_scalars(
+            session,
+            (open_sales_today_stmt, "sale"),
+            (draft_ocr_new_stmt, "sale"),
+            (recent_receivings_stmt, "receiving"),
+            (worker_activity_stmt, "receiving"),
+        ),
+    )
 
     metrics = [
         DashboardMetric(
@@ -224,18 +298,21 @@ async def get_dashboard_summary(
             value=open_sales,
             change=f"{open_sales_today} created in last 24h",
             status="awaiting fulfillment",
+            approximate=open_sales_approximate,
         ),
         DashboardMetric(
             label="Draft OCR Tickets",
             value=draft_ocr,
             change=f"{draft_ocr_new} new in last 24h",
             status="needs review",
+            approximate=draft_ocr_approximate,
         ),
         DashboardMetric(
             label="Inbound Purchase Orders",
             value=inbound,
             change=f"{recent_receivings} receipts logged in last 24h",
             status="receiving queue",
+            approximate=inbound_approximate,
         ),
         DashboardMetric(
             label="Active Receivers",
@@ -247,7 +324,7 @@ async def get_dashboard_summary(
 
     activities: list[tuple[datetime, DashboardActivity]] = []
     recent_sales = await _safe_scalars(
-        session, select(Sale).order_by(Sale.created_at.desc()).limit(2)
+        session, select(Sale).order_by(Sale.created_at.desc()).limit(2), table="sale"
     )
     for sale in recent_sales:
         activities.append(
@@ -255,7 +332,7 @@ async def get_dashboard_summary(
                 sale.created_at,
                 DashboardActivity(
                     title=f"Sale #{sale.sale_id} {sale.status}",
-                    description=f"Total ${float(sale.total or 0):,.2f}",
+                    description=f"Total ${sale.total or 0:,.2f}",
                     time=_humanize_delta(now, sale.created_at),
                     href=f"/dashboard/sales/{sale.sale_id}",
                 ),
@@ -263,7 +340,9 @@ async def get_dashboard_summary(
         )
 
     recent_receiving_rows = await _safe_scalars(
-        session, select(Receiving).order_by(Receiving.created_at.desc()).limit(2)
+        session,
+        select(Receiving).order_by(Receiving.created_at.desc()).limit(2),
+        table="receiving",
     )
     for receiving in recent_receiving_rows:
         activities.append(
@@ -278,7 +357,9 @@ async def get_dashboard_summary(
         )
 
     recent_pos = await _safe_scalars(
-        session, select(PurchaseOrder).order_by(PurchaseOrder.created_at.desc()).limit(2)
+        session,
+        select(PurchaseOrder).order_by(PurchaseOrder.created_at.desc()).limit(2),
+        table="po",
     )
     for po in recent_pos:
         activities.append(
@@ -320,70 +401,84 @@ async def get_dashboard_summary(
         ),
     ]
 
-    open_sales_rows = await _safe_scalars(
+    sale_number = literal("#") + cast(Sale.sale_id, String)
+    display_ref = func.coalesce(func.nullif(Sale.external_ref, ""), sale_number)
+    ticket_reference = func.coalesce(
+        func.nullif(Sale.external_ref, ""),
+        func.nullif(Sale.ocr_payload["ticket_id"].as_string(), ""),
+        sale_number,
+    )
+
+    open_sales_rows = await _safe_all(
         session,
-        select(Sale)
-        .options(selectinload(Sale.customer))
+        select(Sale, display_ref.label("reference"))
+        .options(defer(Sale.ocr_payload))
         .where(Sale.status == "open")
         .order_by(Sale.sale_date.desc())
         .limit(10),
+        table="sale",
     )
+    draft_ticket_rows = await _safe_all(
+        session,
+        select(Sale, ticket_reference.label("reference"))
+        .options(defer(Sale.ocr_payload))
+        .where(Sale.status == "draft", Sale.source == "ocr_ticket")
+        .order_by(Sale.created_at.desc())
+        .limit(10),
+        table="sale",
+    )
+    customer_ids = {
+        sale.customer_id
+        for sale, _ in chain(open_sales_rows, draft_ticket_rows)
+        if sale.customer_id is not None
+    }
+    customer_names: dict[int, str] = {}
+    if customer_ids:
+        customer_rows = await _safe_all(
+            session,
+            select(Customer.customer_id, Customer.name).where(
+                Customer.customer_id.in_(customer_ids)
+            ),
+            table="customer",
+        )
+        customer_names = {customer_id: name for customer_id, name in customer_rows}
+
     open_sales_items: list[DashboardDrilldownItem] = []
-    for sale in open_sales_rows:
-        display_ref = sale.external_ref or f"#{sale.sale_id}"
-        customer_name = sale.customer.name if sale.customer else "Walk-in customer"
-        total_value = f"${float(sale.total or 0):,.2f}"
-        subtitle = f"{customer_name} • {total_value}"
+    for sale, reference in open_sales_rows:
+        customer_name = customer_names.get(sale.customer_id, "Walk-in customer")
         created_reference = sale.created_at or sale.sale_date
         created_label = (
             _humanize_delta(now, created_reference) if created_reference else "Unknown time"
         )
-        created_by = sale.created_by or "Unassigned"
-        meta = f"Created {created_label} by {created_by}"
         badge_label, badge_color = _sale_badge(sale.status or "open")
         open_sales_items.append(
             DashboardDrilldownItem(
-                id=_slugify("sale", display_ref),
-                title=f"Sale {display_ref}",
-                subtitle=subtitle,
-                meta=meta,
+                id=_slugify("sale", reference),
+                title=f"Sale {reference}",
+                subtitle=_format_customer_total(customer_name, sale.total or 0),
+                meta=_format_sale_meta(created_label, sale.created_by or "Unassigned"),
                 badge_label=badge_label,
                 badge_class=_badge_style(badge_color),
                 href=f"/dashboard/sales/{sale.sale_id}",
             )
         )
 
-    draft_ticket_rows = await _safe_scalars(
-        session,
-        select(Sale)
-        .options(selectinload(Sale.customer))
-        .where(Sale.status == "draft", Sale.source == "ocr_ticket")
-        .order_by(Sale.created_at.desc())
-        .limit(10),
-    )
     draft_ticket_items: list[DashboardDrilldownItem] = []
-    for ticket in draft_ticket_rows:
-        reference = (
-            ticket.external_ref
-            or (ticket.ocr_payload or {}).get("ticket_id")
-            or f"#{ticket.sale_id}"
-        )
-        customer_name = ticket.customer.name if ticket.customer else "Walk-in customer"
-        total_value = f"${float(ticket.total or 0):,.2f}"
-        subtitle = f"{customer_name} • {total_value}"
+    for ticket, reference in draft_ticket_rows:
+        customer_name = customer_names.get(ticket.customer_id, "Walk-in customer")
         created_reference = ticket.created_at or ticket.sale_date
         captured_label = (
             _humanize_delta(now, created_reference) if created_reference else "Unknown time"
         )
-        meta_parts = [f"Captured {captured_label}"]
-        if ticket.ocr_confidence is not None:
-            meta_parts.append(f"Confidence {float(ticket.ocr_confidence):.0%}")
-        meta = " • ".join(meta_parts)
+        if ticket.ocr_confidence is None:
+            meta = _format_captured(captured_label)
+        else:
+            meta = _format_captured_with_confidence(captured_label, ticket.ocr_confidence)
         draft_ticket_items.append(
             DashboardDrilldownItem(
                 id=_slugify("ticket", reference),
                 title=f"Ticket {reference}",
-                subtitle=subtitle,
+                subtitle=_format_customer_total(customer_name, ticket.total or 0),
                 meta=meta,
                 badge_label="Needs review",
                 badge_class=_badge_style("amber"),
@@ -400,14 +495,14 @@ async def get_dashboard_summary(
         .where(PurchaseOrder.status.in_(["open", "partial"]))
         .order_by(PurchaseOrder.created_at.desc())
         .limit(10),
+        table="po",
     )
     inbound_po_items: list[DashboardDrilldownItem] = []
     for po in inbound_po_rows:
         reference = po.external_ref or f"#{po.po_id}"
         vendor_name = po.vendor.name if po.vendor else "Unknown vendor"
-        receipts_count = len(po.receivings)
-        subtitle = f"{vendor_name} • {receipts_count} receipt(s)"
-        meta = f"{_format_eta(now, po.expected_date)} • Created by {po.created_by or 'Unknown'}"
+        subtitle = _format_po_subtitle(vendor_name, len(po.receivings))
+        meta = _format_po_meta(_format_eta(now, po.expected_date), po.created_by or "Unknown")
         badge_label, badge_color = _po_badge(po.status or "open")
         inbound_po_items.append(
             DashboardDrilldownItem(
@@ -430,13 +525,14 @@ async def get_dashboard_summary(
         .where(Receiving.received_at >= worker_window)
         .group_by(Receiving.received_by)
         .order_by(func.max(Receiving.received_at).desc()),
+        table="receiving",
     )
     active_receivers_items: list[DashboardDrilldownItem] = []
     for received_by, count, last_received_at in receiver_activity:
         name = received_by or "Unassigned"
-        subtitle = f"{int(count)} receipt(s) this shift"
+        subtitle = _format_receiver_subtitle(int(count))
         meta = (
-            f"Last scan {_humanize_delta(now, last_received_at)}"
+            _format_last_scan(_humanize_delta(now, last_received_at))
             if last_received_at
             else "No recent scans"
         )
@@ -452,15 +548,20 @@ async def get_dashboard_summary(
         )
 
     drilldowns = DashboardDrilldowns(
-        open_sales=open_sales_items,
-        draft_ocr_tickets=draft_ticket_items,
-        inbound_purchase_orders=inbound_po_items,
-        active_receivers=active_receivers_items,
+        {
+            "openSales": open_sales_items,
+            "draftOcrTickets": draft_ticket_items,
+            "inboundPurchaseOrders": inbound_po_items,
+            "activeReceivers": active_receivers_items,
+        }
     )
 
-    return DashboardSummaryResponse(
-        metrics=metrics,
-        activity=activity_payload,
-        system_status=system_status,
-        drilldowns=drilldowns,
+    # Every part was built above from typed rows, so the envelope skips re-validation.
+    return PydanticResponse(
+        DashboardSummaryResponse.model_construct(
+            metrics=metrics,
+            activity=activity_payload,
+            system_status=system_status,
+            drilldowns=drilldowns,
+        )
     )
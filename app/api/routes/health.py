@@ -1,7 +1,9 @@
 """Health endpoints."""
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import hashlib
+
+from fastapi import APIRouter, Depends, Request, Response
 from redis.exceptions import RedisError
 from sqlalchemy import func, select, text
 from sqlalchemy.exc import SQLAlchemyError
@@ -10,18 +12,27 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..db import engine, get_session
 from ..models import domain
 from ..models.base import Base
-from ..schemas.common import HealthResponse
+from ..schemas.common import HealthDetail, HealthResponse
 from ..services.redis import get_redis_client
 
 router = APIRouter(tags=["health"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True when an ``If-None-Match`` header lists ``etag``."""
+
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 @router.get("/health", response_model=HealthResponse)
-async def health(session: AsyncSession = Depends(get_session)) -> HealthResponse:
+async def health(request: Request, session: AsyncSession = Depends(get_session)) -> Response:
     fastapi_ok = True
     db_ok = True
     sample_ok = True
-    detail: dict[str, object] = {}
+    detail: HealthDetail = {}
 
     try:
         await session.execute(text("SELECT 1"))
@@ -69,10 +80,17 @@ async def health(session: AsyncSession = Depends(get_session)) -> HealthResponse
 
     ok = fastapi_ok and db_ok and sample_ok
 
-    return HealthResponse(
+    body = HealthResponse(
         ok=ok,
         fastapi=fastapi_ok,
         database=db_ok,
         redis=redis_status,
         detail=detail,
-    )
+    ).model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    # Probes that already hold the current status skip the body entirely.
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
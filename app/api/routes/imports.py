@@ -5,13 +5,27 @@ from fastapi import APIRouter, Depends, File, Query, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
+from ..responses import PydanticResponse
 from ..schemas.imports import SpreadsheetImportResponse
 from ..services.importer import NO_IMPORTABLE_ROWS_WARNING, import_spreadsheet
 
 router = APIRouter(prefix="/imports", tags=["imports"])
 
+_COUNTER_MESSAGES: tuple[tuple[str, str], ...] = (
+    ("vendors", "Imported {} vendor(s)"),
+    ("items", "Imported {} item(s)"),
+    ("inventory_records", "Updated {} inventory record(s)"),
+    ("customers", "Loaded {} customer(s)"),
+    ("sales", "Processed {} sale(s)"),
+    ("purchase_orders", "Processed {} purchase order(s)"),
+)
 
-@router.post("/spreadsheet", response_model=SpreadsheetImportResponse)
+
+@router.post(
+    "/spreadsheet",
+    response_model=SpreadsheetImportResponse,
+    response_class=PydanticResponse,
+)
 async def upload_spreadsheet(
     file: UploadFile = File(...),
     dataset: str | None = Query(default=None, description="Dataset to import"),
@@ -21,7 +35,7 @@ async def upload_spreadsheet(
         description="Clear existing inventory quantities before importing products",
     ),
     session: AsyncSession = Depends(get_session),
-) -> SpreadsheetImportResponse:
+) -> PydanticResponse:
     data = await file.read()
     result = await import_spreadsheet(
         session,
@@ -33,21 +47,11 @@ async def upload_spreadsheet(
     counters = result.counters
     warnings = counters.warnings
 
-    message_parts: list[str] = []
-    if counters.vendors:
-        message_parts.append(f"Imported {counters.vendors} vendor(s)")
-    if counters.items:
-        message_parts.append(f"Imported {counters.items} item(s)")
-    if counters.inventory_records:
-        message_parts.append(f"Updated {counters.inventory_records} inventory record(s)")
-    if counters.customers:
-        message_parts.append(f"Loaded {counters.customers} customer(s)")
-    if counters.sales:
-        message_parts.append(f"Processed {counters.sales} sale(s)")
-    if counters.purchase_orders:
-        message_parts.append(
-            f"Processed {counters.purchase_orders} purchase order(s)"
-        )
+    message_parts = [
+        template.format(count)
+        for attribute, template in _COUNTER_MESSAGES
+        if (count := getattr(counters, attribute))
+    ]
     if result.cleared_inventory and not result.cleared_sample_data:
         message_parts.append("Cleared previous inventory records")
     if not message_parts:
@@ -63,7 +67,7 @@ async def upload_spreadsheet(
     if warnings:
         detail = "\n".join(warnings)
 
-    return SpreadsheetImportResponse(
+    response = SpreadsheetImportResponse(
         message=", ".join(message_parts),
         importedAt=result.imported_at,
         clearedSampleData=result.cleared_sample_data,
@@ -82,4 +86,5 @@ async def upload_spreadsheet(
         },
         detail=detail,
     )
+    return PydanticResponse(response)
 
@@ -2,15 +2,16 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from datetime import datetime
 from decimal import Decimal
 from typing import Sequence
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from psycopg.errors import UndefinedTable
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
 from ..db import get_session
 from ..models.domain import (
@@ -20,6 +21,7 @@ from ..models.domain import (
     POLine,
     PurchaseOrder,
 )
+from ..responses import PydanticResponse
 from ..schemas.incoming_trucks import (
     IncomingTruckAggregatedUpdates,
     IncomingTruckCreate,
@@ -59,20 +61,14 @@ async def _execute_incoming_truck_query(
         raise
 
 
-def _to_decimal(value: float | None) -> Decimal | None:
-    if value is None:
-        return None
-    return Decimal(str(value))
-
-
-def _to_float(value: Decimal | float | None) -> float | None:
-    if value is None:
-        return None
-    return float(value)
+def _to_float(value: Decimal | None) -> float | None:
+    return None if value is None else float(value)
 
 
+# The serializers below read rows whose columns already match the response
+# schemas, so they use ``model_construct`` and skip pydantic validation.
 def _serialize_line(line: IncomingTruckLine) -> IncomingTruckLineRead:
-    return IncomingTruckLineRead(
+    return IncomingTruckLineRead.model_construct(
         truck_line_id=line.truck_line_id,
         po_line_id=line.po_line_id,
         item_id=line.item_id,
@@ -81,9 +77,11 @@ def _serialize_line(line: IncomingTruckLine) -> IncomingTruckLineRead:
     )
 
 
-def _serialize_update(update: IncomingTruckUpdate) -> IncomingTruckUpdateRead:
-    created_at = update.created_at or utc_now()
-    return IncomingTruckUpdateRead(
+def _serialize_update(
+    update: IncomingTruckUpdate, fallback_created_at: datetime | None = None
+) -> IncomingTruckUpdateRead:
+    created_at = update.created_at or fallback_created_at or utc_now()
+    return IncomingTruckUpdateRead.model_construct(
         update_id=update.update_id,
         truck_id=update.truck_id,
         update_type=update.update_type,
@@ -97,49 +95,50 @@ def _serialize_update(update: IncomingTruckUpdate) -> IncomingTruckUpdateRead:
     )
 
 
-def _aggregate_updates(updates: Sequence[IncomingTruckUpdate]) -> list[IncomingTruckLineProgress]:
-    line_totals: dict[int, IncomingTruckLineProgress] = {}
-    for update in updates:
-        if update.update_type != "line_progress" or update.po_line_id is None:
-            continue
-        quantity = _to_float(update.quantity) or 0.0
-        existing = line_totals.get(update.po_line_id)
-        if existing:
-            existing.total_quantity += quantity
-        else:
-            line_totals[update.po_line_id] = IncomingTruckLineProgress(
-                po_line_id=update.po_line_id,
-                item_id=update.item_id,
-                total_quantity=quantity,
-            )
-    return sorted(line_totals.values(), key=lambda entry: entry.po_line_id)
-
-
 def _build_truck_response(
     truck: IncomingTruck,
     lines: Sequence[IncomingTruckLine],
     updates: Sequence[IncomingTruckUpdate],
 ) -> IncomingTruckResponse:
-    sorted_updates = sorted(updates, key=lambda update: update.created_at or utc_now())
-    history = [_serialize_update(update) for update in sorted_updates]
+    history: list[IncomingTruckUpdateRead] = []
+    line_totals: dict[int, IncomingTruckLineProgress] = {}
     latest_status = None
     note_count = 0
-    for update in sorted_updates:
-        if update.update_type == "status" and update.status:
+    fallback = utc_now()
+    for update in sorted(updates, key=lambda update: update.created_at or fallback):
+        history.append(_serialize_update(update, fallback))
+        update_type = update.update_type
+        if update_type == "status" and update.status:
             latest_status = update.status
-        elif update.update_type == "note":
+        elif update_type == "note":
             note_count += 1
-
-    line_progress = _aggregate_updates(sorted_updates)
+        elif update_type == "line_progress" and update.po_line_id is not None:
+            quantity = float(update.quantity or 0)
+            existing = line_totals.get(update.po_line_id)
+            if existing:
+                existing.total_quantity += quantity
+            else:
+                line_totals[update.po_line_id] = IncomingTruckLineProgress(
+                    po_line_id=update.po_line_id,
+                    item_id=update.item_id,
+                    total_quantity=quantity,
+                )
 
     aggregated = IncomingTruckAggregatedUpdates(
         latest_status=latest_status,
         note_count=note_count,
-        line_progress=line_progress,
+        line_progress=[line_totals[po_line_id] for po_line_id in sorted(line_totals)],
         history=history,
     )
+    return _truck_response(truck, lines, aggregated)
 
-    return IncomingTruckResponse(
+
+def _truck_response(
+    truck: IncomingTruck,
+    lines: Sequence[IncomingTruckLine],
+    aggregated: IncomingTruckAggregatedUpdates,
+) -> IncomingTruckResponse:
+    return IncomingTruckResponse.model_construct(
         truck_id=truck.truck_id,
         po_id=truck.po_id,
         reference=truck.reference,
@@ -153,59 +152,131 @@ def _build_truck_response(
     )
 
 
-@router.get("", response_model=list[IncomingTruckResponse])
+async def _aggregate_updates_sql(
+    session: AsyncSession, truck_ids: Sequence[int]
+) -> dict[int, IncomingTruckAggregatedUpdates]:
+    """Compute per-truck update aggregates in SQL without loading the history."""
+
+    aggregates = {truck_id: IncomingTruckAggregatedUpdates() for truck_id in truck_ids}
+    if not truck_ids:
+        return aggregates
+
+    progress_rows = await _execute_incoming_truck_query(
+        session,
+        select(
+            IncomingTruckUpdate.truck_id,
+            IncomingTruckUpdate.po_line_id,
+            func.max(IncomingTruckUpdate.item_id).label("item_id"),
+            func.coalesce(func.sum(IncomingTruckUpdate.quantity), 0).label("total_quantity"),
+        )
+        .where(
+            IncomingTruckUpdate.truck_id.in_(truck_ids),
+            IncomingTruckUpdate.update_type == "line_progress",
+            IncomingTruckUpdate.po_line_id.is_not(None),
+        )
+        .group_by(IncomingTruckUpdate.truck_id, IncomingTruckUpdate.po_line_id)
+        .order_by(IncomingTruckUpdate.truck_id, IncomingTruckUpdate.po_line_id),
+    )
+    if progress_rows is None:
+        return aggregates
+    for row in progress_rows:
+        aggregates[row.truck_id].line_progress.append(
+            IncomingTruckLineProgress(
+                po_line_id=row.po_line_id,
+                item_id=row.item_id,
+                total_quantity=float(row.total_quantity),
+            )
+        )
+
+    note_rows = await _execute_incoming_truck_query(
+        session,
+        select(IncomingTruckUpdate.truck_id, func.count())
+        .where(
+            IncomingTruckUpdate.truck_id.in_(truck_ids),
+            IncomingTruckUpdate.update_type == "note",
+        )
+        .group_by(IncomingTruckUpdate.truck_id),
+    )
+    if note_rows is not None:
+        for truck_id, note_count in note_rows:
+            aggregates[truck_id].note_count = note_count
+
+    ranked_statuses = (
+        select(
+            IncomingTruckUpdate.truck_id,
+            IncomingTruckUpdate.status,
+            func.row_number()
+            .over(
+                partition_by=IncomingTruckUpdate.truck_id,
+                order_by=(
+                    IncomingTruckUpdate.created_at.desc(),
+                    IncomingTruckUpdate.update_id.desc(),
+                ),
+            )
+            .label("position"),
+        )
+        .where(
+            IncomingTruckUpdate.truck_id.in_(truck_ids),
+            IncomingTruckUpdate.update_type == "status",
+            IncomingTruckUpdate.status.is_not(None),
+        )
+        .subquery()
+    )
+    status_rows = await _execute_incoming_truck_query(
+        session,
+        select(ranked_statuses.c.truck_id, ranked_statuses.c.status).where(
+            ranked_statuses.c.position == 1
+        ),
+    )
+    if status_rows is not None:
+        for truck_id, latest_status in status_rows:
+            aggregates[truck_id].latest_status = latest_status
+
+    return aggregates
+
+
+@router.get(
+    "", response_model=list[IncomingTruckResponse], response_class=PydanticResponse
+)
 async def list_incoming_trucks(
+    include_history: bool = True,
     session: AsyncSession = Depends(get_session),
-) -> list[IncomingTruckResponse]:
+) -> PydanticResponse:
+    options = [selectinload(IncomingTruck.lines)]
+    if include_history:
+        options.append(selectinload(IncomingTruck.updates))
     result = await _execute_incoming_truck_query(
-        session, select(IncomingTruck).order_by(IncomingTruck.created_at.desc())
+        session,
+        select(IncomingTruck)
+        .options(*options, raiseload("*"))
+        .order_by(IncomingTruck.created_at.desc()),
     )
     if result is None:
-        return []
+        return PydanticResponse([])
 
     trucks = result.scalars().all()
-    if not trucks:
-        return []
-
-    truck_ids = [truck.truck_id for truck in trucks]
-
-    lines_map: dict[int, list[IncomingTruckLine]] = defaultdict(list)
-    updates_map: dict[int, list[IncomingTruckUpdate]] = defaultdict(list)
-
-    if truck_ids:
-        line_rows = await _execute_incoming_truck_query(
-            session, select(IncomingTruckLine).where(IncomingTruckLine.truck_id.in_(truck_ids))
-        )
-        if line_rows is not None:
-            for line in line_rows.scalars():
-                lines_map[line.truck_id].append(line)
-
-        update_rows = await _execute_incoming_truck_query(
-            session,
-            select(IncomingTruckUpdate)
-            .where(IncomingTruckUpdate.truck_id.in_(truck_ids))
-            .order_by(IncomingTruckUpdate.created_at),
-        )
-        if update_rows is not None:
-            for update in update_rows.scalars():
-                updates_map[update.truck_id].append(update)
-
-    return [
-        _build_truck_response(
-            truck,
-            lines_map.get(truck.truck_id, []),
-            updates_map.get(truck.truck_id, []),
+    if include_history:
+        return PydanticResponse(
+            [_build_truck_response(truck, truck.lines, truck.updates) for truck in trucks]
         )
-        for truck in trucks
-    ]
+
+    aggregates = await _aggregate_updates_sql(session, [truck.truck_id for truck in trucks])
+    return PydanticResponse(
+        [_truck_response(truck, truck.lines, aggregates[truck.truck_id]) for truck in trucks]
+    )
 
 
-@router.post("", response_model=IncomingTruckResponse, status_code=status.HTTP_200_OK)
+@router.post(
+    "",
+    response_model=IncomingTruckResponse,
+    response_class=PydanticResponse,
+    status_code=status.HTTP_200_OK,
+)
 async def create_incoming_truck(
     payload: IncomingTruckCreate,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_roles("Purchasing", "Admin", "Driver")),
-) -> IncomingTruckResponse:
+) -> PydanticResponse:
     po = await session.get(PurchaseOrder, payload.po_id)
     if not po:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="po_not_found")
@@ -220,8 +291,15 @@ async def create_incoming_truck(
     session.add(truck)
     await session.flush()
 
+    po_line_ids = {line_payload.po_line_id for line_payload in payload.lines}
+    po_lines: dict[int, POLine] = {}
+    if po_line_ids:
+        rows = await session.scalars(select(POLine).where(POLine.po_line_id.in_(po_line_ids)))
+        po_lines = {po_line.po_line_id: po_line for po_line in rows}
+
+    lines: list[IncomingTruckLine] = []
     for line_payload in payload.lines:
-        po_line = await session.get(POLine, line_payload.po_line_id)
+        po_line = po_lines.get(line_payload.po_line_id)
         if not po_line or po_line.po_id != payload.po_id:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="po_line_mismatch")
         if line_payload.item_id != po_line.item_id:
@@ -232,27 +310,27 @@ async def create_incoming_truck(
             po_line_id=po_line.po_line_id,
             item_id=line_payload.item_id,
             description=line_payload.description or po_line.description,
-            qty_expected=_to_decimal(line_payload.qty_expected),
+            qty_expected=line_payload.qty_expected,
         )
         session.add(truck_line)
+        lines.append(truck_line)
 
     await session.flush()
 
-    lines = (
-        await session.execute(
-            select(IncomingTruckLine).where(IncomingTruckLine.truck_id == truck.truck_id)
-        )
-    ).scalars().all()
-    return _build_truck_response(truck, lines, [])
+    return PydanticResponse(_build_truck_response(truck, lines, []))
 
 
-@router.post("/{truck_id}/updates", response_model=IncomingTruckUpdateRead)
+@router.post(
+    "/{truck_id}/updates",
+    response_model=IncomingTruckUpdateRead,
+    response_class=PydanticResponse,
+)
 async def create_incoming_truck_update(
     truck_id: int,
     payload: IncomingTruckUpdateCreate,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_roles("Purchasing", "Admin", "Driver")),
-) -> IncomingTruckUpdateRead:
+) -> PydanticResponse:
     truck = await session.get(IncomingTruck, truck_id)
     if not truck:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="truck_not_found")
@@ -290,7 +368,7 @@ async def create_incoming_truck_update(
         status=payload.status,
         po_line_id=payload.po_line_id,
         item_id=item_id,
-        quantity=_to_decimal(payload.quantity),
+        quantity=payload.quantity,
         created_by=user.id,
     )
     session.add(update)
@@ -301,4 +379,4 @@ async def create_incoming_truck_update(
     await session.flush()
     await session.refresh(update)
 
-    return _serialize_update(update)
+    return PydanticResponse(_serialize_update(update))
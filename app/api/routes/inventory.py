@@ -4,7 +4,9 @@ from __future__ import annotations
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
@@ -15,43 +17,68 @@ from ..utils.datetime import utc_now
 router = APIRouter()
 
 
+def _dialect_insert(session: AsyncSession):
+    """Return the dialect-specific ``insert`` construct supporting ON CONFLICT."""
+
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
+
+
+async def _shift_inventory(
+    session: AsyncSession,
+    *,
+    item_id: int,
+    location_id: int,
+    qty_delta: Decimal,
+) -> tuple[int, Decimal, Decimal]:
+    """Add ``qty_delta`` to a stock row in one atomic upsert.
+
+    Returns the inventory id, the new on-hand quantity and the average cost.
+    """
+
+    stmt = _dialect_insert(session)(Inventory).values(
+        item_id=item_id,
+        location_id=location_id,
+        qty_on_hand=qty_delta,
+        qty_reserved=Decimal(0),
+        avg_cost=Decimal(0),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Inventory.item_id, Inventory.location_id],
+        set_={
+            "qty_on_hand": func.coalesce(Inventory.qty_on_hand, 0)
+            + stmt.excluded.qty_on_hand
+        },
+    ).returning(Inventory.inv_id, Inventory.qty_on_hand, Inventory.avg_cost)
+    row = (await session.execute(stmt)).one()
+    return row.inv_id, row.qty_on_hand, row.avg_cost
+
+
 async def _apply_inventory_adjustment(
     payload: InventoryAdjustRequest,
     session: AsyncSession,
     *,
     ref_type: str,
 ) -> dict:
-    inventory = await session.scalar(
-        select(Inventory).where(
-            Inventory.item_id == payload.item_id,
-            Inventory.location_id == payload.location_id,
-        )
+    inventory_id, new_qty, avg_cost = await _shift_inventory(
+        session,
+        item_id=payload.item_id,
+        location_id=payload.location_id,
+        qty_delta=payload.qty_delta,
     )
-    if not inventory:
-        inventory = Inventory(
+    await session.execute(
+        insert(InventoryTxn).values(
             item_id=payload.item_id,
             location_id=payload.location_id,
-            qty_on_hand=Decimal("0"),
-            qty_reserved=Decimal("0"),
-            avg_cost=Decimal("0"),
+            qty_delta=payload.qty_delta,
+            reason=payload.reason,
+            ref_type=ref_type,
+            unit_cost=avg_cost,
+            created_at=utc_now(),
         )
-        session.add(inventory)
-
-    current_qty = inventory.qty_on_hand if inventory.qty_on_hand is not None else Decimal("0")
-    qty_delta = Decimal(str(payload.qty_delta))
-    inventory.qty_on_hand = Decimal(current_qty) + qty_delta
-    txn = InventoryTxn(
-        item_id=payload.item_id,
-        location_id=payload.location_id,
-        qty_delta=payload.qty_delta,
-        reason=payload.reason,
-        ref_type=ref_type,
-        unit_cost=inventory.avg_cost,
-        created_at=utc_now(),
     )
-    session.add(txn)
-    await session.flush()
-    return {"inventory_id": inventory.inv_id, "new_qty": float(inventory.qty_on_hand)}
+    return {"inventory_id": inventory_id, "new_qty": float(new_qty)}
 
 
 @router.post("/adjust")
@@ -64,24 +91,40 @@ async def adjust_inventory(
 
 @router.post("/transfer")
 async def transfer_inventory(payload: InventoryTransferRequest, session: AsyncSession = Depends(get_session)) -> dict:
-    await _apply_inventory_adjustment(
-        InventoryAdjustRequest(
-            item_id=payload.item_id,
-            location_id=payload.from_location_id,
-            qty_delta=-payload.qty,
-            reason="transfer",
-        ),
+    _, _, from_cost = await _shift_inventory(
         session,
-        ref_type="transfer",
+        item_id=payload.item_id,
+        location_id=payload.from_location_id,
+        qty_delta=-payload.qty,
     )
-    result = await _apply_inventory_adjustment(
-        InventoryAdjustRequest(
-            item_id=payload.item_id,
-            location_id=payload.to_location_id,
-            qty_delta=payload.qty,
-            reason="transfer",
-        ),
+    inventory_id, new_qty, to_cost = await _shift_inventory(
         session,
-        ref_type="transfer",
+        item_id=payload.item_id,
+        location_id=payload.to_location_id,
+        qty_delta=payload.qty,
+    )
+    created_at = utc_now()
+    await session.execute(
+        insert(InventoryTxn),
+        [
+            {
+                "item_id": payload.item_id,
+                "location_id": payload.from_location_id,
+                "qty_delta": -payload.qty,
+                "reason": "transfer",
+                "ref_type": "transfer",
+                "unit_cost": from_cost,
+                "created_at": created_at,
+            },
+            {
+                "item_id": payload.item_id,
+                "location_id": payload.to_location_id,
+                "qty_delta": payload.qty,
+                "reason": "transfer",
+                "ref_type": "transfer",
+                "unit_cost": to_cost,
+                "created_at": created_at,
+            },
+        ],
     )
-    return result
+    return {"inventory_id": inventory_id, "new_qty": float(new_qty)}
@@ -2,21 +2,33 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import or_, select
+from pydantic import TypeAdapter
+from sqlalchemy import String, cast, func, literal_column, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
 from ..models.domain import Bill, Vendor
+from ..responses import PydanticResponse
 from ..schemas.invoices import InvoiceSummary
 
 router = APIRouter()
 
+_invoice_summaries_adapter = TypeAdapter(list[InvoiceSummary])
 
-@router.get("", response_model=list[InvoiceSummary])
+# Must match the expression behind idx_bill_search_fts so Postgres can use the
+# GIN index; see migration 0009.
+BILL_SEARCH_DOCUMENT = (
+    "to_tsvector('simple', coalesce(bill.invoice_no, '') || ' ' || "
+    "CASE bill.status WHEN 'draft' THEN 'draft' WHEN 'exported' THEN 'exported' "
+    "WHEN 'paid' THEN 'paid' ELSE '' END)"
+)
+
+
+@router.get("", response_model=list[InvoiceSummary], response_class=PydanticResponse)
 async def list_invoices(
     q: str | None = None,
     session: AsyncSession = Depends(get_session),
-) -> list[InvoiceSummary]:
+) -> PydanticResponse:
     stmt = (
         select(
             Bill.bill_id,
@@ -39,31 +51,37 @@ async def list_invoices(
     search = (q or "").strip()
     if search:
         pattern = f"%{search}%"
+        if session.get_bind().dialect.name == "postgresql":
+            document_match = literal_column(BILL_SEARCH_DOCUMENT).op("@@")(
+                func.plainto_tsquery("simple", search)
+            )
+        else:
+            document_match = cast(Bill.status, String).ilike(pattern)
         stmt = stmt.where(
             or_(
                 Vendor.name.ilike(pattern),
                 Bill.invoice_no.ilike(pattern),
-                Bill.status.ilike(pattern),
+                document_match,
             )
         )
 
     rows = (await session.execute(stmt)).all()
-    invoices: list[InvoiceSummary] = []
-    for row in rows:
-        invoices.append(
-            InvoiceSummary(
-                invoice_id=row.bill_id,
-                vendor_name=row.vendor_name,
-                po_id=row.po_id,
-                invoice_no=row.invoice_no,
-                bill_date=row.bill_date,
-                due_date=row.due_date,
-                subtotal=float(row.subtotal or 0),
-                tax=float(row.tax or 0),
-                freight=float(row.freight or 0),
-                total=float(row.total or 0),
-                status=row.status,
-            )
-        )
-
-    return invoices
+    invoices = _invoice_summaries_adapter.validate_python(
+        [
+            {
+                "invoice_id": row.bill_id,
+                "vendor_name": row.vendor_name,
+                "po_id": row.po_id,
+                "invoice_no": row.invoice_no,
+                "bill_date": row.bill_date,
+                "due_date": row.due_date,
+                "subtotal": row.subtotal or 0,
+                "tax": row.tax or 0,
+                "freight": row.freight or 0,
+                "total": row.total or 0,
+                "status": row.status,
+            }
+            for row in rows
+        ]
+    )
+    return PydanticResponse(invoices)
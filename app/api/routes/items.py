@@ -1,11 +1,17 @@
 """Item endpoints."""
 from __future__ import annotations
 
+import asyncio
+from typing import Callable, TypeVar
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import and_, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
+from sqlalchemy import and_, bindparam, func, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import raiseload
 
-from ..db import get_session
+from ..db import get_session, get_session_factory
 from ..models.domain import (
     Barcode,
     Inventory,
@@ -17,10 +23,10 @@ from ..models.domain import (
     SaleLine,
     Vendor,
 )
+from ..responses import PydanticResponse
 from ..schemas.common import ItemSummary
 from ..schemas.items import (
     CatalogItemSummary,
-    CatalogLocationInfo,
     IncomingPurchaseInfo,
     ItemDetailResponse,
     ItemLocationInfo,
@@ -28,17 +34,120 @@ from ..schemas.items import (
 
 router = APIRouter()
 
+T = TypeVar("T")
+
+# Listing endpoints validate their rows in one pydantic-core call per response
+# rather than constructing each model from Python.
+_catalog_items_adapter = TypeAdapter(list[CatalogItemSummary])
+_item_summaries_adapter = TypeAdapter(list[ItemSummary])
+
+# Statements for the per-request lookups are built once; handlers only bind
+# parameter values, so SQLAlchemy reuses the cached compilation.
+CATALOG_TOTALS_STMT = (
+    select(Inventory.item_id, func.coalesce(func.sum(Inventory.qty_on_hand), 0))
+    .where(Inventory.item_id.in_(bindparam("item_ids", expanding=True)))
+    .group_by(Inventory.item_id)
+)
+_ranked_locations = (
+    select(
+        Inventory.item_id,
+        Location.location_id,
+        Location.name,
+        func.coalesce(Inventory.qty_on_hand, 0).label("qty_on_hand"),
+        func.row_number()
+        .over(
+            partition_by=Inventory.item_id,
+            order_by=(func.coalesce(Inventory.qty_on_hand, 0).desc(), Inventory.inv_id),
+        )
+        .label("position"),
+    )
+    .join(Location, Inventory.location_id == Location.location_id)
+    .where(
+        Inventory.item_id.in_(bindparam("item_ids", expanding=True)),
+        Location.name != "",
+    )
+    .subquery()
+)
+CATALOG_TOP_LOCATION_STMT = select(
+    _ranked_locations.c.item_id,
+    _ranked_locations.c.location_id,
+    _ranked_locations.c.name,
+    _ranked_locations.c.qty_on_hand,
+).where(_ranked_locations.c.position == 1)
+ITEM_SEARCH_STMT = (
+    select(Item)
+    .options(raiseload("*"))
+    .where(
+        or_(
+            Item.sku.ilike(bindparam("pattern")),
+            Item.description.ilike(bindparam("pattern")),
+            Item.short_code.ilike(bindparam("pattern")),
+        )
+    )
+    .limit(20)
+)
+ITEM_BY_SHORT_CODE_STMT = (
+    select(Item).options(raiseload("*")).where(Item.short_code == bindparam("code"))
+)
+ITEM_BY_ID_STMT = select(Item).options(raiseload("*")).where(Item.item_id == bindparam("item_id"))
+ITEM_SCAN_STMT = (
+    select(Item, Location.name, Inventory.qty_on_hand)
+    .options(raiseload("*"))
+    .join(Barcode, Barcode.item_id == Item.item_id)
+    .outerjoin(Inventory, Inventory.item_id == Item.item_id)
+    .outerjoin(Location, Location.location_id == Inventory.location_id)
+    .where(Barcode.barcode == bindparam("barcode"))
+)
+ITEM_LOCATIONS_STMT = (
+    select(
+        Location.location_id,
+        Location.name,
+        Inventory.qty_on_hand,
+        Inventory.qty_reserved,
+    )
+    .join(Inventory, Inventory.location_id == Location.location_id)
+    .where(Inventory.item_id == bindparam("item_id"))
+    .order_by(Location.name)
+)
+ITEM_INCOMING_STMT = (
+    select(
+        PurchaseOrder.po_id,
+        PurchaseOrder.status,
+        PurchaseOrder.expected_date,
+        Vendor.name,
+        POLine.qty_ordered,
+        POLine.qty_received,
+    )
+    .join(POLine, POLine.po_id == PurchaseOrder.po_id)
+    .join(Vendor, PurchaseOrder.vendor_id == Vendor.vendor_id, isouter=True)
+    .where(
+        and_(
+            POLine.item_id == bindparam("item_id"),
+            POLine.qty_received < POLine.qty_ordered,
+            PurchaseOrder.status.in_(["open", "partial"]),
+        )
+    )
+    .order_by(PurchaseOrder.expected_date)
+)
+
 
-@router.get("/catalog", response_model=list[CatalogItemSummary])
+@router.get(
+    "/catalog", response_model=list[CatalogItemSummary], response_class=PydanticResponse
+)
 async def list_catalog_items(
     q: str | None = None,
     limit: int = 50,
     session: AsyncSession = Depends(get_session),
-) -> list[CatalogItemSummary]:
+) -> PydanticResponse:
     search = (q or "").strip()
     limit_value = max(1, min(limit, 100))
 
-    stmt = select(Item).where(Item.active.is_(True)).order_by(Item.description.asc())
+    stmt = (
+        select(Item)
+        .options(raiseload("*"))
+        .where(Item.active.is_(True))
+        .order_by(Item.description.asc())
+    )
     if search:
         pattern = f"%{search}%"
         stmt = stmt.where(
@@ -65,218 +174,138 @@ async def list_catalog_items(
 
     items = (await session.execute(stmt)).scalars().all()
     if not items:
-        return []
+        return PydanticResponse([])
 
-    item_ids = [item.item_id for item in items]
+    params = {"item_ids": [item.item_id for item in items]}
+    total_rows = (await session.execute(CATALOG_TOTALS_STMT, params)).all()
+    top_rows = (await session.execute(CATALOG_TOP_LOCATION_STMT, params)).all()
+    totals = {item_id: float(total) for item_id, total in total_rows}
+    top_locations = {
+        item_id: {"location_id": location_id, "location_name": name, "qty_on_hand": qty}
+        for item_id, location_id, name, qty in top_rows
+    }
 
-    inventory_stmt = (
-        select(
-            Inventory.item_id.label("item_id"),
-            Inventory.qty_on_hand.label("qty_on_hand"),
-            Location.location_id.label("location_id"),
-            Location.name.label("location_name"),
-        )
-        .join(Location, Inventory.location_id == Location.location_id, isouter=True)
-        .where(Inventory.item_id.in_(item_ids))
+    raw_items = [
+        {
+            "item_id": item.item_id,
+            "sku": item.sku,
+            "description": item.description,
+            "vendor_model": item.vendor_model,
+            "total_on_hand": totals.get(item.item_id, 0.0),
+            "top_location": top_locations.get(item.item_id),
+        }
+        for item in items
+    ]
+    return PydanticResponse(_catalog_items_adapter.validate_python(raw_items))
+
+
+@router.get("/search", response_model=list[ItemSummary], response_class=PydanticResponse)
+async def search_items(q: str, session: AsyncSession = Depends(get_session)) -> PydanticResponse:
+    items = (await session.scalars(ITEM_SEARCH_STMT, {"pattern": f"%{q}%"})).all()
+    return PydanticResponse(
+        _item_summaries_adapter.validate_python(items, from_attributes=True)
     )
 
-    inventory_rows = (await session.execute(inventory_stmt)).all()
-    totals: dict[int, float] = {item_id: 0.0 for item_id in item_ids}
-    top_candidates: dict[int, tuple[int, str, float]] = {}
-
-    for row in inventory_rows:
-        item_id = row.item_id
-        qty = float(row.qty_on_hand or 0)
-        totals[item_id] = totals.get(item_id, 0.0) + qty
-        if row.location_id is not None and row.location_name:
-            current = top_candidates.get(item_id)
-            if current is None or qty > current[2]:
-                top_candidates[item_id] = (
-                    row.location_id,
-                    row.location_name,
-                    qty,
-                )
-
-    catalog_items: list[CatalogItemSummary] = []
-    for item in items:
-        candidate = top_candidates.get(item.item_id)
-        top_location = (
-            CatalogLocationInfo(
-                location_id=candidate[0],
-                location_name=candidate[1],
-                qty_on_hand=candidate[2],
-            )
-            if candidate
-            else None
-        )
-        catalog_items.append(
-            CatalogItemSummary(
-                item_id=item.item_id,
-                sku=item.sku,
-                description=item.description,
-                vendor_model=item.vendor_model,
-                total_on_hand=totals.get(item.item_id, 0.0),
-                top_location=top_location,
-            )
-        )
 
-    return catalog_items
+@router.get(
+    "/by-short-code/{code}", response_model=ItemSummary, response_class=PydanticResponse
+)
+async def get_by_short_code(
+    code: str, session: AsyncSession = Depends(get_session)
+) -> PydanticResponse:
+    item = await session.scalar(ITEM_BY_SHORT_CODE_STMT, {"code": code})
+    if not item:
+        raise HTTPException(status_code=404, detail="not_found")
+    return PydanticResponse(ItemSummary.model_validate(item))
 
 
-@router.get("/search", response_model=list[ItemSummary])
-async def search_items(q: str, session: AsyncSession = Depends(get_session)) -> list[ItemSummary]:
-    pattern = f"%{q}%"
-    stmt = (
-        select(Item)
-        .where(
-            or_(
-                Item.sku.ilike(pattern),
-                Item.description.ilike(pattern),
-                Item.short_code.ilike(pattern),
-            )
-        )
-        .limit(20)
+@router.get("/scan/{barcode}", response_class=PydanticResponse)
+async def scan(barcode: str, session: AsyncSession = Depends(get_session)) -> PydanticResponse:
+    rows = (await session.execute(ITEM_SCAN_STMT, {"barcode": barcode})).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="barcode_not_found")
+    item = rows[0][0]
+    return PydanticResponse(
+        {
+            "item": ItemSummary.model_validate(item),
+            "locations": [
+                {"location": location, "qty_on_hand": float(qty)}
+                for _item, location, qty in rows
+                if location is not None
+            ],
+            "last_cost": float(item.unit_cost),
+        }
     )
-    items = (await session.scalars(stmt)).all()
-    return [
-        ItemSummary(
-            item_id=item.item_id,
-            sku=item.sku,
-            description=item.description,
-            price=float(item.price),
-            short_code=item.short_code,
-            unit_cost=float(item.unit_cost),
+
+
+STREAM_BATCH_SIZE = 500
+
+
+async def _collect_isolated(
+    session_factory: async_sessionmaker[AsyncSession],
+    statement,
+    params: dict,
+    build: Callable[[Row], T],
+) -> list[T]:
+    """Stream ``statement`` in a dedicated session, converting rows as they arrive.
+
+    The dedicated session lets callers gather this with other queries, and
+    ``yield_per`` keeps large result sets from being buffered up front.
+    """
+
+    async with session_factory() as session:
+        result = await session.stream(
+            statement.execution_options(yield_per=STREAM_BATCH_SIZE), params
         )
-        for item in items
-    ]
+        return [build(row) async for row in result]
 
 
-@router.get("/by-short-code/{code}", response_model=ItemSummary)
-async def get_by_short_code(code: str, session: AsyncSession = Depends(get_session)) -> ItemSummary:
-    item = await session.scalar(select(Item).where(Item.short_code == code))
-    if not item:
-        raise HTTPException(status_code=404, detail="not_found")
-    return ItemSummary(
-        item_id=item.item_id,
-        sku=item.sku,
-        description=item.description,
-        price=float(item.price),
-        short_code=item.short_code,
-        unit_cost=float(item.unit_cost),
+def _location_info(row: Row) -> ItemLocationInfo:
+    location_id, name, qty_on_hand, qty_reserved = row
+    return ItemLocationInfo(
+        location_id=location_id,
+        location_name=name,
+        qty_on_hand=float(qty_on_hand or 0),
+        qty_reserved=float(qty_reserved or 0),
     )
 
 
-@router.get("/scan/{barcode}")
-async def scan(barcode: str, session: AsyncSession = Depends(get_session)) -> dict:
-    item = await session.scalar(
-        select(Item).join(Barcode).where(Barcode.barcode == barcode)
+def _incoming_info(row: Row) -> IncomingPurchaseInfo:
+    po_id, status, expected_date, vendor_name, qty_ordered, qty_received = row
+    qty_ordered_f = float(qty_ordered or 0)
+    qty_received_f = float(qty_received or 0)
+    return IncomingPurchaseInfo(
+        po_id=po_id,
+        status=status,
+        expected_date=expected_date,
+        vendor_name=vendor_name,
+        qty_ordered=qty_ordered_f,
+        qty_received=qty_received_f,
+        qty_remaining=max(qty_ordered_f - qty_received_f, 0.0),
     )
-    if not item:
-        raise HTTPException(status_code=404, detail="barcode_not_found")
-    inventory = (await session.execute(
-        select(Location.name, Inventory.qty_on_hand)
-        .join(Inventory, Inventory.location_id == Location.location_id)
-        .where(Inventory.item_id == item.item_id)
-    )).all()
-    return {
-        "item": ItemSummary(
-            item_id=item.item_id,
-            sku=item.sku,
-            description=item.description,
-            price=float(item.price),
-            short_code=item.short_code,
-            unit_cost=float(item.unit_cost),
-        ),
-        "locations": [
-            {"location": loc, "qty_on_hand": float(qty)} for loc, qty in inventory
-        ],
-        "last_cost": float(item.unit_cost),
-    }
 
 
-@router.get("/{item_id}", response_model=ItemDetailResponse)
+@router.get("/{item_id}", response_model=ItemDetailResponse, response_class=PydanticResponse)
 async def get_item_detail(
-    item_id: int, session: AsyncSession = Depends(get_session)
-) -> ItemDetailResponse:
-    item = await session.scalar(select(Item).where(Item.item_id == item_id))
+    item_id: int,
+    session: AsyncSession = Depends(get_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> PydanticResponse:
+    params = {"item_id": item_id}
+    item, locations, incoming = await asyncio.gather(
+        session.scalar(ITEM_BY_ID_STMT, params),
+        _collect_isolated(session_factory, ITEM_LOCATIONS_STMT, params, _location_info),
+        _collect_isolated(session_factory, ITEM_INCOMING_STMT, params, _incoming_info),
+    )
     if not item:
         raise HTTPException(status_code=404, detail="not_found")
 
-    location_rows = (
-        await session.execute(
-            select(
-                Location.location_id,
-                Location.name,
-                Inventory.qty_on_hand,
-                Inventory.qty_reserved,
-            )
-            .join(Inventory, Inventory.location_id == Location.location_id)
-            .where(Inventory.item_id == item_id)
-            .order_by(Location.name)
-        )
-    ).all()
-
-    locations = [
-        ItemLocationInfo(
-            location_id=location_id,
-            location_name=name,
-            qty_on_hand=float(qty_on_hand or 0),
-            qty_reserved=float(qty_reserved or 0),
-        )
-        for location_id, name, qty_on_hand, qty_reserved in location_rows
-    ]
-
-    incoming_rows = (
-        await session.execute(
-            select(
-                PurchaseOrder.po_id,
-                PurchaseOrder.status,
-                PurchaseOrder.expected_date,
-                Vendor.name,
-                POLine.qty_ordered,
-                POLine.qty_received,
-            )
-            .join(POLine, POLine.po_id == PurchaseOrder.po_id)
-            .join(Vendor, PurchaseOrder.vendor_id == Vendor.vendor_id, isouter=True)
-            .where(
-                and_(
-                    POLine.item_id == item_id,
-                    POLine.qty_received < POLine.qty_ordered,
-                    PurchaseOrder.status.in_(["open", "partial"]),
-                )
-            )
-            .order_by(PurchaseOrder.expected_date)
-        )
-    ).all()
-
-    incoming = []
-    for po_id, status, expected_date, vendor_name, qty_ordered, qty_received in incoming_rows:
-        qty_ordered_f = float(qty_ordered or 0)
-        qty_received_f = float(qty_received or 0)
-        incoming.append(
-            IncomingPurchaseInfo(
-                po_id=po_id,
-                status=status,
-                expected_date=expected_date,
-                vendor_name=vendor_name,
-                qty_ordered=qty_ordered_f,
-                qty_received=qty_received_f,
-                qty_remaining=max(qty_ordered_f - qty_received_f, 0.0),
-            )
-        )
-
     total_on_hand = sum(location.qty_on_hand for location in locations)
 
-    return ItemDetailResponse(
-        item=ItemSummary(
-            item_id=item.item_id,
-            sku=item.sku,
-            description=item.description,
-            price=float(item.price),
-            short_code=item.short_code,
-            unit_cost=float(item.unit_cost),
-        ),
+    detail = ItemDetailResponse(
+        item=ItemSummary.model_validate(item),
         total_on_hand=total_on_hand,
         locations=locations,
         incoming=incoming,
     )
+    return PydanticResponse(detail)
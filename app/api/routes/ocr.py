@@ -1,36 +1,97 @@
 """OCR endpoints."""
 from __future__ import annotations
 
+import asyncio
+import io
+import logging
+import shutil
 import tempfile
 from pathlib import Path
+from uuid import uuid4
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..config import get_settings
-from ..db import get_session
+from ..db import get_session, get_session_factory
 from ..models.domain import Attachment, Sale
 from ..schemas.common import OCRSaleTicketResponse
 from ..services.ocr import parser
 from ..services.ocr.base import OcrDocument
-from ..services.ocr.tesseract import TesseractProvider
+from ..services.ocr.tesseract import TesseractProvider, get_tesseract_provider
 from ..services.storage import StorageError, storage_service
 
 router = APIRouter()
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1 << 16
 
 
 async def get_provider() -> TesseractProvider:
     # For brevity default to Tesseract. Textract wiring illustrated in docs.
-    return TesseractProvider()
+    return get_tesseract_provider()
+
+
+def _rasterize_pages(fitz, pdf_path: Path, max_pages: int) -> list[Path]:
+    """Render every PDF page to a temporary PNG and return the paths in page order."""
+
+    pdf = fitz.open(str(pdf_path))
+    try:
+        if pdf.page_count == 0:
+            raise HTTPException(status_code=400, detail="empty_pdf")
+        # Each page is a 300 DPI render plus OCR time, so long PDFs are refused up front.
+        if pdf.page_count > max_pages:
+            raise HTTPException(status_code=400, detail="too_many_pages")
+        page_paths: list[Path] = []
+        try:
+            for index in range(pdf.page_count):
+                pix = pdf.load_page(index).get_pixmap(dpi=300)
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as pdf_image:
+                    page_paths.append(Path(pdf_image.name))
+                    pdf_image.write(pix.tobytes("png"))
+                    pdf_image.flush()
+        except BaseException:
+            for path in page_paths:
+                path.unlink(missing_ok=True)
+            raise
+        return page_paths
+    finally:
+        pdf.close()
+
+
+def _write_image_list(image_paths: list[Path]) -> Path:
+    """Write a tesseract file list so all pages are recognised in one invocation."""
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as image_list:
+        image_list.write("\n".join(str(path) for path in image_paths).encode())
+        image_list.flush()
+        return Path(image_list.name)
+
+
+async def _discard_upload(upload: asyncio.Task[str], key: str) -> None:
+    """Wait for ``upload`` and delete the object it stored.
+
+    Cancelling the task cannot stop an upload already running in a worker thread, so
+    the upload is allowed to finish and its object is removed afterwards.
+    """
+
+    try:
+        await upload
+    except StorageError:
+        return
+    try:
+        await storage_service.adelete_file(key=key)
+    except StorageError:
+        logger.warning("Could not delete orphaned ticket upload", extra={"key": key})
 
 
 @router.post("/sale-ticket", response_model=OCRSaleTicketResponse)
 async def upload_ticket(
     image: UploadFile = File(...),
     ticket_id: str | None = Form(default=None),
-    session: AsyncSession = Depends(get_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
     provider: TesseractProvider = Depends(get_provider),
 ) -> OCRSaleTicketResponse:
     filename = image.filename or "upload"
@@ -42,74 +103,87 @@ async def upload_ticket(
     if not is_pdf and not is_image:
         raise HTTPException(status_code=400, detail="unsupported_file_type")
 
-    tmp_suffix = suffix if suffix else ""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=tmp_suffix) as tmp:
-        content = await image.read()
-        tmp.write(content)
-        tmp.flush()
-        upload_path = Path(tmp.name)
+    storage_key = f"tickets/{uuid4().hex}{suffix}"
+    temp_paths: set[Path] = set()
+    try:
+        if is_pdf:
+            try:
+                import fitz  # type: ignore
+            except ImportError as exc:  # pragma: no cover - import guard
+                raise HTTPException(status_code=500, detail="pdf_processing_unavailable") from exc
 
-    ocr_input_path = upload_path
-    if is_pdf:
-        try:
-            import fitz  # type: ignore
-        except ImportError as exc:  # pragma: no cover - import guard
-            raise HTTPException(status_code=500, detail="pdf_processing_unavailable") from exc
-
-        pdf = fitz.open(str(upload_path))
-        try:
-            if pdf.page_count == 0:
-                raise HTTPException(status_code=400, detail="empty_pdf")
-            page = pdf.load_page(0)
-            pix = page.get_pixmap(dpi=300)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as pdf_image:
-                pdf_image.write(pix.tobytes("png"))
-                pdf_image.flush()
-                ocr_input_path = Path(pdf_image.name)
-        finally:
-            pdf.close()
-
-    storage_content_type = "application/pdf" if is_pdf else (content_type or "image/jpeg")
-    with open(upload_path, "rb") as fh:
-        try:
-            doc_url = storage_service.upload_file(
-                key=f"tickets/{upload_path.name}",
-                fileobj=fh,
-                content_type=storage_content_type,
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+                upload_path = Path(tmp.name)
+                temp_paths.add(upload_path)
+                # Copy the spooled upload in fixed-size chunks instead of reading it into memory.
+                await asyncio.to_thread(shutil.copyfileobj, image.file, tmp, UPLOAD_CHUNK_SIZE)
+                tmp.flush()
+            page_paths = await asyncio.to_thread(
+                _rasterize_pages, fitz, upload_path, settings.ocr_max_pages
             )
-        except StorageError as exc:
-            raise HTTPException(status_code=503, detail="storage_unavailable") from exc
-    document: OcrDocument = await provider.analyze(str(ocr_input_path))
-    parsed = await parser.parse_ticket(document)
-    parsed_fields: dict[str, object | None] = {
-        "customer_name": parsed.customer_name,
-        "phone": parsed.phone,
-        "subtotal": parsed.subtotal,
-        "tax": parsed.tax,
-        "total": parsed.total,
-    }
-    if ticket_id:
-        parsed_fields["ticket_id"] = ticket_id
-    sale = Sale(status="draft", source="ocr_ticket", ocr_confidence=parsed.confidence)
-    sale.ocr_payload = parsed_fields
-    if parsed.subtotal is not None:
-        sale.subtotal = parsed.subtotal
-    if parsed.tax is not None:
-        sale.tax = parsed.tax
-    if parsed.total is not None:
-        sale.total = parsed.total
-    session.add(sale)
-    await session.flush()
-    attachment_kind = "document_ticket" if is_pdf else "photo_ticket"
-    session.add(
-        Attachment(ref_type="sale", ref_id=sale.sale_id, file_url=doc_url, kind=attachment_kind)
-    )
-    await session.flush()
-    for path in {ocr_input_path, upload_path}:
+            temp_paths.update(page_paths)
+            # Pages always go through a file list so the worker can tell renders from photos.
+            ocr_input_path = _write_image_list(page_paths)
+            temp_paths.add(ocr_input_path)
+            # The upload thread opens the file itself, so no handle is shared across threads.
+            store = storage_service.aupload_path(
+                key=storage_key, path=upload_path, content_type="application/pdf"
+            )
+            analyze = provider.analyze(str(ocr_input_path))
+        else:
+            # Photos are OCR'd from memory; only PDFs need a file for rasterization.
+            content = await image.read()
+            store = storage_service.aupload_file(
+                key=storage_key,
+                fileobj=io.BytesIO(content),
+                content_type=content_type or "image/jpeg",
+            )
+            analyze = provider.analyze_bytes(content)
+
+        # Upload the original while OCR runs; latency becomes max(upload, ocr).
+        upload = asyncio.create_task(store)
         try:
-            path.unlink()
-        except FileNotFoundError:
-            pass
+            document: OcrDocument = await analyze
+            try:
+                doc_url = await upload
+            except StorageError as exc:
+                raise HTTPException(status_code=503, detail="storage_unavailable") from exc
+            parsed = await parser.parse_ticket(document)
+            parsed_fields: dict[str, object | None] = {
+                "customer_name": parsed.customer_name,
+                "phone": parsed.phone,
+                "subtotal": parsed.subtotal,
+                "tax": parsed.tax,
+                "total": parsed.total,
+            }
+            if ticket_id:
+                parsed_fields["ticket_id"] = ticket_id
+            sale = Sale(status="draft", source="ocr_ticket", ocr_confidence=parsed.confidence)
+            sale.ocr_payload = parsed_fields
+            if parsed.subtotal is not None:
+                sale.subtotal = parsed.subtotal
+            if parsed.tax is not None:
+                sale.tax = parsed.tax
+            if parsed.total is not None:
+                sale.total = parsed.total
+            attachment_kind = "document_ticket" if is_pdf else "photo_ticket"
+            # Check out a connection only once OCR is done so slow tickets never pin the pool.
+            async with session_factory() as session, session.begin():
+                session.add(sale)
+                await session.flush()
+                session.add(
+                    Attachment(
+                        ref_type="sale", ref_id=sale.sale_id, file_url=doc_url, kind=attachment_kind
+                    )
+                )
+        except BaseException:
+            # No sale will reference the stored original, so remove it once it lands.
+            await _discard_upload(upload, storage_key)
+            raise
+    finally:
+        # Every exit, including OCR, storage and database failures, removes the temp files.
+        for path in temp_paths:
+            path.unlink(missing_ok=True)
     return OCRSaleTicketResponse(
         sale_id=sale.sale_id,
         parsed_fields=parsed_fields,
@@ -120,15 +194,23 @@ async def upload_ticket(
 
 @router.get("/sale-ticket/{sale_id}")
 async def get_ticket(sale_id: int, session: AsyncSession = Depends(get_session)) -> dict:
-    sale = await session.get(Sale, sale_id)
-    if not sale:
+    row = (
+        await session.execute(
+            select(Sale, Attachment.file_url)
+            .outerjoin(
+                Attachment,
+                and_(Attachment.ref_type == "sale", Attachment.ref_id == Sale.sale_id),
+            )
+            .where(Sale.sale_id == sale_id)
+            .limit(1)
+        )
+    ).first()
+    if not row:
         raise HTTPException(status_code=404, detail="not_found")
-    attachment = await session.scalar(
-        select(Attachment).where(Attachment.ref_type == "sale", Attachment.ref_id == sale_id)
-    )
+    sale, attachment_url = row
     return {
         "sale_id": sale.sale_id,
         "ocr_confidence": float(sale.ocr_confidence or 0),
-        "attachment_url": attachment.file_url if attachment else None,
+        "attachment_url": attachment_url,
         "parsed_fields": sale.ocr_payload or {},
     }
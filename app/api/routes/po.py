@@ -2,17 +2,28 @@
 from __future__ import annotations
 
 import re
-
+from collections.abc import Iterable
+from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Response
-from pydantic import BaseModel
-from sqlalchemy import case, func, or_, select
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from sqlalchemy import (
+    bindparam,
+    case,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import ColumnClause
 
 from ..db import get_session
 from ..models.domain import (
-    Barcode,
     Bill,
     Item,
     Inventory,
@@ -23,18 +34,67 @@ from ..models.domain import (
     ReceivingLine,
     Vendor,
 )
+from ..responses import PydanticResponse
 from ..security import User, require_roles
+from ..services.barcodes import resolve_barcode_item_id
 from ..utils.datetime import utc_now
+from ..utils.schema import column_exists
 from ..schemas.po import POLineSearchResult, PurchaseOrderSummary
 
 router = APIRouter()
 
+DIGITS_RE = re.compile(r"\d+")
+# Line ids stay well below ten digits; longer digit runs are UPC/EAN barcodes and
+# go straight to the barcode lookup instead of probing po_line first.
+MAX_LINE_ID_DIGITS = 9
+# Kept as a tuple so every statement renders the IN list in the same order.
+LIVE_PO_STATUSES = ("open", "partial")
+
+# Maintained by the triggers from migration 0013 (Postgres only); it covers item
+# sku/description, line description, PO notes and vendor name. Deployments that
+# skipped the migration fall back to the ILIKE search. The column is bound to the
+# po_line table but kept off the model so ``create_all`` never creates it untriggered.
+PO_LINE_SEARCH_VECTOR = ColumnClause("search_vec", TSVECTOR, _selectable=POLine.__table__)
+# Letters and digits only: the text search parser also splits words on underscores.
+SEARCH_TOKEN_RE = re.compile(r"[^\W_]+")
+
+_po_summaries_adapter = TypeAdapter(list[PurchaseOrderSummary])
+_po_line_search_adapter = TypeAdapter(list[POLineSearchResult])
+
+# Per-request lookups are built once at import; handlers only bind parameter
+# values, so SQLAlchemy reuses the cached compilation.
+PO_WITH_LINES_STMT = (
+    select(PurchaseOrder, POLine)
+    .outerjoin(POLine, POLine.po_id == PurchaseOrder.po_id)
+    .where(PurchaseOrder.po_id == bindparam("po_id"))
+)
+OPEN_PO_LINES_BY_ID_STMT = (
+    select(POLine)
+    .join(PurchaseOrder, PurchaseOrder.po_id == POLine.po_id)
+    .where(POLine.po_line_id.in_(bindparam("line_ids", expanding=True)))
+    .where(PurchaseOrder.status.in_(LIVE_PO_STATUSES))
+)
+OPEN_PO_LINES_FOR_ITEM_STMT = (
+    select(POLine)
+    .join(PurchaseOrder, PurchaseOrder.po_id == POLine.po_id)
+    .where(POLine.item_id == bindparam("item_id"))
+    .where(PurchaseOrder.status.in_(LIVE_PO_STATUSES))
+)
+OPEN_PO_LINE_SEARCH_STMT = (
+    select(POLine, PurchaseOrder, Item, Vendor)
+    .join(PurchaseOrder, PurchaseOrder.po_id == POLine.po_id)
+    .join(Item, Item.item_id == POLine.item_id)
+    .join(Vendor, Vendor.vendor_id == PurchaseOrder.vendor_id, isouter=True)
+    .where(PurchaseOrder.status.in_(LIVE_PO_STATUSES))
+    .where(POLine.qty_ordered - func.coalesce(POLine.qty_received, 0) > 0)
+)
+
 
-@router.get("", response_model=list[PurchaseOrderSummary])
+@router.get("", response_model=list[PurchaseOrderSummary], response_class=PydanticResponse)
 async def list_purchase_orders(
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_roles("Purchasing", "Admin")),
-) -> list[PurchaseOrderSummary]:
+) -> PydanticResponse:
     remaining_qty = func.coalesce(POLine.qty_ordered, 0) - func.coalesce(
         POLine.qty_received, 0
     )
@@ -77,24 +137,24 @@ async def list_purchase_orders(
     )
 
     rows = (await session.execute(stmt)).all()
-    summaries: list[PurchaseOrderSummary] = []
-    for row in rows:
-        summaries.append(
-            PurchaseOrderSummary(
-                po_id=row.po_id,
-                status=row.status,
-                vendor_name=row.vendor_name,
-                expected_date=row.expected_date,
-                total_lines=int(row.total_lines or 0),
-                open_lines=int(row.open_lines or 0),
-                received_lines=int(row.received_lines or 0),
-                qty_ordered=float(row.qty_ordered or 0),
-                qty_received=float(row.qty_received or 0),
-                notes=row.notes,
-            )
-        )
-
-    return summaries
+    summaries = _po_summaries_adapter.validate_python(
+        [
+            {
+                "po_id": row.po_id,
+                "status": row.status,
+                "vendor_name": row.vendor_name,
+                "expected_date": row.expected_date,
+                "total_lines": row.total_lines or 0,
+                "open_lines": row.open_lines or 0,
+                "received_lines": row.received_lines or 0,
+                "qty_ordered": row.qty_ordered or 0,
+                "qty_received": row.qty_received or 0,
+                "notes": row.notes,
+            }
+            for row in rows
+        ]
+    )
+    return PydanticResponse(summaries)
 
 
 class POLinePayload(BaseModel):
@@ -110,6 +170,17 @@ class POCreatePayload(BaseModel):
     notes: str | None = None
 
 
+class POUpdatePayload(BaseModel):
+    """Header fields a PATCH may change; unknown keys are rejected."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    status: Literal["draft", "open", "partial", "received", "closed"] | None = None
+    expected_date: datetime | None = None
+    terms: str | None = None
+    notes: str | None = None
+
+
 class POReceiveLinePayload(BaseModel):
     po_line_id: int
     qty_received: float
@@ -133,29 +204,35 @@ async def create_po(
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_roles("Purchasing", "Admin")),
 ) -> dict:
-    po = PurchaseOrder(vendor_id=payload.vendor_id, status="open", notes=payload.notes, created_by=user.id)
-    session.add(po)
-    await session.flush()
-    for line in payload.lines:
-        session.add(
-            POLine(
-                po_id=po.po_id,
-                item_id=line.item_id,
-                description=line.description,
-                qty_ordered=line.qty_ordered,
-                unit_cost=line.unit_cost,
-            )
+    po_id = await session.scalar(
+        insert(PurchaseOrder)
+        .values(vendor_id=payload.vendor_id, status="open", notes=payload.notes, created_by=user.id)
+        .returning(PurchaseOrder.po_id)
+    )
+    if payload.lines:
+        await session.execute(
+            insert(POLine),
+            [
+                {
+                    "po_id": po_id,
+                    "item_id": line.item_id,
+                    "description": line.description,
+                    "qty_ordered": line.qty_ordered,
+                    "unit_cost": line.unit_cost,
+                }
+                for line in payload.lines
+            ],
         )
-    await session.flush()
-    return {"po_id": po.po_id}
+    return {"po_id": po_id}
 
 
 @router.get("/{po_id}")
 async def get_po(po_id: int, session: AsyncSession = Depends(get_session)) -> dict:
-    po = await session.get(PurchaseOrder, po_id)
-    if not po:
+    rows = (await session.execute(PO_WITH_LINES_STMT, {"po_id": po_id})).all()
+    if not rows:
         raise HTTPException(status_code=404, detail="not_found")
-    lines = (await session.execute(select(POLine).where(POLine.po_id == po_id))).scalars().all()
+    po = rows[0][0]
+    lines = [line for _po, line in rows if line is not None]
     return {
         "po_id": po.po_id,
         "status": po.status,
@@ -174,11 +251,16 @@ async def get_po(po_id: int, session: AsyncSession = Depends(get_session)) -> di
 
 
 @router.patch("/{po_id}")
-async def update_po(po_id: int, payload: dict, session: AsyncSession = Depends(get_session)) -> dict:
+async def update_po(
+    po_id: int, payload: POUpdatePayload, session: AsyncSession = Depends(get_session)
+) -> dict:
+    updates = payload.model_dump(exclude_unset=True)
+    if "status" in updates and updates["status"] is None:
+        raise HTTPException(status_code=400, detail="status_required")
     po = await session.get(PurchaseOrder, po_id)
     if not po:
         raise HTTPException(status_code=404, detail="not_found")
-    for key, value in payload.items():
+    for key, value in updates.items():
         setattr(po, key, value)
     await session.flush()
     return {"po_id": po.po_id, "status": po.status}
@@ -205,35 +287,11 @@ async def delete_po(
     return Response(status_code=204)
 
 
-@router.get("/lookup/{code}", response_model=list[POLineLookupResponse])
-async def lookup_po_line(
-    code: str,
-    session: AsyncSession = Depends(get_session),
-    user: User = Depends(require_roles("Purchasing", "Admin")),
-) -> list[POLineLookupResponse]:
-    sanitized = code.strip()
-    results: list[POLineLookupResponse] = []
-    seen_lines: set[int] = set()
+def _open_line_lookups(lines: Iterable[POLine]) -> list[POLineLookupResponse]:
+    """Build lookup responses for ``lines`` that still have quantity outstanding."""
 
-    potential_ids: list[int] = []
-    if sanitized.isdigit():
-        potential_ids.append(int(sanitized))
-    else:
-        for fragment in re.findall(r"\d+", sanitized):
-            try:
-                potential_ids.append(int(fragment))
-            except ValueError:
-                continue
-
-    for line_id in potential_ids:
-        if line_id in seen_lines:
-            continue
-        line = await session.get(POLine, line_id)
-        if not line:
-            continue
-        po = await session.get(PurchaseOrder, line.po_id)
-        if not po or po.status not in {"open", "partial"}:
-            continue
+    results: list[POLineLookupResponse] = []
+    for line in lines:
         qty_ordered = float(line.qty_ordered)
         qty_received = float(line.qty_received or 0)
         qty_remaining = max(qty_ordered - qty_received, 0.0)
@@ -250,43 +308,45 @@ async def lookup_po_line(
                 qty_remaining=qty_remaining,
             )
         )
-        seen_lines.add(line.po_line_id)
+    return results
 
-    if results:
-        return results
 
-    barcode = await session.get(Barcode, sanitized)
-    if not barcode:
-        raise HTTPException(status_code=404, detail="barcode_not_found")
+@router.get("/lookup/{code}", response_model=list[POLineLookupResponse])
+async def lookup_po_line(
+    code: str,
+    session: AsyncSession = Depends(get_session),
+    user: User = Depends(require_roles("Purchasing", "Admin")),
+) -> list[POLineLookupResponse]:
+    sanitized = code.strip()
 
-    stmt = (
-        select(POLine, PurchaseOrder)
-        .join(PurchaseOrder, PurchaseOrder.po_id == POLine.po_id)
-        .where(POLine.item_id == barcode.item_id)
-        .where(PurchaseOrder.status.in_(("open", "partial")))
-    )
-    rows = (await session.execute(stmt)).all()
-    for line, po in rows:
-        if line.po_line_id in seen_lines:
-            continue
-        qty_ordered = float(line.qty_ordered)
-        qty_received = float(line.qty_received or 0)
-        qty_remaining = max(qty_ordered - qty_received, 0.0)
-        if qty_remaining <= 0:
-            continue
-        results.append(
-            POLineLookupResponse(
-                po_id=line.po_id,
-                po_line_id=line.po_line_id,
-                item_id=line.item_id,
-                description=line.description,
-                qty_ordered=qty_ordered,
-                qty_received=qty_received,
-                qty_remaining=qty_remaining,
-            )
+    # Plain scanner codes skip the regex; isdecimal() only admits characters int() accepts.
+    if sanitized.isdecimal():
+        potential_ids = [int(sanitized)] if len(sanitized) <= MAX_LINE_ID_DIGITS else []
+    else:
+        potential_ids = [
+            int(fragment)
+            for fragment in DIGITS_RE.findall(sanitized)
+            if len(fragment) <= MAX_LINE_ID_DIGITS
+        ]
+
+    candidate_ids = list(dict.fromkeys(potential_ids))
+    if candidate_ids:
+        open_lines = await session.scalars(OPEN_PO_LINES_BY_ID_STMT, {"line_ids": candidate_ids})
+        lines_by_id = {line.po_line_id: line for line in open_lines}
+        results = _open_line_lookups(
+            lines_by_id[line_id] for line_id in candidate_ids if line_id in lines_by_id
         )
-        seen_lines.add(line.po_line_id)
+        if results:
+            return results
 
+    item_id = await resolve_barcode_item_id(session, sanitized)
+    if item_id is None:
+        raise HTTPException(status_code=404, detail="barcode_not_found")
+
+    # The join only filters on PO status; the header itself is never needed, so
+    # no PurchaseOrder is loaded per line.
+    lines = await session.scalars(OPEN_PO_LINES_FOR_ITEM_STMT, {"item_id": item_id})
+    results = _open_line_lookups(lines)
     if not results:
         raise HTTPException(status_code=404, detail="po_line_not_found")
 
@@ -299,38 +359,51 @@ def _escape_like(value: str) -> str:
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
-@router.get("/lines/search", response_model=list[POLineSearchResult])
+def _prefix_tsquery(query: str) -> str:
+    """Return a ``to_tsquery`` string matching every word of ``query`` as a prefix.
+
+    The web client searches from two characters, so partial SKUs and words must
+    match the way the ILIKE search does. Only word characters are kept, which
+    leaves no tsquery operators in user input.
+    """
+
+    return " & ".join(f"{token}:*" for token in SEARCH_TOKEN_RE.findall(query))
+
+
+@router.get(
+    "/lines/search", response_model=list[POLineSearchResult], response_class=PydanticResponse
+)
 async def search_po_lines(
     q: str,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_roles("Purchasing", "Admin")),
-) -> list[POLineSearchResult]:
+) -> PydanticResponse:
     query = q.strip()
     if len(query) < 2:
-        return []
-
-    escaped = _escape_like(query)
-    like_pattern = f"%{escaped}%"
-    remaining_qty = POLine.qty_ordered - func.coalesce(POLine.qty_received, 0)
-
-    stmt = (
-        select(POLine, PurchaseOrder, Item, Vendor)
-        .join(PurchaseOrder, PurchaseOrder.po_id == POLine.po_id)
-        .join(Item, Item.item_id == POLine.item_id)
-        .join(Vendor, Vendor.vendor_id == PurchaseOrder.vendor_id, isouter=True)
-        .where(PurchaseOrder.status.in_(("open", "partial")))
-        .where(remaining_qty > 0)
-    )
-
-    conditions = [
-        Item.sku.ilike(like_pattern, escape="\\"),
-        Item.description.ilike(like_pattern, escape="\\"),
-        POLine.description.ilike(like_pattern, escape="\\"),
-        PurchaseOrder.notes.ilike(like_pattern, escape="\\"),
-        Vendor.name.ilike(like_pattern, escape="\\"),
-    ]
-
-    digit_tokens = {int(fragment) for fragment in re.findall(r"\d+", query)}
+        return PydanticResponse([])
+
+    order_by = [PurchaseOrder.po_id.desc(), POLine.po_line_id]
+    if session.get_bind().dialect.name == "postgresql" and await column_exists(
+        "po_line", "search_vec"
+    ):
+        # One GIN probe on the trigger-maintained vector replaces five ILIKE scans.
+        conditions = []
+        prefix_query = _prefix_tsquery(query)
+        if prefix_query:
+            ts_query = func.to_tsquery("simple", prefix_query)
+            conditions.append(PO_LINE_SEARCH_VECTOR.op("@@")(ts_query))
+            order_by.insert(0, func.ts_rank_cd(PO_LINE_SEARCH_VECTOR, ts_query).desc())
+    else:
+        like_pattern = f"%{_escape_like(query)}%"
+        conditions = [
+            Item.sku.ilike(like_pattern, escape="\\"),
+            Item.description.ilike(like_pattern, escape="\\"),
+            POLine.description.ilike(like_pattern, escape="\\"),
+            PurchaseOrder.notes.ilike(like_pattern, escape="\\"),
+            Vendor.name.ilike(like_pattern, escape="\\"),
+        ]
+
+    digit_tokens = {int(fragment) for fragment in DIGITS_RE.findall(query)}
     if digit_tokens:
         conditions.extend(
             (
@@ -340,11 +413,16 @@ async def search_po_lines(
             )
         )
 
-    stmt = stmt.where(or_(*conditions)).order_by(PurchaseOrder.po_id.desc(), POLine.po_line_id).limit(50)
+    if not conditions:
+        return PydanticResponse([])
+
+    stmt = (
+        OPEN_PO_LINE_SEARCH_STMT.where(or_(*conditions)).order_by(*order_by).limit(50)
+    )
 
     rows = (await session.execute(stmt)).all()
 
-    results: list[POLineSearchResult] = []
+    results: list[dict] = []
     for line, po, item, vendor in rows:
         qty_ordered = float(line.qty_ordered or 0)
         qty_received = float(line.qty_received or 0)
@@ -353,19 +431,19 @@ async def search_po_lines(
             continue
 
         results.append(
-            POLineSearchResult(
-                po_id=po.po_id,
-                po_number=f"PO-{po.po_id}",
-                po_line_id=line.po_line_id,
-                item_id=line.item_id,
-                item_description=line.description or item.description,
-                vendor=vendor.name if vendor else None,
-                qty_ordered=qty_ordered,
-                qty_remaining=qty_remaining,
-            )
+            {
+                "po_id": po.po_id,
+                "po_number": f"PO-{po.po_id}",
+                "po_line_id": line.po_line_id,
+                "item_id": line.item_id,
+                "item_description": line.description or item.description,
+                "vendor": vendor.name if vendor else None,
+                "qty_ordered": qty_ordered,
+                "qty_remaining": qty_remaining,
+            }
         )
 
-    return results
+    return PydanticResponse(_po_line_search_adapter.validate_python(results))
 
 
 @router.post("/{po_id}/receive")
@@ -378,12 +456,23 @@ async def receive_po(
     po = await session.get(PurchaseOrder, po_id)
     if not po:
         raise HTTPException(status_code=404, detail="not_found")
-    receiving = Receiving(po_id=po_id, received_by=user.id)
-    session.add(receiving)
-    await session.flush()
+    received_at = utc_now()
+    receipt_id = await session.scalar(
+        insert(Receiving)
+        .values(po_id=po_id, received_by=user.id, received_at=received_at)
+        .returning(Receiving.receipt_id)
+    )
     subtotal = 0.0
+    receiving_rows: list[dict] = []
+    txn_rows: list[dict] = []
+    stock_deltas: dict[tuple[int, int], Decimal] = {}
+    line_ids = {line_payload.po_line_id for line_payload in payload}
+    lines_by_id: dict[int, POLine] = {}
+    if line_ids:
+        lines = await session.scalars(select(POLine).where(POLine.po_line_id.in_(line_ids)))
+        lines_by_id = {line.po_line_id: line for line in lines}
     for line_payload in payload:
-        line = await session.get(POLine, line_payload.po_line_id)
+        line = lines_by_id.get(line_payload.po_line_id)
         if not line:
             continue
         if line.po_id != po_id:
@@ -392,54 +481,60 @@ async def receive_po(
         unit_cost = float(line_payload.unit_cost or line.unit_cost)
         line.qty_received = (line.qty_received or 0) + qty
         subtotal += qty * unit_cost
-        session.add(
-            ReceivingLine(
-                receipt_id=receiving.receipt_id,
-                po_line_id=line.po_line_id,
-                item_id=line.item_id,
-                qty_received=qty,
-                unit_cost=unit_cost,
-            )
+        receiving_rows.append(
+            {
+                "receipt_id": receipt_id,
+                "po_line_id": line.po_line_id,
+                "item_id": line.item_id,
+                "qty_received": qty,
+                "unit_cost": unit_cost,
+            }
         )
         location_id = line_payload.location_id or 1
-        session.add(
-            InventoryTxn(
-                item_id=line.item_id,
-                location_id=location_id,
-                qty_delta=qty,
-                reason="receive",
-                ref_type="receiving",
-                ref_id=receiving.receipt_id,
-                unit_cost=unit_cost,
-                created_at=utc_now(),
-            )
+        txn_rows.append(
+            {
+                "item_id": line.item_id,
+                "location_id": location_id,
+                "qty_delta": qty,
+                "reason": "receive",
+                "ref_type": "receiving",
+                "ref_id": receipt_id,
+                "unit_cost": unit_cost,
+                "created_at": received_at,
+            }
         )
 
-        inventory = await session.scalar(
+        stock_key = (line.item_id, location_id)
+        stock_deltas[stock_key] = stock_deltas.get(stock_key, Decimal("0")) + Decimal(str(qty))
+
+    if stock_deltas:
+        # One lookup for every (item, location) pair instead of a SELECT per line.
+        existing = await session.scalars(
             select(Inventory).where(
-                Inventory.item_id == line.item_id,
-                Inventory.location_id == location_id,
+                tuple_(Inventory.item_id, Inventory.location_id).in_(list(stock_deltas))
             )
         )
-        if not inventory:
-            inventory = Inventory(
-                item_id=line.item_id,
-                location_id=location_id,
-                qty_on_hand=Decimal("0"),
-                qty_reserved=Decimal("0"),
-                avg_cost=Decimal("0"),
-            )
-            session.add(inventory)
-
-        current_qty = Decimal(inventory.qty_on_hand or 0)
-        inventory.qty_on_hand = current_qty + Decimal(str(qty))
-    bill = Bill(
-        vendor_id=po.vendor_id,
-        po_id=po_id,
-        subtotal=subtotal,
-        total=subtotal,
-        status="draft",
+        inventory_by_key = {(row.item_id, row.location_id): row for row in existing}
+        for (item_id, location_id), delta in stock_deltas.items():
+            inventory = inventory_by_key.get((item_id, location_id))
+            if not inventory:
+                inventory = Inventory(
+                    item_id=item_id,
+                    location_id=location_id,
+                    qty_on_hand=Decimal("0"),
+                    qty_reserved=Decimal("0"),
+                    avg_cost=Decimal("0"),
+                )
+                session.add(inventory)
+            inventory.qty_on_hand = Decimal(inventory.qty_on_hand or 0) + delta
+    if receiving_rows:
+        await session.execute(insert(ReceivingLine), receiving_rows)
+        await session.execute(insert(InventoryTxn), txn_rows)
+    bill_id = await session.scalar(
+        insert(Bill)
+        .values(
+            vendor_id=po.vendor_id, po_id=po_id, subtotal=subtotal, total=subtotal, status="draft"
+        )
+        .returning(Bill.bill_id)
     )
-    session.add(bill)
-    await session.flush()
-    return {"receipt_id": receiving.receipt_id, "bill_id": bill.bill_id}
+    return {"receipt_id": receipt_id, "bill_id": bill_id}
@@ -3,18 +3,19 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy import or_, select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
 from ..models.domain import Attachment, Barcode, InventoryTxn, Item, Sale, SaleLine
+from ..responses import PydanticResponse
 from ..schemas.common import (
     AttachmentSummary,
+    CustomerSummary,
     OCRSaleTicketResponse,
     SaleCreateRequest,
-    SaleCustomerSummary,
     SaleDeliveryRequest,
     SaleDeliveryStatusResponse,
     SaleDeliveryStatusUpdate,
@@ -55,20 +56,27 @@ def _extract_last_name(name: str | None) -> str | None:
 
 @router.get("")
 async def list_sales(session: AsyncSession = Depends(get_session)) -> dict:
-    drafts = (
-        await session.execute(select(Sale).where(Sale.status == "draft").limit(50))
-    ).scalars()
+    # Project just the listed columns. The partial idx_sale_draft index finds the draft
+    # rows; customer_name still comes from ocr_payload, so each row is read from the heap.
+    drafts = await session.execute(
+        select(
+            Sale.sale_id,
+            Sale.ocr_confidence,
+            Sale.total,
+            Sale.ocr_payload["customer_name"].as_string(),
+        )
+        .where(Sale.status == "draft")
+        .limit(50)
+    )
     return {
         "drafts": [
             {
-                "sale_id": sale.sale_id,
-                "ocr_confidence": float(sale.ocr_confidence or 0),
-                "total": float(sale.total or 0),
-                "customer_name": _extract_last_name(
-                    (sale.ocr_payload or {}).get("customer_name")
-                ),
+                "sale_id": sale_id,
+                "ocr_confidence": float(ocr_confidence or 0),
+                "total": float(total or 0),
+                "customer_name": _extract_last_name(customer_name),
             }
-            for sale in drafts
+            for sale_id, ocr_confidence, total, customer_name in drafts
         ]
     }
 
@@ -94,8 +102,8 @@ def _to_dashboard_entry(sale: Sale) -> SaleDashboardEntry:
     )
 
 
-@router.get("/dashboard", response_model=SalesDashboardResponse)
-async def sales_dashboard(session: AsyncSession = Depends(get_session)) -> SalesDashboardResponse:
+@router.get("/dashboard", response_model=SalesDashboardResponse, response_class=PydanticResponse)
+async def sales_dashboard(session: AsyncSession = Depends(get_session)) -> PydanticResponse:
     open_stmt = (
         select(Sale)
         .options(selectinload(Sale.customer))
@@ -119,7 +127,12 @@ async def sales_dashboard(session: AsyncSession = Depends(get_session)) -> Sales
         _to_dashboard_entry(sale) for sale in fulfilled_sales_rows.scalars()
     ]
 
-    return SalesDashboardResponse(open_sales=open_sales, fulfilled_sales=fulfilled_sales)
+    # Both lists already hold validated entries, so the envelope skips re-validation.
+    return PydanticResponse(
+        SalesDashboardResponse.model_construct(
+            open_sales=open_sales, fulfilled_sales=fulfilled_sales
+        )
+    )
 
 
 @router.get("/delivery-options")
@@ -189,8 +202,12 @@ async def list_deliveries(session: AsyncSession = Depends(get_session)) -> dict:
     }
 
 
-@router.get("/{sale_id}", response_model=SaleDetailResponse)
-async def get_sale_detail(sale_id: int, session: AsyncSession = Depends(get_session)) -> SaleDetailResponse:
+@router.get("/{sale_id}", response_model=SaleDetailResponse, response_class=PydanticResponse)
+async def get_sale_detail(sale_id: int, session: AsyncSession = Depends(get_session)) -> PydanticResponse:
+    return PydanticResponse(await _load_sale_detail(session, sale_id))
+
+
+async def _load_sale_detail(session: AsyncSession, sale_id: int) -> SaleDetailResponse:
     sale = await session.get(
         Sale,
         sale_id,
@@ -219,7 +236,7 @@ async def get_sale_detail(sale_id: int, session: AsyncSession = Depends(get_sess
     ]
     customer_summary = None
     if sale.customer:
-        customer_summary = SaleCustomerSummary(
+        customer_summary = CustomerSummary(
             customer_id=sale.customer.customer_id,
             name=sale.customer.name,
             phone=sale.customer.phone,
@@ -372,21 +389,25 @@ async def update_sale(
 
     await session.flush()
 
-    return await get_sale_detail(sale_id, session=session)
+    return await _load_sale_detail(session, sale_id)
 
 
 @router.post("/{sale_id}/finalize", response_model=SaleFinalizeResponse)
-async def finalize_sale(sale_id: int, session: AsyncSession = Depends(get_session)) -> SaleFinalizeResponse:
-    sale = await session.get(Sale, sale_id)
+async def finalize_sale(
+    sale_id: int,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_session),
+) -> SaleFinalizeResponse:
+    # Lines and their items arrive in one follow-up SELECT (items joined in), so
+    # the zapier payload below never lazy-loads per line.
+    sale = await session.scalar(
+        select(Sale)
+        .options(selectinload(Sale.lines).joinedload(SaleLine.item))
+        .where(Sale.sale_id == sale_id)
+    )
     if not sale:
         raise HTTPException(status_code=404, detail="sale_not_found")
-    sale_lines = (
-        await session.execute(
-            select(SaleLine)
-            .options(selectinload(SaleLine.item))
-            .where(SaleLine.sale_id == sale_id)
-        )
-    ).scalars().all()
+    sale_lines = sale.lines
     sale.status = "open"
     sale.sale_date = utc_now()
     for line in sale_lines:
@@ -403,7 +424,10 @@ async def finalize_sale(sale_id: int, session: AsyncSession = Depends(get_sessio
             )
         )
     await session.flush()
-    zapier.ticket_finalized(
+    # The payload is built now, while the session is open; the webhook itself is
+    # posted after the response is sent and the transaction has committed.
+    background_tasks.add_task(
+        zapier.ticket_finalized,
         {
             "sale_id": sale.sale_id,
             "subtotal": float(sale.subtotal or 0),
@@ -419,7 +443,7 @@ async def finalize_sale(sale_id: int, session: AsyncSession = Depends(get_sessio
                 }
                 for line in sale_lines
             ],
-        }
+        },
     )
     return SaleFinalizeResponse(sale_id=sale.sale_id, status=sale.status, total=float(sale.total or 0))
 
@@ -468,6 +492,7 @@ async def get_delivery_status(
 async def update_delivery_status(
     sale_id: int,
     payload: SaleDeliveryStatusUpdate,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_roles("Driver", "Admin")),
 ) -> SaleDeliveryStatusResponse:
@@ -477,10 +502,10 @@ async def update_delivery_status(
     sale.delivery_status = payload.delivery_status
     await session.flush()
     if sale.delivery_status == "delivered":
-        zapier.delivery_completed({
-            "sale_id": sale.sale_id,
-            "delivery_status": sale.delivery_status,
-        })
+        background_tasks.add_task(
+            zapier.delivery_completed,
+            {"sale_id": sale.sale_id, "delivery_status": sale.delivery_status},
+        )
     return SaleDeliveryStatusResponse(sale_id=sale.sale_id, delivery_status=sale.delivery_status)
 
 
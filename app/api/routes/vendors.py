@@ -1,26 +1,53 @@
 """Vendor endpoints."""
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
 from ..models.domain import Vendor
+from ..responses import PydanticResponse
 from ..schemas.vendors import VendorSummary
 
 router = APIRouter()
 
+# Listings are paged so an unbounded vendor table cannot be loaded at once.
+MAX_PAGE_SIZE = 500
 
-@router.get("", response_model=list[VendorSummary])
+_vendor_summaries_adapter = TypeAdapter(list[VendorSummary])
+
+VENDOR_SUMMARY_COLUMNS = (
+    Vendor.vendor_id,
+    Vendor.name,
+    Vendor.email,
+    Vendor.phone,
+    Vendor.terms,
+    Vendor.address_json["city"].as_string().label("city"),
+    Vendor.address_json["state"].as_string().label("state"),
+    Vendor.active,
+)
+
+
+@router.get("", response_model=list[VendorSummary], response_class=PydanticResponse)
 async def list_vendors(
     q: str | None = None,
+    limit: int = Query(default=MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0),
     session: AsyncSession = Depends(get_session),
-) -> list[VendorSummary]:
-    stmt = select(Vendor).order_by(Vendor.name.asc())
+) -> PydanticResponse:
+    # vendor_id breaks ties between equal names so pages neither skip nor repeat rows.
+    stmt = (
+        select(*VENDOR_SUMMARY_COLUMNS)
+        .order_by(Vendor.name.asc(), Vendor.vendor_id.asc())
+        .limit(limit)
+        .offset(offset)
+    )
     search = (q or "").strip()
     if search:
         pattern = f"%{search}%"
+        # On Postgres each ILIKE is served by a pg_trgm GIN index (migrations 0008, 0015).
         stmt = stmt.where(
             or_(
                 Vendor.name.ilike(pattern),
@@ -29,21 +56,20 @@ async def list_vendors(
             )
         )
 
-    vendors = (await session.execute(stmt)).scalars().all()
-    results: list[VendorSummary] = []
-    for vendor in vendors:
-        address = vendor.address_json or {}
-        results.append(
-            VendorSummary(
-                vendor_id=vendor.vendor_id,
-                name=vendor.name,
-                email=vendor.email,
-                phone=vendor.phone,
-                terms=vendor.terms,
-                city=address.get("city"),
-                state=address.get("state"),
-                active=bool(vendor.active),
-            )
-        )
-
-    return results
+    result = await session.execute(stmt)
+    vendors = _vendor_summaries_adapter.validate_python(
+        [
+            {
+                "vendor_id": row.vendor_id,
+                "name": row.name,
+                "email": row.email,
+                "phone": row.phone,
+                "terms": row.terms,
+                "city": row.city,
+                "state": row.state,
+                "active": bool(row.active),
+            }
+            for row in result
+        ]
+    )
+    return PydanticResponse(vendors)
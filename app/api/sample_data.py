@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import math
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .db import SessionLocal, engine
@@ -26,7 +29,13 @@ class SampleDataSummary:
         return {"created": self.created, "totals": self.totals}
 
 
-SAMPLE_ITEMS = [
+def _freeze(seeds: list[dict[str, Any]]) -> tuple[Mapping[str, Any], ...]:
+    """Return read-only views so the module-level seeds cannot drift at runtime."""
+
+    return tuple(MappingProxyType(seed) for seed in seeds)
+
+
+SAMPLE_ITEMS = _freeze([
     {
         "sku": "DEMO-SOFA",
         "description": "Demo Upholstered Sofa",
@@ -127,17 +136,17 @@ SAMPLE_ITEMS = [
         "short_code": "D010",
         "barcode": "DEMOBARCODE10",
     },
-]
+])
 
-SAMPLE_CUSTOMERS = [
+SAMPLE_CUSTOMERS = _freeze([
     {"name": "Jordan Alvarez", "phone": "555-0100", "email": "jordan@example.com"},
     {"name": "Sasha Patel", "phone": "555-0110", "email": "sasha@example.com"},
     {"name": "Taylor Brooks", "phone": "555-0120", "email": "taylor@example.com"},
     {"name": "Morgan Lee", "phone": "555-0130", "email": "morgan@example.com"},
     {"name": "Devon Clarke", "phone": "555-0140", "email": "devon@example.com"},
-]
+])
 
-SAMPLE_DELIVERY_SALES = [
+SAMPLE_DELIVERY_SALES = _freeze([
     {
         "external_ref": "DELIV-1001",
         "customer_email": "jordan@example.com",
@@ -170,71 +179,121 @@ SAMPLE_DELIVERY_SALES = [
         "delivery_status": "failed",
         "subtotal": 749.00,
     },
-]
+])
 
 LABEL_XML = """<label><text>Sample</text></label>"""
+SAMPLE_LABEL_NAME = "Sample Floor Tag"
+
+SAMPLE_ITEM_SKUS = tuple(item["sku"] for item in SAMPLE_ITEMS)
+SAMPLE_CUSTOMER_EMAILS = tuple(customer["email"] for customer in SAMPLE_CUSTOMERS)
+
+# The label template is the last record seeded, so its presence marks a complete run.
+SAMPLE_MARKER_STMT = select(exists().where(domain.LabelTemplate.name == SAMPLE_LABEL_NAME))
+
+VENDOR_PROBE_STMT = select(domain.Vendor).where(domain.Vendor.name == "Demo Furnishings")
+LOCATION_PROBE_STMT = select(domain.Location).where(domain.Location.name == "Main Showroom")
+ITEMS_PROBE_STMT = select(domain.Item).where(domain.Item.sku.in_(SAMPLE_ITEM_SKUS))
+CUSTOMERS_PROBE_STMT = select(domain.Customer).where(
+    domain.Customer.email.in_(SAMPLE_CUSTOMER_EMAILS)
+)
+
+TOTALS_STMT = select(
+    select(func.count(domain.Vendor.vendor_id)).scalar_subquery().label("vendors"),
+    select(func.count(domain.Location.location_id)).scalar_subquery().label("locations"),
+    select(func.count(domain.Item.item_id)).scalar_subquery().label("items"),
+    select(func.count(domain.Customer.customer_id)).scalar_subquery().label("customers"),
+    select(func.count(domain.Sale.sale_id)).scalar_subquery().label("sales"),
+)
 
 
 async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
-    """Create a deterministic demo dataset when the database is empty."""
+    """Create a deterministic demo dataset when the database is empty.
 
-    async with engine.begin() as conn:
-        await conn.run_sync(domain.Base.metadata.create_all)
+    The schema must already exist; :func:`apply` provisions it before seeding.
+    """
+
+    if await session.scalar(SAMPLE_MARKER_STMT):
+        return SampleDataSummary(created=False, totals=await _sample_totals(session))
+
+    # None of the seed probes need to see pending rows, and every generated key is
+    # obtained through an explicit flush, so autoflush would only add round trips.
+    with session.no_autoflush:
+        created = await _seed_sample_data(session)
+
+    return SampleDataSummary(created=created, totals=await _sample_totals(session))
+
+
+async def _seed_sample_data(session: AsyncSession) -> bool:
+    """Insert whichever sample records are missing and report whether any were added."""
 
     created = False
+    # One timestamp for the whole run keeps every seeded row on the same audit instant.
+    now = utc_now()
 
-    vendor = await session.scalar(
-        select(domain.Vendor).where(domain.Vendor.name == "Demo Furnishings")
-    )
+    # The probes are small indexed lookups; running them on the caller's session keeps
+    # them on its bind and transaction, so rows it already flushed are not re-seeded.
+    vendors = (await session.scalars(VENDOR_PROBE_STMT)).all()
+    locations = (await session.scalars(LOCATION_PROBE_STMT)).all()
+    existing_items = (await session.scalars(ITEMS_PROBE_STMT)).all()
+    existing_customers = (await session.scalars(CUSTOMERS_PROBE_STMT)).all()
+
+    vendor = next(iter(vendors), None)
     if vendor is None:
         vendor = domain.Vendor(name="Demo Furnishings", terms="Net 30")
         session.add(vendor)
         await session.flush()
         created = True
 
-    location = await session.scalar(
-        select(domain.Location).where(domain.Location.name == "Main Showroom")
-    )
+    location = next(iter(locations), None)
     if location is None:
         location = domain.Location(name="Main Showroom", type="floor")
         session.add(location)
         await session.flush()
         created = True
 
-    item_map: dict[str, domain.Item] = {}
-    existing_items = await session.scalars(
-        select(domain.Item).where(domain.Item.sku.in_([item["sku"] for item in SAMPLE_ITEMS]))
-    )
-    for item in existing_items:
-        item_map[item.sku] = item
+    item_map: dict[str, domain.Item] = {item.sku: item for item in existing_items}
 
-    for item_data in SAMPLE_ITEMS:
-        item = item_map.get(item_data["sku"])
-        if item is None:
-            item_kwargs = {key: value for key, value in item_data.items() if key != "barcode"}
-            item = domain.Item(**item_kwargs, tax_code="STANDARD")
-            session.add(item)
-            await session.flush()
-            created = True
-        item_map[item_data["sku"]] = item
+    missing_items = [
+        domain.Item(
+            **{key: value for key, value in item_data.items() if key != "barcode"},
+            tax_code="STANDARD",
+        )
+        for item_data in SAMPLE_ITEMS
+        if item_data["sku"] not in item_map
+    ]
+    if missing_items:
+        session.add_all(missing_items)
+        await session.flush()
+        item_map.update((item.sku, item) for item in missing_items)
+        created = True
+
+    items = tuple(item_map.values())
+    prices = [float(item.price or 0) for item in items]
 
-        barcode = await session.scalar(
-            select(domain.Barcode).where(
-                domain.Barcode.item_id == item.item_id,
-                domain.Barcode.barcode == item_data["barcode"],
+    # Prefetch barcodes and stock rows for every sample item instead of probing per item.
+    item_ids = [item.item_id for item in items]
+    existing_barcodes = {
+        (barcode.item_id, barcode.barcode)
+        for barcode in await session.scalars(
+            select(domain.Barcode).where(domain.Barcode.item_id.in_(item_ids))
+        )
+    }
+    stocked_item_ids = set(
+        await session.scalars(
+            select(domain.Inventory.item_id).where(
+                domain.Inventory.item_id.in_(item_ids),
+                domain.Inventory.location_id == location.location_id,
             )
         )
-        if barcode is None:
+    )
+
+    for item_data in SAMPLE_ITEMS:
+        item = item_map[item_data["sku"]]
+        if (item.item_id, item_data["barcode"]) not in existing_barcodes:
             session.add(domain.Barcode(item_id=item.item_id, barcode=item_data["barcode"]))
             created = True
 
-        inventory = await session.scalar(
-            select(domain.Inventory).where(
-                domain.Inventory.item_id == item.item_id,
-                domain.Inventory.location_id == location.location_id,
-            )
-        )
-        if inventory is None:
+        if item.item_id not in stocked_item_ids:
             session.add(
                 domain.Inventory(
                     item_id=item.item_id,
@@ -246,31 +305,28 @@ async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
             )
             created = True
 
-    customer_map: dict[str, domain.Customer] = {}
-    existing_customers = await session.scalars(
-        select(domain.Customer).where(
-            domain.Customer.email.in_([customer["email"] for customer in SAMPLE_CUSTOMERS])
-        )
-    )
-    for customer in existing_customers:
-        customer_map[customer.email] = customer
+    customer_map: dict[str, domain.Customer] = {
+        customer.email: customer for customer in existing_customers
+    }
 
-    for customer_data in SAMPLE_CUSTOMERS:
-        customer = customer_map.get(customer_data["email"])
-        if customer is None:
-            customer = domain.Customer(**customer_data)
-            session.add(customer)
-            await session.flush()
-            created = True
-        customer_map[customer_data["email"]] = customer
+    missing_customers = [
+        domain.Customer(**customer_data)
+        for customer_data in SAMPLE_CUSTOMERS
+        if customer_data["email"] not in customer_map
+    ]
+    if missing_customers:
+        session.add_all(missing_customers)
+        await session.flush()
+        customer_map.update((customer.email, customer) for customer in missing_customers)
+        created = True
 
     sale = await session.scalar(select(domain.Sale).where(domain.Sale.source == "sample_data"))
     if sale is None:
         sale = domain.Sale(
             customer_id=next(iter(customer_map.values())).customer_id,
             status="open",
-            sale_date=utc_now(),
-            created_at=utc_now(),
+            sale_date=now,
+            created_at=now,
             subtotal=0,
             tax=0,
             total=0,
@@ -286,24 +342,26 @@ async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
         await session.flush()
         created = True
 
-        subtotal = 0.0
-        for item in item_map.values():
-            subtotal += float(item.price)
-            session.add(
-                domain.SaleLine(
-                    sale_id=sale.sale_id,
-                    item_id=item.item_id,
-                    location_id=location.location_id,
-                    qty=1,
-                    unit_price=item.price,
-                    tax=round(float(item.price) * 0.07, 2),
-                )
-            )
+        subtotal = math.fsum(prices)
+        await session.execute(
+            insert(domain.SaleLine),
+            [
+                {
+                    "sale_id": sale.sale_id,
+                    "item_id": item.item_id,
+                    "location_id": location.location_id,
+                    "qty": 1,
+                    "unit_price": item.price,
+                    "tax": round(price * 0.07, 2),
+                    "created_at": now,
+                }
+                for item, price in zip(items, prices)
+            ],
+        )
         sale.subtotal = subtotal
         sale.tax = round(subtotal * 0.07, 2)
         sale.total = sale.subtotal + sale.tax
 
-    item_list = list(item_map.values())
     for index, sale_seed in enumerate(SAMPLE_DELIVERY_SALES):
         existing = await session.scalar(
             select(domain.Sale).where(domain.Sale.external_ref == sale_seed["external_ref"])
@@ -322,8 +380,8 @@ async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
         delivery_sale = domain.Sale(
             customer_id=customer.customer_id,
             status=sale_seed["status"],
-            sale_date=utc_now(),
-            created_at=utc_now(),
+            sale_date=now,
+            created_at=now,
             subtotal=subtotal,
             tax=tax,
             total=total,
@@ -342,8 +400,9 @@ async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
         await session.flush()
         created = True
 
-        if item_list:
-            item = item_list[index % len(item_list)]
+        if items:
+            line_index = index % len(items)
+            item = items[line_index]
             session.add(
                 domain.SaleLine(
                     sale_id=delivery_sale.sale_id,
@@ -351,7 +410,7 @@ async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
                     location_id=location.location_id,
                     qty=1,
                     unit_price=item.price,
-                    tax=round(float(item.price or 0) * 0.07, 2),
+                    tax=round(prices[line_index] * 0.07, 2),
                 )
             )
 
@@ -362,7 +421,7 @@ async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
         po = domain.PurchaseOrder(
             vendor_id=vendor.vendor_id,
             status="open",
-            expected_date=utc_now(),
+            expected_date=now,
             terms="Net 30",
             notes="Sample purchase order",
             created_by="sample.loader",
@@ -372,17 +431,21 @@ async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
         await session.flush()
         created = True
 
-        for item in item_map.values():
-            session.add(
-                domain.POLine(
-                    po_id=po.po_id,
-                    item_id=item.item_id,
-                    description=item.description,
-                    qty_ordered=2,
-                    qty_received=0,
-                    unit_cost=item.unit_cost,
-                )
-            )
+        await session.execute(
+            insert(domain.POLine),
+            [
+                {
+                    "po_id": po.po_id,
+                    "item_id": item.item_id,
+                    "description": item.description,
+                    "qty_ordered": 2,
+                    "qty_received": 0,
+                    "unit_cost": item.unit_cost,
+                    "created_at": now,
+                }
+                for item in items
+            ],
+        )
 
     receipt = await session.scalar(
         select(domain.Receiving).where(domain.Receiving.received_by == "Sample Receiver")
@@ -390,53 +453,61 @@ async def ensure_sample_data(session: AsyncSession) -> SampleDataSummary:
     if receipt is None and po is not None:
         receipt = domain.Receiving(
             po_id=po.po_id,
-            received_at=utc_now(),
+            received_at=now,
             received_by="Sample Receiver",
-            created_at=utc_now(),
+            created_at=now,
             external_ref="SAMPLE-RECEIPT",
         )
         session.add(receipt)
         await session.flush()
         created = True
 
-        po_lines = await session.scalars(select(domain.POLine).where(domain.POLine.po_id == po.po_id))
-        for po_line in po_lines:
-            session.add(
-                domain.ReceivingLine(
-                    receipt_id=receipt.receipt_id,
-                    po_line_id=po_line.po_line_id,
-                    item_id=po_line.item_id,
-                    qty_received=1,
-                    unit_cost=po_line.unit_cost,
-                )
+        po_lines = await session.execute(
+            select(domain.POLine.po_line_id, domain.POLine.item_id, domain.POLine.unit_cost).where(
+                domain.POLine.po_id == po.po_id
             )
+        )
+        receiving_rows = [
+            {
+                "receipt_id": receipt.receipt_id,
+                "po_line_id": po_line.po_line_id,
+                "item_id": po_line.item_id,
+                "qty_received": 1,
+                "unit_cost": po_line.unit_cost,
+                "created_at": now,
+            }
+            for po_line in po_lines
+        ]
+        if receiving_rows:
+            await session.execute(insert(domain.ReceivingLine), receiving_rows)
 
     label_template = await session.scalar(
-        select(domain.LabelTemplate).where(domain.LabelTemplate.name == "Sample Floor Tag")
+        select(domain.LabelTemplate).where(domain.LabelTemplate.name == SAMPLE_LABEL_NAME)
     )
     if label_template is None:
         session.add(
             domain.LabelTemplate(
-                name="Sample Floor Tag",
+                name=SAMPLE_LABEL_NAME,
                 target="item",
                 dymo_label_xml=LABEL_XML,
             )
         )
         created = True
 
-    totals = {
-        "vendors": int(await session.scalar(select(func.count(domain.Vendor.vendor_id))) or 0),
-        "locations": int(await session.scalar(select(func.count(domain.Location.location_id))) or 0),
-        "items": int(await session.scalar(select(func.count(domain.Item.item_id))) or 0),
-        "customers": int(await session.scalar(select(func.count(domain.Customer.customer_id))) or 0),
-        "sales": int(await session.scalar(select(func.count(domain.Sale.sale_id))) or 0),
-    }
+    return created
+
 
-    return SampleDataSummary(created=created, totals=totals)
+async def _sample_totals(session: AsyncSession) -> dict[str, int]:
+    # Every table count comes back in a single round trip.
+    counts = (await session.execute(TOTALS_STMT)).one()
+    return {name: int(value or 0) for name, value in counts._mapping.items()}
 
 
 async def apply() -> SampleDataSummary:
-    """Create the demo dataset using a managed session."""
+    """Create the schema and the demo dataset using a managed session."""
+
+    async with engine.begin() as conn:
+        await conn.run_sync(domain.Base.metadata.create_all)
 
     async with SessionLocal() as session:
         summary = await ensure_sample_data(session)
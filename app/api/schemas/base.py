@@ -0,0 +1,8 @@
+"""Base class for API schemas."""
+from pydantic import BaseModel, ConfigDict
+
+
+class Schema(BaseModel):
+    """Immutable API schema; instances are built once per request and never edited."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
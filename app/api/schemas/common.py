@@ -1,28 +1,46 @@
 """Shared Pydantic models."""
-from __future__ import annotations
-
 from datetime import datetime
-from typing import Any, Literal, Optional
+from decimal import Decimal
+from typing import Literal, Optional
+
+from pydantic import ConfigDict, Field
+from typing_extensions import TypedDict
+
+from .base import Schema
+
 
-from pydantic import BaseModel, Field
+# Mirrors ``delivery_status_enum``. As with truck statuses, the string literal is
+# checked by one hash lookup in pydantic-core; a str enum validated measurably slower.
+DeliveryStatus = Literal["queued", "scheduled", "out_for_delivery", "delivered", "failed"]
 
 
-class HealthResponse(BaseModel):
+# A typed dict keeps unset keys out of the JSON (rather than null) while still giving
+# pydantic-core a concrete schema instead of validating ``Any`` values.
+class HealthDetail(TypedDict, total=False):
+    database_error: str
+    dataset: dict[str, int]
+    dataset_error: str
+    redis_error: str
+
+
+class HealthResponse(Schema):
     ok: bool = True
     fastapi: bool = True
     database: bool = True
     redis: bool | None = None
-    detail: dict[str, Any] = Field(default_factory=dict)
+    detail: HealthDetail = Field(default_factory=dict)
 
 
-class ConfigResponse(BaseModel):
+class ConfigResponse(Schema):
     ocr_provider: str
     dymo_enabled: bool
     short_code_length: int
     station_pin_rotate_minutes: int
 
 
-class ItemSummary(BaseModel):
+class ItemSummary(Schema):
+    model_config = ConfigDict(from_attributes=True)
+
     item_id: int
     sku: str
     description: str
@@ -31,35 +49,35 @@ class ItemSummary(BaseModel):
     unit_cost: float
 
 
-class CustomerSummary(BaseModel):
+class CustomerSummary(Schema):
     customer_id: int
     name: str
     phone: Optional[str] = None
     email: Optional[str] = None
 
 
-class InventoryAdjustRequest(BaseModel):
+class InventoryAdjustRequest(Schema):
     item_id: int
     location_id: int
-    qty_delta: float
+    qty_delta: Decimal
     reason: str
     note: Optional[str] = None
 
 
-class InventoryTransferRequest(BaseModel):
+class InventoryTransferRequest(Schema):
     item_id: int
     from_location_id: int
     to_location_id: int
-    qty: float
+    qty: Decimal
 
 
-class SaleCreateRequest(BaseModel):
+class SaleCreateRequest(Schema):
     customer_id: Optional[int] = None
     created_by: str | None = None
     source: str | None = None
 
 
-class SaleLineRequest(BaseModel):
+class SaleLineRequest(Schema):
     sku: str | None = None
     short_code: str | None = None
     barcode: str | None = None
@@ -67,13 +85,13 @@ class SaleLineRequest(BaseModel):
     location_id: int | None = None
 
 
-class SaleFinalizeResponse(BaseModel):
+class SaleFinalizeResponse(Schema):
     sale_id: int
     status: str
     total: float
 
 
-class SaleUpdateRequest(BaseModel):
+class SaleUpdateRequest(Schema):
     customer_id: Optional[int] = None
     payment_method: Optional[str] = None
     fulfillment_type: Optional[str] = None
@@ -81,41 +99,35 @@ class SaleUpdateRequest(BaseModel):
     lines: list[SaleLineRequest] = Field(default_factory=list)
 
 
-class SaleDeliveryRequest(BaseModel):
+class SaleDeliveryRequest(Schema):
     delivery_requested: bool
     address: dict | None = None
 
 
-class SaleDeliveryStatusUpdate(BaseModel):
-    delivery_status: Literal[
-        "queued",
-        "scheduled",
-        "out_for_delivery",
-        "delivered",
-        "failed",
-    ]
+class SaleDeliveryStatusUpdate(Schema):
+    delivery_status: DeliveryStatus
 
 
-class SaleDeliveryStatusResponse(BaseModel):
+class SaleDeliveryStatusResponse(Schema):
     sale_id: int
     delivery_status: str | None
 
 
-class AttachmentSummary(BaseModel):
+class AttachmentSummary(Schema):
     attachment_id: int
     file_url: str
     kind: str
     created_at: datetime
 
 
-class OCRSaleTicketResponse(BaseModel):
+class OCRSaleTicketResponse(Schema):
     sale_id: int
     parsed_fields: dict
     confidence: float
     review_required: bool
 
 
-class SaleLineSummary(BaseModel):
+class SaleLineSummary(Schema):
     sale_line_id: int
     item_id: int
     sku: str
@@ -126,14 +138,7 @@ class SaleLineSummary(BaseModel):
     short_code: str | None = None
 
 
-class SaleCustomerSummary(BaseModel):
-    customer_id: int
-    name: str
-    phone: Optional[str] = None
-    email: Optional[str] = None
-
-
-class SaleDetailResponse(BaseModel):
+class SaleDetailResponse(Schema):
     sale_id: int
     status: str
     subtotal: float
@@ -142,23 +147,23 @@ class SaleDetailResponse(BaseModel):
     ocr_confidence: float
     ocr_fields: dict
     attachments: list[AttachmentSummary]
-    customer: SaleCustomerSummary | None = None
+    customer: CustomerSummary | None = None
     payment_method: str | None = None
     fulfillment_type: str | None = None
     delivery_fee: float = 0
     lines: list[SaleLineSummary] = []
 
 
-class LabelRenderRequest(BaseModel):
+class LabelRenderRequest(Schema):
     template_id: int
     context: dict
 
 
-class LabelRenderResponse(BaseModel):
+class LabelRenderResponse(Schema):
     template_id: int
     xml: str = Field(..., description="DYMO XML ready for client printing")
 
 
-class StationPinResponse(BaseModel):
+class StationPinResponse(Schema):
     pin: str
     expires_at: datetime
@@ -1,31 +1,41 @@
 """Dashboard response models."""
-from __future__ import annotations
+from pydantic import ConfigDict, Field, RootModel
+from pydantic.dataclasses import dataclass
 
-from pydantic import BaseModel, Field
+from .base import Schema
 
+# Rows built in loops for every dashboard request are slotted dataclasses, so no
+# per-instance ``__dict__`` is allocated; only the response envelope is a model.
+_ROW_CONFIG = ConfigDict(extra="ignore", populate_by_name=True)
 
-class DashboardMetric(BaseModel):
+
+@dataclass(slots=True, frozen=True, config=_ROW_CONFIG)
+class DashboardMetric:
     label: str
     value: int
     change: str
     status: str
+    approximate: bool = False
 
 
-class DashboardActivity(BaseModel):
+@dataclass(slots=True, frozen=True, config=_ROW_CONFIG)
+class DashboardActivity:
     title: str
     description: str
     time: str
     href: str | None = None
 
 
-class DashboardSystemStatus(BaseModel):
+@dataclass(slots=True, frozen=True, config=_ROW_CONFIG)
+class DashboardSystemStatus:
     label: str
     state: str
     badge: str
     description: str
 
 
-class DashboardDrilldownItem(BaseModel):
+@dataclass(slots=True, frozen=True, config=_ROW_CONFIG)
+class DashboardDrilldownItem:
     id: str
     title: str
     subtitle: str
@@ -34,25 +44,32 @@ class DashboardDrilldownItem(BaseModel):
     badge_class: str = Field(alias="badgeClass")
     href: str | None = None
 
-    model_config = {"populate_by_name": True}
 
+class DashboardDrilldowns(RootModel[dict[str, list[DashboardDrilldownItem]]]):
+    """Drilldown rows keyed by their camelCase panel name.
+
+    A single mapping shares one list validator across every panel instead of
+    declaring a separately aliased optional field per panel.
+    """
+
+    @property
+    def open_sales(self) -> list[DashboardDrilldownItem] | None:
+        return self.root.get("openSales")
+
+    @property
+    def draft_ocr_tickets(self) -> list[DashboardDrilldownItem] | None:
+        return self.root.get("draftOcrTickets")
 
-class DashboardDrilldowns(BaseModel):
-    open_sales: list[DashboardDrilldownItem] | None = Field(default=None, alias="openSales")
-    draft_ocr_tickets: list[DashboardDrilldownItem] | None = Field(
-        default=None, alias="draftOcrTickets"
-    )
-    inbound_purchase_orders: list[DashboardDrilldownItem] | None = Field(
-        default=None, alias="inboundPurchaseOrders"
-    )
-    active_receivers: list[DashboardDrilldownItem] | None = Field(
-        default=None, alias="activeReceivers"
-    )
+    @property
+    def inbound_purchase_orders(self) -> list[DashboardDrilldownItem] | None:
+        return self.root.get("inboundPurchaseOrders")
 
-    model_config = {"populate_by_name": True}
+    @property
+    def active_receivers(self) -> list[DashboardDrilldownItem] | None:
+        return self.root.get("activeReceivers")
 
 
-class DashboardSummaryResponse(BaseModel):
+class DashboardSummaryResponse(Schema):
     metrics: list[DashboardMetric]
     activity: list[DashboardActivity]
     system_status: list[DashboardSystemStatus]
@@ -1,27 +1,21 @@
 """Schemas for spreadsheet import endpoints."""
-from __future__ import annotations
-
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
-
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 
-class ImportCountersSchema(BaseModel):
-    vendors: int = 0
-    locations: int = 0
-    items: int = 0
-    barcodes: int = 0
-    inventory_records: int = Field(0, alias="inventoryRecords")
-    customers: int = 0
-    sales: int = 0
-    purchase_orders: int = Field(0, alias="purchaseOrders")
-    receivings: int = 0
-    warnings: list[str] = Field(default_factory=list)
 
-    model_config = {
-        "populate_by_name": True,
-        "json_schema_extra": {
+# Counters are only ever built by the import route and serialized, so they are a slotted
+# dataclass nested in the response model rather than a model of their own.
+# Alias strings are identifier-like literals, which CPython already interns at compile
+# time; the import route passes alias keys, so pydantic-core's alias-first lookup hits
+# on the first probe without falling back to the field name.
+@dataclass(
+    slots=True,
+    frozen=True,
+    config=ConfigDict(
+        json_schema_extra={
             "example": {
                 "vendors": 1,
                 "locations": 1,
@@ -35,7 +29,19 @@ class ImportCountersSchema(BaseModel):
                 "warnings": ["Skipped item because of missing SKU"],
             }
         },
-    }
+    ),
+)
+class ImportCountersSchema:
+    vendors: int = 0
+    locations: int = 0
+    items: int = 0
+    barcodes: int = 0
+    inventory_records: int = Field(0, alias="inventoryRecords")
+    customers: int = 0
+    sales: int = 0
+    purchase_orders: int = Field(0, alias="purchaseOrders")
+    receivings: int = 0
+    warnings: list[str] = Field(default_factory=list)
 
 
 class SpreadsheetImportResponse(BaseModel):
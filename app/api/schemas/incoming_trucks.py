@@ -1,12 +1,14 @@
 """Schemas for incoming truck tracking."""
-from __future__ import annotations
-
 from datetime import datetime
+from decimal import Decimal
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+# String literals mirror ``incoming_truck_status_enum`` on the wire and in the database.
+# pydantic-core validates them with a single hash lookup, so an int-coded enum would
+# only add a Python serializer callback per value.
 IncomingTruckStatus = Literal["scheduled", "arrived", "unloading", "completed", "cancelled"]
 IncomingTruckUpdateType = Literal["status", "note", "line_progress"]
 
@@ -14,7 +16,7 @@ IncomingTruckUpdateType = Literal["status", "note", "line_progress"]
 class IncomingTruckLineCreate(BaseModel):
     po_line_id: int
     item_id: int
-    qty_expected: float | None = None
+    qty_expected: Decimal | None = None
     description: str | None = None
 
 
@@ -43,7 +45,7 @@ class IncomingTruckUpdateCreate(BaseModel):
     status: IncomingTruckStatus | None = None
     po_line_id: int | None = None
     item_id: int | None = None
-    quantity: float | None = None
+    quantity: Decimal | None = None
 
 
 class IncomingTruckUpdateRead(BaseModel):
@@ -1,13 +1,11 @@
 """Invoice API schemas."""
-from __future__ import annotations
-
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import Schema
 
 
-class InvoiceSummary(BaseModel):
+class InvoiceSummary(Schema):
     """Summarized invoice/bill details for listings."""
 
     invoice_id: int
@@ -1,15 +1,12 @@
 """Schemas for item detail responses."""
-from __future__ import annotations
-
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
-
+from .base import Schema
 from .common import ItemSummary
 
 
-class ItemLocationInfo(BaseModel):
+class ItemLocationInfo(Schema):
     """Inventory information for an item at a specific location."""
 
     location_id: int
@@ -18,7 +15,7 @@ class ItemLocationInfo(BaseModel):
     qty_reserved: float
 
 
-class IncomingPurchaseInfo(BaseModel):
+class IncomingPurchaseInfo(Schema):
     """Purchase order information for incoming inventory."""
 
     po_id: int
@@ -30,7 +27,7 @@ class IncomingPurchaseInfo(BaseModel):
     qty_remaining: float
 
 
-class ItemDetailResponse(BaseModel):
+class ItemDetailResponse(Schema):
     """Detailed information about an item including inventory insights."""
 
     item: ItemSummary
@@ -39,7 +36,7 @@ class ItemDetailResponse(BaseModel):
     incoming: list[IncomingPurchaseInfo]
 
 
-class CatalogLocationInfo(BaseModel):
+class CatalogLocationInfo(Schema):
     """Location snapshot for catalog listings."""
 
     location_id: int
@@ -47,7 +44,7 @@ class CatalogLocationInfo(BaseModel):
     qty_on_hand: float
 
 
-class CatalogItemSummary(BaseModel):
+class CatalogItemSummary(Schema):
     """Simplified item summary for catalog lookups."""
 
     item_id: int
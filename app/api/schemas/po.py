@@ -1,12 +1,10 @@
 """Schemas related to purchase orders."""
-from __future__ import annotations
-
 from datetime import datetime
 
-from pydantic import BaseModel
+from .base import Schema
 
 
-class POLineSearchResult(BaseModel):
+class POLineSearchResult(Schema):
     po_id: int
     po_number: str
     po_line_id: int
@@ -17,7 +15,7 @@ class POLineSearchResult(BaseModel):
     qty_remaining: float
 
 
-class PurchaseOrderSummary(BaseModel):
+class PurchaseOrderSummary(Schema):
     po_id: int
     status: str
     vendor_name: str | None = None
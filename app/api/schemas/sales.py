@@ -1,11 +1,9 @@
-from __future__ import annotations
-
 from datetime import datetime
 
-from pydantic import BaseModel
+from .base import Schema
 
 
-class SaleDashboardEntry(BaseModel):
+class SaleDashboardEntry(Schema):
     sale_id: int
     ticket_number: str | None = None
     customer_name: str | None = None
@@ -16,6 +14,6 @@ class SaleDashboardEntry(BaseModel):
     created_by: str | None = None
 
 
-class SalesDashboardResponse(BaseModel):
+class SalesDashboardResponse(Schema):
     open_sales: list[SaleDashboardEntry]
     fulfilled_sales: list[SaleDashboardEntry]
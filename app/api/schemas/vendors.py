@@ -1,12 +1,10 @@
 """Vendor API schemas."""
-from __future__ import annotations
-
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import Schema
 
 
-class VendorSummary(BaseModel):
+class VendorSummary(Schema):
     """Lightweight vendor listing information."""
 
     vendor_id: int
@@ -6,7 +6,7 @@ import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 from fastapi import HTTPException
 
@@ -19,27 +19,21 @@ from ..services.importer import (
 )
 
 
+_COUNTER_FIELDS: tuple[str, ...] = (
+    "vendors",
+    "locations",
+    "items",
+    "barcodes",
+    "inventory_records",
+    "customers",
+    "sales",
+    "purchase_orders",
+    "receivings",
+)
+
+
 def _format_counter_lines(counters: ImportCounters) -> list[str]:
-    entries: list[str] = []
-    if counters.vendors:
-        entries.append(f"vendors={counters.vendors}")
-    if counters.locations:
-        entries.append(f"locations={counters.locations}")
-    if counters.items:
-        entries.append(f"items={counters.items}")
-    if counters.barcodes:
-        entries.append(f"barcodes={counters.barcodes}")
-    if counters.inventory_records:
-        entries.append(f"inventory_records={counters.inventory_records}")
-    if counters.customers:
-        entries.append(f"customers={counters.customers}")
-    if counters.sales:
-        entries.append(f"sales={counters.sales}")
-    if counters.purchase_orders:
-        entries.append(f"purchase_orders={counters.purchase_orders}")
-    if counters.receivings:
-        entries.append(f"receivings={counters.receivings}")
-    return entries
+    return [f"{name}={value}" for name in _COUNTER_FIELDS if (value := getattr(counters, name))]
 
 
 def _print_summary(
@@ -108,19 +102,36 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = build_parser()
+
+
+def _run(coro: Any) -> Any:
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        # uvloop ships with uvicorn[standard] but not on every platform.
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    # asyncio.Runner is 3.11+; older interpreters switch the loop policy instead.
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 async def _run_import(
     path: Path, dry_run: bool, dataset: str | None, replace_inventory: bool
 ) -> ImportResult:
-    data = path.read_bytes()
     async with SessionLocal() as session:
         try:
-            result = await import_spreadsheet(
-                session,
-                data,
-                path.name,
-                dataset=dataset,
-                replace_inventory=replace_inventory,
-            )
+            with path.open("rb") as data:
+                result = await import_spreadsheet(
+                    session,
+                    data,
+                    path.name,
+                    dataset=dataset,
+                    replace_inventory=replace_inventory,
+                )
             if dry_run:
                 await session.rollback()
             else:
@@ -136,17 +147,14 @@ async def _run_import(
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = _PARSER.parse_args(argv)
 
     path = Path(args.spreadsheet)
     if not path.is_file():
-        parser.error(f"Spreadsheet file not found: {path}")
+        _PARSER.error(f"Spreadsheet file not found: {path}")
 
     try:
-        result = asyncio.run(
-            _run_import(path, args.dry_run, args.dataset, args.replace_inventory)
-        )
+        result = _run(_run_import(path, args.dry_run, args.dataset, args.replace_inventory))
     except RuntimeError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
@@ -7,7 +7,8 @@ import hmac
 import json
 import time
 from dataclasses import dataclass
-from typing import Annotated, Any, Mapping
+from functools import lru_cache
+from typing import AbstractSet, Annotated, Any, Mapping
 
 import httpx
 from fastapi import Depends, Header, HTTPException, status
@@ -17,6 +18,7 @@ from .config import Settings, get_settings
 WWW_AUTH_HEADER = {"WWW-Authenticate": "Bearer"}
 _JWKS_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
 _JWK_KEY_CACHE: dict[tuple[str, str], Mapping[str, Any]] = {}
+_AUTH_BACKEND: AuthBackend | None = None
 _HMAC_ALGORITHMS = {
     "HS256": hashlib.sha256,
     "HS384": hashlib.sha384,
@@ -42,7 +44,7 @@ def _b64url_decode(segment: str) -> bytes:
 @dataclass
 class User:
     id: str
-    roles: set[str]
+    roles: AbstractSet[str]
 
 
 class AuthBackend:
@@ -52,6 +54,7 @@ class AuthBackend:
         self.settings = settings
         self._role_mapping = self._normalise_role_mapping(settings.auth_role_mapping)
         self._static_jwks = self._parse_static_jwks(settings.auth_jwks_static)
+        self._mock_roles = frozenset(settings.auth_mock_roles).union(settings.auth_default_roles)
 
     def __call__(self, authorization: str | None) -> User:
         provider = self.settings.auth_provider
@@ -74,9 +77,7 @@ class AuthBackend:
         return self._user_from_payload(payload)
 
     def _mock_user(self) -> User:
-        roles = set(self.settings.auth_mock_roles)
-        roles.update(self.settings.auth_default_roles)
-        return User(id="demo", roles=roles)
+        return User(id="demo", roles=self._mock_roles)
 
     def _extract_token(self, authorization: str | None) -> str:
         if not authorization:
@@ -470,16 +471,32 @@ def _fetch_jwks(url: str, cache_seconds: int) -> dict[str, Any]:
     return jwks
 
 
+def _auth_backend(settings: Settings) -> AuthBackend:
+    """Return the backend for ``settings``, rebuilding it only when the settings change."""
+
+    global _AUTH_BACKEND
+    # Settings are unhashable, so the cache holds one backend keyed by settings identity.
+    if _AUTH_BACKEND is None or _AUTH_BACKEND.settings is not settings:
+        _AUTH_BACKEND = AuthBackend(settings)
+    return _AUTH_BACKEND
+
+
 def _get_user(
     authorization: Annotated[str | None, Header()] = None,
     settings: Settings = Depends(get_settings),
 ) -> User:
-    return AuthBackend(settings)(authorization)
+    return _auth_backend(settings)(authorization)
 
 
 def require_roles(*required: str):
+    # Routes declaring the same roles, in any order, share one dependency callable.
+    return _role_dependency(frozenset(required))
+
+
+@lru_cache(maxsize=None)
+def _role_dependency(required_roles: frozenset[str]):
     async def dependency(user: User = Depends(_get_user)) -> User:
-        if not set(required).intersection(user.roles):
+        if required_roles.isdisjoint(user.roles):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="insufficient_role")
         return user
 
@@ -489,6 +506,8 @@ def require_roles(*required: str):
 def reset_security_state() -> None:
     """Clear cached authentication state (intended for testing)."""
 
+    global _AUTH_BACKEND
+    _AUTH_BACKEND = None
     _JWKS_CACHE.clear()
     _JWK_KEY_CACHE.clear()
 
@@ -1,8 +1,9 @@
 """Service exports."""
-from . import accounting, labels, shortcode, storage, zapier  # noqa: F401
+from . import accounting, barcodes, labels, shortcode, storage, zapier  # noqa: F401
 
 __all__ = [
     "accounting",
+    "barcodes",
     "labels",
     "shortcode",
     "storage",
@@ -0,0 +1,93 @@
+"""Short-lived in-process cache of barcode to item id lookups.
+
+Scanner workflows re-scan the same label within seconds (double beeps, retries),
+so repeated lookups are answered from memory for a short window. Every ORM write
+to ``barcode`` invalidates the cache in this process when it is flushed and again
+when it commits, so a miss cached by another request in between does not outlive
+the write; other worker processes see the change once their entry expires. Misses
+expire sooner than hits so a barcode added elsewhere is found quickly.
+"""
+from __future__ import annotations
+
+import time
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ..models.base import Base
+from ..models.domain import Barcode
+
+BARCODE_CACHE_TTL_SECONDS = 30.0
+BARCODE_MISS_TTL_SECONDS = 2.0
+BARCODE_CACHE_MAX_ENTRIES = 4096
+
+_BARCODE_ITEM_CACHE: dict[str, tuple[float, int | None]] = {}
+# ``Session.info`` key marking a transaction that wrote barcodes and has not committed.
+_PENDING_FLAG = "barcodes_written"
+
+
+async def resolve_barcode_item_id(session: AsyncSession, barcode: str) -> int | None:
+    """Return the item id for ``barcode`` or ``None`` when it is unknown."""
+
+    now = time.monotonic()
+    cached = _BARCODE_ITEM_CACHE.get(barcode)
+    if cached and now < cached[0]:
+        return cached[1]
+
+    record = await session.get(Barcode, barcode)
+    item_id = record.item_id if record else None
+
+    # Dicts keep insertion order, so popping and re-adding keeps the oldest entry first.
+    _BARCODE_ITEM_CACHE.pop(barcode, None)
+    if len(_BARCODE_ITEM_CACHE) >= BARCODE_CACHE_MAX_ENTRIES:
+        del _BARCODE_ITEM_CACHE[next(iter(_BARCODE_ITEM_CACHE))]
+    ttl = BARCODE_CACHE_TTL_SECONDS if item_id is not None else BARCODE_MISS_TTL_SECONDS
+    _BARCODE_ITEM_CACHE[barcode] = (now + ttl, item_id)
+    return item_id
+
+
+def clear_barcode_cache() -> None:
+    """Drop every cached barcode lookup."""
+
+    _BARCODE_ITEM_CACHE.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _forget_flushed_barcodes(session: Session, flush_context: Any) -> None:
+    # The collections still hold the pre-flush state here.
+    changed = chain(session.new, session.dirty, session.deleted)
+    if any(isinstance(instance, Barcode) for instance in changed):
+        # A primary key change leaves the old key behind, so clear rather than pop.
+        clear_barcode_cache()
+        session.info[_PENDING_FLAG] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _forget_bulk_barcode_writes(orm_execute_state: ORMExecuteState) -> None:
+    state = orm_execute_state
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    if any(mapper.class_ is Barcode for mapper in state.all_mappers):
+        clear_barcode_cache()
+        state.session.info[_PENDING_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_barcodes(session: Session) -> None:
+    # Lookups from other sessions between flush and commit may have cached the old row.
+    if session.info.pop(_PENDING_FLAG, False):
+        clear_barcode_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_barcodes(session: Session) -> None:
+    session.info.pop(_PENDING_FLAG, None)
+
+
+@event.listens_for(Base.metadata, "after_create")
+@event.listens_for(Base.metadata, "after_drop")
+def _forget_schema_changes(target: Any, connection: Any, **kw: Any) -> None:
+    clear_barcode_cache()
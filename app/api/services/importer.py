@@ -7,7 +7,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Any, Iterable, Mapping
+from typing import Any, BinaryIO, Iterable, Mapping
 
 from fastapi import HTTPException, status
 
@@ -141,7 +141,7 @@ class ImportResult:
 
 async def import_spreadsheet(
     session: AsyncSession,
-    data: bytes,
+    data: bytes | BinaryIO,
     filename: str,
     dataset: str | None = None,
     *,
@@ -828,7 +828,7 @@ async def _ensure_customer(
 
 
 def extract_datasets(
-    data: bytes, filename: str, preferred_entity: str | None = None
+    data: bytes | BinaryIO, filename: str, preferred_entity: str | None = None
 ) -> dict[str, list[dict[str, Any]]]:
     if not filename.lower().endswith(".xlsx"):
         raise HTTPException(
@@ -841,51 +841,57 @@ def extract_datasets(
             detail="XLSX support requires the 'openpyxl' package",
         )
 
-    workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    # Open files are read in place so callers need not buffer the whole workbook.
+    source = io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+    workbook = load_workbook(source, read_only=True, data_only=True)
     grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
 
-    for worksheet in workbook.worksheets:
-        rows_iter = worksheet.iter_rows(values_only=True)
-        headers = None
-        normalised_headers: list[str] = []
-        for candidate in rows_iter:
-            if candidate is None:
-                continue
-            normalised_candidate = [
-                _normalise_header(str(header)) if header is not None else ""
-                for header in candidate
-            ]
-            if not _row_has_values(candidate):
-                continue
-            if not _row_matches_supported_headers(normalised_candidate):
+    try:
+        for worksheet in workbook.worksheets:
+            rows_iter = worksheet.iter_rows(values_only=True)
+            headers = None
+            normalised_headers: list[str] = []
+            for candidate in rows_iter:
+                if candidate is None:
+                    continue
+                normalised_candidate = [
+                    _normalise_header(str(header)) if header is not None else ""
+                    for header in candidate
+                ]
+                if not _row_has_values(candidate):
+                    continue
+                if not _row_matches_supported_headers(normalised_candidate):
+                    continue
+                headers = candidate
+                normalised_headers = normalised_candidate
+                break
+            if headers is None:
                 continue
-            headers = candidate
-            normalised_headers = normalised_candidate
-            break
-        if headers is None:
-            continue
 
-        entity_key = _identify_entity(
-            worksheet.title, normalised_headers, preferred_entity=preferred_entity
-        )
-        if entity_key is None:
-            continue
-
-        aliases = FIELD_ALIASES.get(entity_key, {})
+            entity_key = _identify_entity(
+                worksheet.title, normalised_headers, preferred_entity=preferred_entity
+            )
+            if entity_key is None:
+                continue
 
-        for row in rows_iter:
-            raw_row: dict[str, Any] = {}
-            empty = True
-            for index, header in enumerate(normalised_headers):
-                if not header:
+            aliases = FIELD_ALIASES.get(entity_key, {})
+
+            for row in rows_iter:
+                raw_row: dict[str, Any] = {}
+                empty = True
+                for index, header in enumerate(normalised_headers):
+                    if not header:
+                        continue
+                    value = row[index] if index < len(row) else None
+                    if _has_cell_value(value):
+                        empty = False
+                    raw_row[header] = value
+                if empty:
                     continue
-                value = row[index] if index < len(row) else None
-                if _has_cell_value(value):
-                    empty = False
-                raw_row[header] = value
-            if empty:
-                continue
-            grouped[entity_key].append(_prepare_row(entity_key, raw_row))
+                grouped[entity_key].append(_prepare_row(entity_key, raw_row))
+    finally:
+        # Read-only workbooks keep the source open until closed, even when parsing fails.
+        workbook.close()
 
     return grouped
 
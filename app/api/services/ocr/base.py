@@ -25,3 +25,6 @@ class OcrProvider(Protocol):
 
     async def analyze(self, image_path: str) -> OcrDocument:
         ...
+
+    async def analyze_bytes(self, content: bytes) -> OcrDocument:
+        ...
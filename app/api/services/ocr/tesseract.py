@@ -1,29 +1,131 @@
-"""Local pytesseract provider."""
+"""Local Tesseract provider backed by a pool of persistent worker processes."""
 from __future__ import annotations
 
 import asyncio
+import io
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterable
 
 import pytesseract
-from PIL import Image
+from PIL import Image, ImageOps
 
+from ...config import get_settings
 from .base import OcrDocument, OcrProvider, OcrWord
 
+# Long-side cap in pixels; a letter page at 300 DPI is 3300 px tall.
+OCR_MAX_DIMENSION = 3500
+
+# Per-process tesserocr handle, created once by ``_init_worker``.
+_tess_api: Any = None
+
+
+def _init_worker() -> None:
+    """Keep tesseract single-threaded and load its language model once per worker."""
+
+    global _tess_api
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    try:
+        from tesserocr import PyTessBaseAPI  # type: ignore
+    except ImportError:
+        # Fall back to pytesseract, which starts a tesseract process per call.
+        return
+    _tess_api = PyTessBaseAPI()
+
+
+def _preprocess(image: Image.Image) -> Image.Image:
+    """Upright, grayscale and contrast-stretch an image and cap its size for tesseract."""
+
+    image = ImageOps.autocontrast(ImageOps.exif_transpose(image).convert("L"))
+    if max(image.size) > OCR_MAX_DIMENSION:
+        image.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.Resampling.LANCZOS)
+    return image
+
+
+def _ocr_pil(image: Image.Image) -> Iterable[tuple[str, Any]]:
+    if _tess_api is not None:
+        _tess_api.SetImage(image)
+        return _tess_api.MapWordConfidences()
+    data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+    return zip(data.get("text", []), data.get("conf", []))
+
+
+def _to_document(pairs: Iterable[tuple[str, Any]]) -> OcrDocument:
+    words = []
+    for text, conf in pairs:
+        try:
+            conf_value = float(conf) / 100 if conf not in {"-1", ""} else 0.0
+        except ValueError:
+            conf_value = 0.0
+        if text.strip():
+            words.append(OcrWord(text=text.strip(), confidence=conf_value))
+    return OcrDocument(words=words)
+
+
+def _analyze_image(image_path: str) -> OcrDocument:
+    """OCR an image, or every image named in a ``.txt`` file list.
+
+    A file list holds 300 DPI PDF renders, which are already upright and sized for
+    tesseract, so only standalone images are preprocessed.
+    """
+
+    if not image_path.endswith(".txt"):
+        with Image.open(image_path) as image:
+            return _to_document(_ocr_pil(_preprocess(image)))
+    if _tess_api is None:
+        # tesseract reads a .txt input as a list of images and OCRs them in one run.
+        data = pytesseract.image_to_data(image_path, output_type=pytesseract.Output.DICT)
+        return _to_document(zip(data.get("text", []), data.get("conf", [])))
+    with open(image_path) as fh:
+        page_paths = [line.strip() for line in fh if line.strip()]
+    pairs: list[tuple[str, Any]] = []
+    for page_path in page_paths:
+        with Image.open(page_path) as page:
+            pairs.extend(_ocr_pil(page))
+    return _to_document(pairs)
+
+
+def _analyze_bytes(content: bytes) -> OcrDocument:
+    with Image.open(io.BytesIO(content)) as image:
+        return _to_document(_ocr_pil(_preprocess(image)))
+
+
+@lru_cache(maxsize=1)
+def get_ocr_executor() -> ProcessPoolExecutor:
+    """Return the shared process pool used for Tesseract OCR."""
+
+    settings = get_settings()
+    workers = settings.ocr_workers or max(1, (os.cpu_count() or 1) // 4)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
 
 class TesseractProvider(OcrProvider):
-    """Simple pytesseract wrapper returning words with confidence."""
+    """Simple Tesseract wrapper returning words with confidence."""
+
+    def __init__(self, executor: Executor | None = None) -> None:
+        self._executor = executor
 
     async def analyze(self, image_path: str) -> OcrDocument:
-        def _process() -> OcrDocument:
-            image = Image.open(image_path)
-            data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
-            words = []
-            for text, conf in zip(data.get("text", []), data.get("conf", [])):
-                try:
-                    conf_value = float(conf) / 100 if conf not in {"-1", ""} else 0.0
-                except ValueError:
-                    conf_value = 0.0
-                if text.strip():
-                    words.append(OcrWord(text=text.strip(), confidence=conf_value))
-            return OcrDocument(words=words)
-
-        return await asyncio.to_thread(_process)
+        return await self._run(_analyze_image, image_path)
+
+    async def analyze_bytes(self, content: bytes) -> OcrDocument:
+        return await self._run(_analyze_bytes, content)
+
+    async def _run(self, func: Callable[[Any], OcrDocument], arg: Any) -> OcrDocument:
+        if self._executor is None:
+            return await asyncio.to_thread(func, arg)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, arg)
+
+
+@lru_cache(maxsize=1)
+def get_tesseract_provider() -> TesseractProvider:
+    """Return the provider shared by all requests; its workers keep tesseract warm."""
+
+    return TesseractProvider(executor=get_ocr_executor())
@@ -19,11 +19,17 @@ class TextractProvider(OcrProvider):
         self.client = session.client("textract")
 
     async def analyze(self, image_path: str) -> OcrDocument:
-        def _process() -> OcrDocument:
+        def _read() -> bytes:
             with open(image_path, "rb") as fh:
-                result = self.client.analyze_document(
-                    Document={"Bytes": fh.read()}, FeatureTypes=["FORMS", "TABLES"]
-                )
+                return fh.read()
+
+        return await self.analyze_bytes(await asyncio.to_thread(_read))
+
+    async def analyze_bytes(self, content: bytes) -> OcrDocument:
+        def _process() -> OcrDocument:
+            result = self.client.analyze_document(
+                Document={"Bytes": content}, FeatureTypes=["FORMS", "TABLES"]
+            )
             words: list[OcrWord] = []
             for block in result.get("Blocks", []):
                 if block.get("BlockType") == "WORD":
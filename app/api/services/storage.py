@@ -1,6 +1,8 @@
 """S3 helper for storing attachments."""
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from typing import BinaryIO
 
 import boto3
@@ -41,6 +43,35 @@ class StorageService:
             raise StorageError("storage_upload_failed") from exc
         return f"{settings.s3_endpoint}/{self.bucket}/{key}"
 
+    async def aupload_file(self, *, key: str, fileobj: BinaryIO, content_type: str) -> str:
+        """Run :meth:`upload_file` in a worker thread so callers can overlap other work."""
+
+        return await asyncio.to_thread(
+            self.upload_file, key=key, fileobj=fileobj, content_type=content_type
+        )
+
+    def upload_path(self, *, key: str, path: str | Path, content_type: str) -> str:
+        """Open ``path`` and upload it so the file handle never leaves the calling thread."""
+
+        with open(path, "rb") as fh:
+            return self.upload_file(key=key, fileobj=fh, content_type=content_type)
+
+    async def aupload_path(self, *, key: str, path: str | Path, content_type: str) -> str:
+        return await asyncio.to_thread(
+            self.upload_path, key=key, path=path, content_type=content_type
+        )
+
+    def delete_file(self, *, key: str) -> None:
+        try:
+            self.client.delete_object(Bucket=self.bucket, Key=key)
+        except EndpointConnectionError as exc:
+            raise StorageError("storage_endpoint_unreachable") from exc
+        except (BotoCoreError, ClientError) as exc:
+            raise StorageError("storage_delete_failed") from exc
+
+    async def adelete_file(self, *, key: str) -> None:
+        await asyncio.to_thread(self.delete_file, key=key)
+
     def _ensure_bucket(self) -> None:
         if self._bucket_verified:
             return
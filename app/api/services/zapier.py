@@ -1,4 +1,9 @@
-"""Zapier webhook client with retries."""
+"""Zapier webhook client with retries.
+
+The event helpers are coroutines meant to be scheduled with FastAPI's
+``BackgroundTasks``; they run after the response is sent and the request
+transaction has committed.
+"""
 from __future__ import annotations
 
 import asyncio
@@ -27,13 +32,13 @@ async def post_with_retry(url: str, payload: dict[str, Any], *, attempts: int =
                 delay *= 2
 
 
-def ticket_finalized(payload: dict[str, Any]) -> None:
+async def ticket_finalized(payload: dict[str, Any]) -> None:
     if not settings.zap_ticket_finalized_url:
         return
-    asyncio.create_task(post_with_retry(settings.zap_ticket_finalized_url, payload))
+    await post_with_retry(settings.zap_ticket_finalized_url, payload)
 
 
-def delivery_completed(payload: dict[str, Any]) -> None:
+async def delivery_completed(payload: dict[str, Any]) -> None:
     if not settings.zap_delivery_completed_url:
         return
-    asyncio.create_task(post_with_retry(settings.zap_delivery_completed_url, payload))
+    await post_with_retry(settings.zap_delivery_completed_url, payload)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from decimal import Decimal
+
 import pytest
+from sqlalchemy import func, select
 
 from .. import sample_data
 from ..db import SessionLocal, engine
 from ..models.base import Base
+from ..models.domain import Sale
+from ..routes.dashboard import _safe_scalar
+from ..utils import schema
 
 
 @pytest.mark.asyncio
@@ -27,6 +33,105 @@ async def test_dashboard_summary_includes_drilldowns(client) -> None:
     first_sale = drilldowns["openSales"][0]
     assert first_sale["title"].startswith("Sale ")
     assert first_sale["href"].startswith("/dashboard/sales/")
+    assert any(
+        not sale["subtitle"].startswith("Walk-in customer") for sale in drilldowns["openSales"]
+    )
 
     assert "activeReceivers" in drilldowns
     assert isinstance(drilldowns["activeReceivers"], list)
+    assert not any(metric["approximate"] for metric in payload["metrics"])
+
+
+@pytest.mark.asyncio
+async def test_dashboard_summary_skips_tables_missing_from_cache(client) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+    known_tables = await schema.refresh_known_tables()
+    assert "sale" not in known_tables
+
+    try:
+        response = await client.get("/dashboard/summary")
+        assert response.status_code == 200
+        payload = response.json()
+        assert [metric["value"] for metric in payload["metrics"]] == [0, 0, 0, 0]
+        assert payload["drilldowns"]["openSales"] == []
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        assert await schema.table_exists("sale")
+    finally:
+        schema._known_tables = None
+
+
+@pytest.mark.asyncio
+async def test_table_cache_picks_up_tables_created_elsewhere(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+    await schema.refresh_known_tables()
+    try:
+        # Creating a single table skips the metadata events, like an external migration.
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.tables["vendor"].create)
+
+        assert not await schema.table_exists("vendor")
+
+        monkeypatch.setattr(schema, "KNOWN_TABLES_TTL_SECONDS", 0.0)
+        assert await schema.table_exists("vendor")
+
+        schema.forget_table("vendor")
+        assert await schema.table_exists("vendor")
+    finally:
+        schema._known_tables = None
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest.mark.asyncio
+async def test_safe_scalar_preserves_zero_results() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        session.add(Sale(status="open", total=Decimal("0")))
+        await session.flush()
+
+        total = await _safe_scalar(session, select(func.sum(Sale.total)), default=-1, table="sale")
+        assert total == Decimal("0")
+        assert isinstance(total, Decimal)
+
+        missing = await _safe_scalar(
+            session,
+            select(func.max(Sale.sale_id)).where(Sale.status == "void"),
+            default=-1,
+            table="sale",
+        )
+        assert missing == -1
+
+
+@pytest.mark.asyncio
+async def test_dashboard_ticket_reference_falls_back_to_ocr_payload(client) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        session.add_all(
+            [
+                Sale(status="draft", source="ocr_ticket", ocr_payload={"ticket_id": "T-77"}),
+                Sale(status="draft", source="ocr_ticket", external_ref="EXT-5"),
+                Sale(status="draft", source="ocr_ticket", ocr_payload={}),
+            ]
+        )
+        await session.commit()
+
+    response = await client.get("/dashboard/summary")
+    assert response.status_code == 200
+
+    titles = {ticket["title"] for ticket in response.json()["drilldowns"]["draftOcrTickets"]}
+    assert titles == {"Ticket T-77", "Ticket EXT-5", "Ticket #3"}
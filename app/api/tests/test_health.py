@@ -29,3 +29,22 @@ async def test_health(client) -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest.mark.asyncio
+async def test_health_returns_not_modified_for_matching_etag(client) -> None:
+    first = await client.get("/health")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    second = await client.get("/health", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+    stale = await client.get("/health", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.json()["ok"] is True
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
@@ -21,6 +21,8 @@ from ..models.domain import (
     SaleLine,
     Vendor,
 )
+from ..scripts import import_spreadsheet as import_spreadsheet_cli
+from ..services import importer
 from ..services.importer import NO_IMPORTABLE_ROWS_WARNING, extract_datasets
 
 XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -385,6 +387,23 @@ async def test_import_vendors_only(client) -> None:
     assert vendor_lookup["Acme Furniture"].phone == "555-0222"
 
 
+def test_import_cli_dry_run_reports_counters(tmp_path, capsys) -> None:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Vendors"
+    sheet.append(["Vendor Name", "Email"])
+    sheet.append(["Dry Run Supply Co", "orders@dryrun.test"])
+    path = tmp_path / "vendors.xlsx"
+    workbook.save(path)
+
+    exit_code = import_spreadsheet_cli.main([str(path), "--dataset", "vendors", "--dry-run"])
+
+    output = capsys.readouterr().out
+    assert exit_code == 0
+    assert "vendors=1" in output
+    assert "Dry-run requested" in output
+
+
 @pytest.mark.asyncio
 async def test_import_ignores_leading_blank_rows(client) -> None:
     async with engine.begin() as conn:
@@ -547,3 +566,33 @@ def test_extract_datasets_uses_title_to_break_entity_ties() -> None:
     assert len(datasets["vendors"]) == 1
     assert datasets["vendors"][0]["name"] == "Acme Furniture"
 
+
+def test_extract_datasets_reads_file_objects() -> None:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Vendors"
+    sheet.append(["Name", "Email"])
+    sheet.append(["Acme Furniture", "sales@acme.test"])
+
+    datasets = extract_datasets(_save_workbook(workbook), "upload.xlsx")
+
+    assert [row["name"] for row in datasets["vendors"]] == ["Acme Furniture"]
+
+
+def test_extract_datasets_closes_workbook_when_parsing_fails(monkeypatch) -> None:
+    closed: list[bool] = []
+
+    class _BrokenWorkbook:
+        @property
+        def worksheets(self):
+            raise ValueError("corrupt_sheet")
+
+        def close(self) -> None:
+            closed.append(True)
+
+    monkeypatch.setattr(importer, "load_workbook", lambda *_args, **_kwargs: _BrokenWorkbook())
+
+    with pytest.raises(ValueError, match="corrupt_sheet"):
+        extract_datasets(b"PK", "broken.xlsx")
+
+    assert closed == [True]
@@ -91,6 +91,24 @@ async def test_create_incoming_truck_with_lines(client) -> None:
         assert truck_line.qty_expected == Decimal("10.00")
 
 
+@pytest.mark.asyncio
+async def test_create_incoming_truck_rejects_unknown_po_line(client) -> None:
+    po_id, po_line_id, item_id = await _create_po_with_line()
+
+    payload = {
+        "po_id": po_id,
+        "reference": "TRUCK-101",
+        "lines": [
+            {"po_line_id": po_line_id, "item_id": item_id, "qty_expected": 4.0},
+            {"po_line_id": po_line_id + 999, "item_id": item_id, "qty_expected": 1.0},
+        ],
+    }
+
+    response = await client.post("/incoming-trucks", json=payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "po_line_mismatch"
+
+
 @pytest.mark.asyncio
 async def test_post_update_validates_item_linkage(client) -> None:
     po_id, po_line_id, item_id = await _create_po_with_line()
@@ -211,3 +229,11 @@ async def test_list_incoming_trucks_includes_aggregates(client) -> None:
     assert len(progress) == 1
     assert progress[0]["po_line_id"] == po_line_id
     assert progress[0]["total_quantity"] == pytest.approx(3.5)
+
+    summary_response = await client.get("/incoming-trucks", params={"include_history": False})
+    assert summary_response.status_code == 200
+    summary = summary_response.json()[0]["updates"]
+    assert summary["history"] == []
+    assert summary["latest_status"] == "arrived"
+    assert summary["note_count"] == 1
+    assert summary["line_progress"] == progress
@@ -141,3 +141,41 @@ async def test_transfer_inventory_records_transfer_txn():
         assert from_inventory is not None and to_inventory is not None
         assert float(from_inventory.qty_on_hand) == pytest.approx(3)
         assert float(to_inventory.qty_on_hand) == pytest.approx(2)
+
+
+@pytest.mark.asyncio
+async def test_adjust_inventory_creates_missing_stock_row():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        item = Item(
+            sku="SKU-UPSERT",
+            description="Upsert Item",
+            unit_cost=Decimal("1.00"),
+            price=Decimal("2.00"),
+            short_code="U001",
+        )
+        location = Location(name="Backroom", type="warehouse")
+        session.add_all([item, location])
+        await session.commit()
+        item_id = item.item_id
+        location_id = location.location_id
+
+    payload = InventoryAdjustRequest(
+        item_id=item_id, location_id=location_id, qty_delta=Decimal("3"), reason="adjust"
+    )
+
+    async with SessionLocal() as session:
+        first = await adjust_inventory(payload, session=session)
+        second = await adjust_inventory(payload, session=session)
+        await session.commit()
+
+    assert first["inventory_id"] == second["inventory_id"]
+    assert first["new_qty"] == pytest.approx(3)
+    assert second["new_qty"] == pytest.approx(6)
+
+    async with SessionLocal() as session:
+        txn_count = len((await session.scalars(select(InventoryTxn))).all())
+    assert txn_count == 2
@@ -4,6 +4,7 @@ from datetime import timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
 
 from ..db import SessionLocal, engine
 from ..models.base import Base
@@ -62,9 +63,20 @@ async def test_get_item_detail_returns_inventory_and_incoming(client) -> None:
         po_id = po.po_id
         location_id = location.location_id
 
-    response = await client.get(f"/items/{item_id}")
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        response = await client.get(f"/items/{item_id}")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
     assert response.status_code == 200
     payload = response.json()
+    # Item, locations and incoming POs; nothing lazy-loads while building the response.
+    assert len(statements) == 3
 
     assert payload["item"]["sku"] == "SKU-CLICK"
     assert payload["item"]["unit_cost"] == pytest.approx(10.0)
@@ -201,3 +213,88 @@ async def test_catalog_search_matches_additional_fields(client) -> None:
     # Location match
     results = await _search("Outlet Warehouse")
     assert [item["sku"] for item in results] == ["SOFA-001"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_totals_stock_and_picks_top_location(client) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        item = Item(
+            sku="TABLE-200",
+            description="Dining Table",
+            unit_cost=Decimal("200.00"),
+            price=Decimal("450.00"),
+            short_code="TB20",
+            active=True,
+        )
+        backroom = Location(name="Backroom", type="warehouse")
+        showroom = Location(name="Showroom", type="floor")
+        session.add_all(
+            [
+                item,
+                backroom,
+                showroom,
+                Inventory(item=item, location=backroom, qty_on_hand=Decimal("2.00")),
+                Inventory(item=item, location=showroom, qty_on_hand=Decimal("7.00")),
+            ]
+        )
+        await session.commit()
+
+    response = await client.get("/items/catalog")
+    assert response.status_code == 200
+    [entry] = response.json()
+    assert entry["total_on_hand"] == pytest.approx(9.0)
+    assert entry["top_location"]["location_name"] == "Showroom"
+    assert entry["top_location"]["qty_on_hand"] == pytest.approx(7.0)
+
+
+@pytest.mark.asyncio
+async def test_scan_returns_item_with_locations(client) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        item = Item(
+            sku="LAMP-300",
+            description="Floor Lamp",
+            unit_cost=Decimal("30.00"),
+            price=Decimal("79.00"),
+            short_code="LP30",
+        )
+        unstocked = Item(
+            sku="LAMP-301",
+            description="Desk Lamp",
+            unit_cost=Decimal("12.00"),
+            price=Decimal("29.00"),
+            short_code="LP31",
+        )
+        location = Location(name="Aisle 4", type="floor")
+        session.add_all(
+            [
+                item,
+                unstocked,
+                location,
+                Barcode(item=item, barcode="0001112223334"),
+                Barcode(item=unstocked, barcode="0001112223335"),
+                Inventory(item=item, location=location, qty_on_hand=Decimal("4.00")),
+            ]
+        )
+        await session.commit()
+
+    response = await client.get("/items/scan/0001112223334")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["item"]["sku"] == "LAMP-300"
+    assert payload["locations"] == [{"location": "Aisle 4", "qty_on_hand": 4.0}]
+    assert payload["last_cost"] == pytest.approx(30.0)
+
+    response = await client.get("/items/scan/0001112223335")
+    assert response.status_code == 200
+    assert response.json()["locations"] == []
+
+    response = await client.get("/items/scan/missing")
+    assert response.status_code == 404
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import sys
+import tempfile
+import time
 import types
+from pathlib import Path
 from typing import BinaryIO
 
 import pytest
 from httpx import AsyncClient
+from PIL import Image
 from sqlalchemy import select
 
 from app.api.db import SessionLocal, engine
@@ -13,6 +17,7 @@ from app.api.main import app
 from app.api.models.base import Base
 from app.api.models.domain import Attachment, Sale
 from app.api.routes import ocr
+from app.api.services.ocr import tesseract
 from app.api.services.ocr.base import OcrDocument, OcrWord
 from app.api.services.storage import StorageError
 
@@ -43,6 +48,14 @@ class _StubPdf:
         self._closed = True
 
 
+class _StubMultiPagePdf(_StubPdf):
+    page_count = 3
+
+    def load_page(self, index: int) -> _StubPage:
+        assert 0 <= index < self.page_count
+        return _StubPage()
+
+
 class _StubProvider:
     async def analyze(self, _image_path: str) -> OcrDocument:
         return OcrDocument(
@@ -60,6 +73,9 @@ class _StubProvider:
             ]
         )
 
+    async def analyze_bytes(self, _content: bytes) -> OcrDocument:
+        return await self.analyze("memory")
+
 
 @pytest.mark.asyncio
 async def test_upload_pdf_ticket_uses_document_attachment_kind(
@@ -145,3 +161,207 @@ async def test_upload_ticket_handles_storage_failures(
 
     assert response.status_code == 503
     assert response.json() == {"detail": "storage_unavailable"}
+
+
+@pytest.mark.asyncio
+async def test_upload_multi_page_pdf_ocrs_all_pages_in_one_call(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient
+) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    def fake_upload_file(*, key: str, fileobj: BinaryIO, content_type: str) -> str:
+        return f"https://example.com/{key}"
+
+    monkeypatch.setattr(ocr.storage_service, "upload_file", fake_upload_file)
+
+    stub_fitz = types.ModuleType("fitz")
+    stub_fitz.open = lambda _path: _StubMultiPagePdf(_path)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "fitz", stub_fitz)
+
+    analyzed: list[list[str]] = []
+
+    class _RecordingProvider(_StubProvider):
+        async def analyze(self, image_path: str) -> OcrDocument:
+            assert image_path.endswith(".txt")
+            with open(image_path) as fh:
+                analyzed.append(fh.read().splitlines())
+            return await super().analyze(image_path)
+
+    async def override_provider() -> _RecordingProvider:
+        return _RecordingProvider()
+
+    app.dependency_overrides[ocr.get_provider] = override_provider
+
+    try:
+        response = await client.post(
+            "/ocr/sale-ticket",
+            files={"image": ("ticket.pdf", b"%PDF-1.4\n%%EOF", "application/pdf")},
+        )
+    finally:
+        app.dependency_overrides.pop(ocr.get_provider, None)
+
+    assert response.status_code == 200
+    assert len(analyzed) == 1
+    assert len(analyzed[0]) == 3
+    assert all(path.endswith(".png") for path in analyzed[0])
+
+
+@pytest.mark.asyncio
+async def test_upload_pdf_rejects_too_many_pages(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient
+) -> None:
+    rendered: list[int] = []
+
+    class _RecordingPdf(_StubMultiPagePdf):
+        def load_page(self, index: int) -> _StubPage:
+            rendered.append(index)
+            return super().load_page(index)
+
+    stub_fitz = types.ModuleType("fitz")
+    stub_fitz.open = lambda _path: _RecordingPdf(_path)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "fitz", stub_fitz)
+    monkeypatch.setattr(ocr.settings, "ocr_max_pages", 2)
+
+    response = await client.post(
+        "/ocr/sale-ticket",
+        files={"image": ("ticket.pdf", b"%PDF-1.4\n%%EOF", "application/pdf")},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "too_many_pages"}
+    assert rendered == []
+
+
+@pytest.mark.asyncio
+async def test_upload_pdf_removes_temp_files_when_ocr_fails(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient
+) -> None:
+    def fake_upload_file(*, key: str, fileobj: BinaryIO, content_type: str) -> str:
+        return f"https://example.com/{key}"
+
+    monkeypatch.setattr(ocr.storage_service, "upload_file", fake_upload_file)
+    monkeypatch.setattr(ocr.storage_service, "delete_file", lambda *, key: None)
+
+    stub_fitz = types.ModuleType("fitz")
+    stub_fitz.open = lambda _path: _StubMultiPagePdf(_path)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "fitz", stub_fitz)
+
+    created: list[Path] = []
+    named_temporary_file = tempfile.NamedTemporaryFile
+
+    def recording_temporary_file(*args, **kwargs):
+        handle = named_temporary_file(*args, **kwargs)
+        created.append(Path(handle.name))
+        return handle
+
+    monkeypatch.setattr(ocr.tempfile, "NamedTemporaryFile", recording_temporary_file)
+
+    class _FailingProvider(_StubProvider):
+        async def analyze(self, image_path: str) -> OcrDocument:
+            raise RuntimeError("tesseract_crashed")
+
+    async def override_provider() -> _FailingProvider:
+        return _FailingProvider()
+
+    app.dependency_overrides[ocr.get_provider] = override_provider
+
+    try:
+        with pytest.raises(RuntimeError, match="tesseract_crashed"):
+            await client.post(
+                "/ocr/sale-ticket",
+                files={"image": ("ticket.pdf", b"%PDF-1.4\n%%EOF", "application/pdf")},
+            )
+    finally:
+        app.dependency_overrides.pop(ocr.get_provider, None)
+
+    # The spooled PDF, three page renders and the tesseract page list.
+    assert len(created) == 5
+    assert not [path for path in created if path.exists()]
+
+
+@pytest.mark.asyncio
+async def test_upload_deletes_stored_original_when_ocr_fails(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient
+) -> None:
+    uploaded: list[str] = []
+    deleted: list[str] = []
+
+    def slow_upload_file(*, key: str, fileobj: BinaryIO, content_type: str) -> str:
+        # Still running in its worker thread when OCR fails.
+        time.sleep(0.05)
+        uploaded.append(key)
+        return f"https://example.com/{key}"
+
+    def fake_delete_file(*, key: str) -> None:
+        deleted.append(key)
+
+    monkeypatch.setattr(ocr.storage_service, "upload_file", slow_upload_file)
+    monkeypatch.setattr(ocr.storage_service, "delete_file", fake_delete_file)
+
+    class _FailingProvider(_StubProvider):
+        async def analyze_bytes(self, _content: bytes) -> OcrDocument:
+            raise RuntimeError("tesseract_crashed")
+
+    async def override_provider() -> _FailingProvider:
+        return _FailingProvider()
+
+    app.dependency_overrides[ocr.get_provider] = override_provider
+
+    try:
+        with pytest.raises(RuntimeError, match="tesseract_crashed"):
+            await client.post(
+                "/ocr/sale-ticket",
+                files={"image": ("ticket.png", b"PNGDATA", "image/png")},
+            )
+    finally:
+        app.dependency_overrides.pop(ocr.get_provider, None)
+
+    assert len(uploaded) == 1
+    assert deleted == uploaded
+
+
+class _RecordingTessApi:
+    def __init__(self) -> None:
+        self.modes: list[str] = []
+
+    def SetImage(self, image: Image.Image) -> None:  # noqa: N802 - tesserocr API
+        self.modes.append(image.mode)
+
+    def MapWordConfidences(self) -> list[tuple[str, int]]:  # noqa: N802 - tesserocr API
+        return [("SALE", 90)]
+
+
+def test_analyze_image_preprocesses_photos_but_not_pdf_pages(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    api = _RecordingTessApi()
+    monkeypatch.setattr(tesseract, "_tess_api", api)
+    photo = tmp_path / "photo.png"
+    Image.new("RGB", (40, 20), "white").save(photo)
+    page_list = tmp_path / "pages.txt"
+    page_list.write_text(f"{photo}\n")
+
+    tesseract._analyze_image(str(photo))
+    tesseract._analyze_image(str(page_list))
+
+    assert api.modes == ["L", "RGB"]
+
+
+@pytest.mark.asyncio
+async def test_tesseract_provider_runs_work_in_the_shared_process_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tesseract.get_settings(), "ocr_workers", 1)
+    tesseract.get_ocr_executor.cache_clear()
+    executor = tesseract.get_ocr_executor()
+    try:
+        assert tesseract.get_ocr_executor() is executor
+        provider = tesseract.TesseractProvider(executor=executor)
+        document = await provider._run(tesseract._to_document, [("SALE", "90"), (" ", "-1")])
+    finally:
+        executor.shutdown(cancel_futures=True)
+        tesseract.get_ocr_executor.cache_clear()
+
+    assert document.words == [OcrWord(text="SALE", confidence=0.9)]
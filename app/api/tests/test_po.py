@@ -4,11 +4,12 @@ from decimal import Decimal
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
+from sqlalchemy import delete, select
 
 from ..db import SessionLocal, engine
 from ..models.base import Base
 from ..models.domain import (
+    Barcode,
     Inventory,
     InventoryTxn,
     Item,
@@ -18,6 +19,9 @@ from ..models.domain import (
     Receiving,
     Vendor,
 )
+from ..routes.po import _prefix_tsquery
+from ..services.barcodes import resolve_barcode_item_id
+from ..utils import schema
 
 
 @pytest_asyncio.fixture(autouse=True)
@@ -66,6 +70,77 @@ async def test_po_line_search_matches_text_fields(client):
         assert result["qty_remaining"] == pytest.approx(40)
 
 
+@pytest.mark.asyncio
+async def test_po_line_search_matches_partial_tokens(client):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Cedar Mill")
+        item = Item(
+            sku="JOIST-2X10",
+            description="Douglas Fir Joist",
+            unit_cost=Decimal("14.00"),
+            price=Decimal("22.00"),
+            short_code="JS10",
+        )
+        po = PurchaseOrder(vendor=vendor, status="open", created_by="demo")
+        line = POLine(
+            po=po,
+            item=item,
+            description="Douglas Fir Joist",
+            qty_ordered=Decimal("6"),
+            unit_cost=Decimal("14.00"),
+        )
+        session.add_all([vendor, item, po, line])
+        await session.commit()
+
+    for query in ("JOI", "doug"):
+        response = await client.get("/po/lines/search", params={"q": query})
+        assert response.status_code == 200
+        assert [row["item_description"] for row in response.json()] == ["Douglas Fir Joist"]
+
+
+def test_prefix_tsquery_matches_each_word_as_prefix():
+    assert _prefix_tsquery("JOI") == "JOI:*"
+    assert _prefix_tsquery("joist-2x") == "joist:* & 2x:*"
+    # tsquery operators in user input are dropped rather than interpreted.
+    assert _prefix_tsquery("fir' | !oak") == "fir:* & oak:*"
+    assert _prefix_tsquery("ply_wood") == "ply:* & wood:*"
+    assert _prefix_tsquery("--") == ""
+
+
+@pytest.mark.asyncio
+async def test_po_line_search_falls_back_without_search_vector(
+    client, monkeypatch: pytest.MonkeyPatch
+):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Summit Lumber")
+        item = Item(
+            sku="STUD-2X6",
+            description="Spruce Stud 2x6",
+            unit_cost=Decimal("5.00"),
+            price=Decimal("9.25"),
+            short_code="ST26",
+        )
+        po = PurchaseOrder(vendor=vendor, status="open", created_by="demo")
+        line = POLine(
+            po=po,
+            item=item,
+            description="Spruce Stud 2x6",
+            qty_ordered=Decimal("10"),
+            unit_cost=Decimal("5.00"),
+        )
+        session.add_all([vendor, item, po, line])
+        await session.commit()
+
+    assert not await schema.column_exists("po_line", "search_vec")
+    # Report Postgres so the route takes its full-text branch; without the migration
+    # 0013 column it must use the ILIKE search, which SQLite can run.
+    monkeypatch.setattr(engine.sync_engine.dialect, "name", "postgresql")
+    response = await client.get("/po/lines/search", params={"q": "spruce"})
+
+    assert response.status_code == 200
+    assert [result["item_description"] for result in response.json()] == ["Spruce Stud 2x6"]
+
+
 @pytest.mark.asyncio
 async def test_po_line_search_excludes_fully_received_and_closed(client):
     async with SessionLocal() as session:
@@ -137,6 +212,249 @@ async def test_po_line_search_excludes_fully_received_and_closed(client):
     assert result["qty_remaining"] == pytest.approx(40)
 
 
+@pytest.mark.asyncio
+async def test_lookup_po_line_matches_open_lines_by_id(client):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Harbor Supply", terms=None, phone=None, email=None)
+        item = Item(
+            sku="NAIL-16D",
+            description="16d Nails",
+            unit_cost=Decimal("4.00"),
+            price=Decimal("8.00"),
+            short_code="N16D",
+        )
+        open_po = PurchaseOrder(vendor=vendor, status="open", created_by="demo")
+        closed_po = PurchaseOrder(vendor=vendor, status="closed", created_by="demo")
+        open_line = POLine(
+            po=open_po,
+            item=item,
+            description="16d Nails",
+            qty_ordered=Decimal("10"),
+            qty_received=Decimal("4"),
+            unit_cost=Decimal("4.00"),
+        )
+        closed_line = POLine(
+            po=closed_po,
+            item=item,
+            description="16d Nails",
+            qty_ordered=Decimal("10"),
+            qty_received=Decimal("0"),
+            unit_cost=Decimal("4.00"),
+        )
+        session.add_all([vendor, item, open_po, closed_po, open_line, closed_line])
+        await session.flush()
+        open_line_id = open_line.po_line_id
+        closed_line_id = closed_line.po_line_id
+        await session.commit()
+
+    response = await client.get(f"/po/lookup/L{closed_line_id}-L{open_line_id}-L{open_line_id}")
+    assert response.status_code == 200
+    payload = response.json()
+    assert [entry["po_line_id"] for entry in payload] == [open_line_id]
+    assert payload[0]["qty_remaining"] == pytest.approx(6)
+
+
+@pytest.mark.asyncio
+async def test_lookup_po_line_falls_back_to_barcode(client):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Harbor Supply", terms=None, phone=None, email=None)
+        item = Item(
+            sku="NAIL-8D",
+            description="8d Nails",
+            unit_cost=Decimal("3.00"),
+            price=Decimal("6.00"),
+            short_code="N08D",
+        )
+        po = PurchaseOrder(vendor=vendor, status="partial", created_by="demo")
+        open_line = POLine(
+            po=po,
+            item=item,
+            description="8d Nails",
+            qty_ordered=Decimal("12"),
+            qty_received=Decimal("2"),
+            unit_cost=Decimal("3.00"),
+        )
+        received_line = POLine(
+            po=po,
+            item=item,
+            description="8d Nails",
+            qty_ordered=Decimal("5"),
+            qty_received=Decimal("5"),
+            unit_cost=Decimal("3.00"),
+        )
+        session.add_all([vendor, item, po, open_line, received_line])
+        await session.flush()
+        session.add_all(
+            [
+                Barcode(barcode="NAILS-BOX", item_id=item.item_id),
+                Barcode(barcode="012345678905", item_id=item.item_id),
+            ]
+        )
+        open_line_id = open_line.po_line_id
+        await session.commit()
+
+    response = await client.get("/po/lookup/NAILS-BOX")
+    assert response.status_code == 200
+    payload = response.json()
+    assert [entry["po_line_id"] for entry in payload] == [open_line_id]
+    assert payload[0]["qty_remaining"] == pytest.approx(10)
+
+    upc_response = await client.get("/po/lookup/012345678905")
+    assert upc_response.status_code == 200
+    assert [entry["po_line_id"] for entry in upc_response.json()] == [open_line_id]
+
+
+@pytest.mark.asyncio
+async def test_lookup_po_line_barcode_cache_follows_writes(client):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Pine Yard", terms=None, phone=None, email=None)
+        item = Item(
+            sku="SCREW-3",
+            description="3in Screws",
+            unit_cost=Decimal("4.00"),
+            price=Decimal("8.00"),
+            short_code="SC03",
+        )
+        po = PurchaseOrder(vendor=vendor, status="open", created_by="demo")
+        line = POLine(
+            po=po,
+            item=item,
+            description="3in Screws",
+            qty_ordered=Decimal("4"),
+            qty_received=Decimal("0"),
+            unit_cost=Decimal("4.00"),
+        )
+        session.add_all([vendor, item, po, line])
+        await session.commit()
+        item_id = item.item_id
+
+    missing = await client.get("/po/lookup/SCREWS-BOX")
+    assert missing.status_code == 404
+    assert missing.json()["detail"] == "barcode_not_found"
+
+    async with SessionLocal() as session:
+        session.add(Barcode(barcode="SCREWS-BOX", item_id=item_id))
+        await session.commit()
+
+    found = await client.get("/po/lookup/SCREWS-BOX")
+    assert found.status_code == 200
+
+    async with SessionLocal() as session:
+        await session.execute(delete(Barcode))
+        await session.commit()
+
+    removed = await client.get("/po/lookup/SCREWS-BOX")
+    assert removed.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_barcode_miss_cached_before_commit_is_cleared_on_commit():
+    async with SessionLocal() as session:
+        item = Item(
+            sku="NAIL-2",
+            description="2in Nails",
+            unit_cost=Decimal("2.00"),
+            price=Decimal("4.00"),
+            short_code="NL02",
+        )
+        session.add(item)
+        await session.commit()
+        item_id = item.item_id
+
+    async with SessionLocal() as writer:
+        writer.add(Barcode(barcode="NAILS-BOX", item_id=item_id))
+        await writer.flush()
+
+        # Another request looks the barcode up before the insert commits.
+        async with SessionLocal() as reader:
+            assert await resolve_barcode_item_id(reader, "NAILS-BOX") is None
+
+        await writer.commit()
+
+    async with SessionLocal() as reader:
+        assert await resolve_barcode_item_id(reader, "NAILS-BOX") == item_id
+
+
+@pytest.mark.asyncio
+async def test_get_po_returns_header_and_lines(client):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Ridge Hardware", terms=None, phone=None, email=None)
+        item = Item(
+            sku="HINGE-3",
+            description="3in Hinge",
+            unit_cost=Decimal("1.25"),
+            price=Decimal("2.50"),
+            short_code="HG03",
+        )
+        po = PurchaseOrder(vendor=vendor, status="open", created_by="demo")
+        empty_po = PurchaseOrder(vendor=vendor, status="draft", created_by="demo")
+        line = POLine(
+            po=po,
+            item=item,
+            description="3in Hinge",
+            qty_ordered=Decimal("12"),
+            unit_cost=Decimal("1.25"),
+        )
+        session.add_all([vendor, item, po, empty_po, line])
+        await session.flush()
+        po_id = po.po_id
+        empty_po_id = empty_po.po_id
+        await session.commit()
+
+    response = await client.get(f"/po/{po_id}")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["status"] == "open"
+    assert [line["qty_ordered"] for line in payload["lines"]] == [12.0]
+
+    response = await client.get(f"/po/{empty_po_id}")
+    assert response.status_code == 200
+    assert response.json()["lines"] == []
+
+    response = await client.get("/po/999999")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_po_inserts_all_lines(client):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Bulk Fasteners", terms=None, phone=None, email=None)
+        screws = Item(
+            sku="SCREW-8",
+            description="#8 Screws",
+            unit_cost=Decimal("0.10"),
+            price=Decimal("0.25"),
+            short_code="SC08",
+        )
+        bolts = Item(
+            sku="BOLT-38",
+            description="3/8 Bolts",
+            unit_cost=Decimal("0.40"),
+            price=Decimal("0.90"),
+            short_code="BT38",
+        )
+        session.add_all([vendor, screws, bolts])
+        await session.commit()
+        vendor_id = vendor.vendor_id
+        item_ids = [screws.item_id, bolts.item_id]
+
+    response = await client.post(
+        "/po",
+        json={
+            "vendor_id": vendor_id,
+            "lines": [
+                {"item_id": item_id, "description": "Bulk", "qty_ordered": 100, "unit_cost": 0.1}
+                for item_id in item_ids
+            ],
+        },
+    )
+    assert response.status_code == 200
+    po_id = response.json()["po_id"]
+
+    detail = await client.get(f"/po/{po_id}")
+    assert sorted(line["item_id"] for line in detail.json()["lines"]) == sorted(item_ids)
+
+
 @pytest.mark.asyncio
 async def test_receive_po_updates_inventory(client):
     async with SessionLocal() as session:
@@ -205,6 +523,69 @@ async def test_receive_po_updates_inventory(client):
         assert float(inventory.qty_on_hand) == pytest.approx(4)
 
 
+@pytest.mark.asyncio
+async def test_receive_po_merges_lines_into_existing_stock(client):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Lumber Direct", terms=None, phone=None, email=None)
+        location = Location(name="Main Warehouse", type="warehouse")
+        item = Item(
+            sku="JOIST-2X10",
+            description="Joist 2x10",
+            unit_cost=Decimal("9.00"),
+            price=Decimal("15.00"),
+            short_code="J210",
+        )
+        po = PurchaseOrder(vendor=vendor, status="open", created_by="demo")
+        lines = [
+            POLine(
+                po=po,
+                item=item,
+                description="Joist 2x10",
+                qty_ordered=Decimal("10"),
+                qty_received=Decimal("0"),
+                unit_cost=Decimal("9.00"),
+            )
+            for _ in range(2)
+        ]
+        session.add_all([vendor, location, item, po, *lines])
+        await session.flush()
+        session.add(
+            Inventory(
+                item_id=item.item_id,
+                location_id=location.location_id,
+                qty_on_hand=Decimal("5"),
+                qty_reserved=Decimal("0"),
+                avg_cost=Decimal("9.00"),
+            )
+        )
+        po_id = po.po_id
+        line_ids = [line.po_line_id for line in lines]
+        item_id = item.item_id
+        location_id = location.location_id
+        await session.commit()
+
+    response = await client.post(
+        f"/po/{po_id}/receive",
+        json=[
+            {"po_line_id": line_ids[0], "qty_received": 2, "location_id": location_id},
+            {"po_line_id": line_ids[1], "qty_received": 3, "location_id": location_id},
+        ],
+    )
+    assert response.status_code == 200
+
+    async with SessionLocal() as session:
+        inventory = (
+            await session.scalars(
+                select(Inventory).where(
+                    Inventory.item_id == item_id,
+                    Inventory.location_id == location_id,
+                )
+            )
+        ).all()
+    assert len(inventory) == 1
+    assert float(inventory[0].qty_on_hand) == pytest.approx(10)
+
+
 @pytest.mark.asyncio
 async def test_list_purchase_orders_returns_summary(client):
     async with SessionLocal() as session:
@@ -259,6 +640,34 @@ async def test_list_purchase_orders_returns_summary(client):
     assert summary["qty_received"] == pytest.approx(9)
 
 
+@pytest.mark.asyncio
+async def test_update_po_applies_allowed_fields_only(client):
+    async with SessionLocal() as session:
+        vendor = Vendor(name="Cedar Mill", terms=None, phone=None, email=None)
+        po = PurchaseOrder(vendor=vendor, status="draft", notes="initial", created_by="demo")
+        session.add_all([vendor, po])
+        await session.flush()
+        po_id = po.po_id
+        await session.commit()
+
+    response = await client.patch(f"/po/{po_id}", json={"status": "open", "terms": "Net 15"})
+    assert response.status_code == 200
+    assert response.json() == {"po_id": po_id, "status": "open"}
+
+    rejected = await client.patch(f"/po/{po_id}", json={"created_by": "intruder"})
+    assert rejected.status_code == 422
+
+    invalid_status = await client.patch(f"/po/{po_id}", json={"status": "shipped"})
+    assert invalid_status.status_code == 422
+
+    async with SessionLocal() as session:
+        po = await session.get(PurchaseOrder, po_id)
+        assert po.status == "open"
+        assert po.terms == "Net 15"
+        assert po.notes == "initial"
+        assert po.created_by == "demo"
+
+
 @pytest.mark.asyncio
 async def test_delete_po_requires_no_receivings(client):
     async with SessionLocal() as session:
@@ -3,6 +3,9 @@ from __future__ import annotations
 from decimal import Decimal
 
 import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
 
 from .. import sample_data
 from ..db import SessionLocal, engine
@@ -80,12 +83,47 @@ async def test_finalize_sale_eager_loads_lines() -> None:
         await session.commit()
         sale_id = sale.sale_id
 
+    background_tasks = BackgroundTasks()
     async with SessionLocal() as session:
-        response = await finalize_sale(sale_id, session=session)
+        response = await finalize_sale(sale_id, background_tasks, session=session)
         await session.commit()
 
     assert response.status == "open"
     assert float(response.total) == pytest.approx(30.0)
+    [webhook] = background_tasks.tasks
+    assert webhook.args[0]["lines"] == [{"sku": "SKU-FINALIZE", "qty": 1.0, "price": 30.0}]
+
+
+@pytest.mark.asyncio
+async def test_list_sales_returns_draft_projection(client) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        draft = Sale(
+            status="draft",
+            created_by="tester",
+            source="ocr_ticket",
+            ocr_confidence=Decimal("0.8750"),
+            total=Decimal("42.50"),
+            ocr_payload={"customer_name": "Jane Doe"},
+        )
+        finalized = Sale(status="open", created_by="tester", source="manual")
+        session.add_all([draft, finalized])
+        await session.commit()
+        draft_id = draft.sale_id
+
+    response = await client.get("/sales")
+    assert response.status_code == 200
+    assert response.json()["drafts"] == [
+        {
+            "sale_id": draft_id,
+            "ocr_confidence": pytest.approx(0.875),
+            "total": pytest.approx(42.5),
+            "customer_name": "Doe",
+        }
+    ]
 
 
 @pytest.mark.asyncio
@@ -160,3 +198,11 @@ async def test_update_sale_replaces_lines_and_totals() -> None:
     assert response.lines[0].qty == pytest.approx(3)
     assert response.subtotal == pytest.approx(54)
     assert response.total == pytest.approx(59)
+
+
+def test_sale_declares_gin_index_on_ocr_payload() -> None:
+    index = next(idx for idx in Sale.__table__.indexes if idx.name == "idx_sale_ocr_payload")
+
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert ddl == "CREATE INDEX idx_sale_ocr_payload ON sale USING gin (ocr_payload)"
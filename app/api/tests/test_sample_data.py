@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+from sqlalchemy import func, select
+
+from .. import sample_data
+from ..db import SessionLocal, engine
+from ..models.base import Base
+from ..models.domain import (
+    POLine,
+    PurchaseOrder,
+    Receiving,
+    ReceivingLine,
+    Sale,
+    SaleLine,
+    Vendor,
+)
+
+
+@pytest.mark.asyncio
+async def test_seed_reuses_rows_flushed_on_the_callers_session() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        session.add(Vendor(name="Demo Furnishings", terms="Net 45"))
+        await session.flush()
+
+        summary = await sample_data.ensure_sample_data(session)
+        await session.commit()
+
+    assert summary.created is True
+    async with SessionLocal() as session:
+        vendors = (
+            await session.scalars(select(Vendor).where(Vendor.name == "Demo Furnishings"))
+        ).all()
+        assert [vendor.terms for vendor in vendors] == ["Net 45"]
+        assert await session.scalar(select(func.count()).select_from(Vendor)) == 1
+
+
+@pytest.mark.asyncio
+async def test_seeded_sample_sale_totals_match_its_lines() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        await sample_data.ensure_sample_data(session)
+        await session.commit()
+
+    async with SessionLocal() as session:
+        sale = await session.scalar(select(Sale).where(Sale.external_ref == "SAMPLE-SALE"))
+        lines = (
+            await session.scalars(select(SaleLine).where(SaleLine.sale_id == sale.sale_id))
+        ).all()
+
+    prices = [float(line.unit_price) for line in lines]
+    assert len(lines) == len(sample_data.SAMPLE_ITEM_SKUS)
+    assert [float(line.tax) for line in lines] == [round(price * 0.07, 2) for price in prices]
+    assert float(sale.subtotal) == pytest.approx(math.fsum(prices))
+    assert float(sale.tax) == pytest.approx(round(math.fsum(prices) * 0.07, 2))
+
+
+@pytest.mark.asyncio
+async def test_bulk_inserted_po_and_receiving_lines_are_complete() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as session:
+        await sample_data.ensure_sample_data(session)
+        await session.commit()
+
+    async with SessionLocal() as session:
+        po = await session.scalar(
+            select(PurchaseOrder).where(PurchaseOrder.external_ref == "SAMPLE-PO")
+        )
+        receipt = await session.scalar(
+            select(Receiving).where(Receiving.external_ref == "SAMPLE-RECEIPT")
+        )
+        po_lines = (await session.scalars(select(POLine).where(POLine.po_id == po.po_id))).all()
+        receiving_lines = (
+            await session.scalars(
+                select(ReceivingLine).where(ReceivingLine.receipt_id == receipt.receipt_id)
+            )
+        ).all()
+
+    assert len(po_lines) == len(sample_data.SAMPLE_ITEM_SKUS)
+    assert sorted(line.po_line_id for line in receiving_lines) == sorted(
+        line.po_line_id for line in po_lines
+    )
+    # Core inserts still apply the Python-side column defaults.
+    assert all(line.created_at is not None for line in po_lines)
@@ -134,3 +134,20 @@ async def test_missing_required_role_returns_forbidden(client, configure_auth) -
 
     assert response.status_code == 403
     assert response.json()["detail"] == "insufficient_role"
+
+
+def test_require_roles_reuses_dependency_for_same_role_set() -> None:
+    assert require_roles("Purchasing", "Admin") is require_roles("Admin", "Purchasing")
+    assert require_roles("Purchasing") is not require_roles("Purchasing", "Admin")
+
+
+def test_auth_backend_is_reused_until_settings_change(configure_auth) -> None:
+    configure_auth(AUTH_PROVIDER="mock")
+    settings = get_settings()
+
+    first = security._get_user(None, settings)
+    second = security._get_user(None, settings)
+    assert first.roles is second.roles
+
+    get_settings.cache_clear()
+    assert security._auth_backend(get_settings()) is not security._auth_backend(settings)
@@ -4,6 +4,8 @@ import io
 
 from types import SimpleNamespace
 
+import pytest
+
 from app.api.services import storage
 
 
@@ -11,6 +13,7 @@ class _StubClient:
     def __init__(self) -> None:
         self.created_bucket: str | None = None
         self.uploads: list[dict[str, str]] = []
+        self.deleted: list[tuple[str, str]] = []
 
     def list_buckets(self) -> dict:
         return {"Buckets": []}
@@ -28,6 +31,9 @@ class _StubClient:
             }
         )
 
+    def delete_object(self, Bucket: str, Key: str) -> None:  # noqa: N803 - boto style
+        self.deleted.append((Bucket, Key))
+
 
 def test_upload_file_ensures_bucket_creation(monkeypatch) -> None:
     service = storage.StorageService.__new__(storage.StorageService)
@@ -56,3 +62,38 @@ def test_upload_file_ensures_bucket_creation(monkeypatch) -> None:
     ]
     assert service._bucket_verified is True  # type: ignore[attr-defined]
     assert url.endswith("/test-bucket/tickets/test")
+
+
+@pytest.mark.asyncio
+async def test_aupload_file_uploads_in_worker_thread(monkeypatch) -> None:
+    service = storage.StorageService.__new__(storage.StorageService)
+    stub_client = _StubClient()
+    service.client = stub_client  # type: ignore[attr-defined]
+    service.bucket = "test-bucket"  # type: ignore[attr-defined]
+    service._bucket_verified = True  # type: ignore[attr-defined]
+
+    monkeypatch.setattr(
+        storage,
+        "settings",
+        SimpleNamespace(s3_endpoint="https://example.com", s3_bucket="test-bucket"),
+    )
+
+    url = await service.aupload_file(
+        key="tickets/async", fileobj=io.BytesIO(b"payload"), content_type="application/pdf"
+    )
+
+    assert stub_client.uploads[0]["key"] == "tickets/async"
+    assert stub_client.uploads[0]["size"] == 7
+    assert url == "https://example.com/test-bucket/tickets/async"
+
+
+@pytest.mark.asyncio
+async def test_adelete_file_removes_object() -> None:
+    service = storage.StorageService.__new__(storage.StorageService)
+    stub_client = _StubClient()
+    service.client = stub_client  # type: ignore[attr-defined]
+    service.bucket = "test-bucket"  # type: ignore[attr-defined]
+
+    await service.adelete_file(key="tickets/orphan")
+
+    assert stub_client.deleted == [("test-bucket", "tickets/orphan")]
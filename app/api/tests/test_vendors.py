@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+
+from ..db import SessionLocal, engine
+from ..models.base import Base
+from ..models.domain import Vendor
+from ..routes import vendors
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_database() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest.mark.asyncio
+async def test_list_vendors_projects_address_and_filters(client) -> None:
+    async with SessionLocal() as session:
+        session.add_all(
+            [
+                Vendor(
+                    name="Oak Mill",
+                    email="orders@oakmill.test",
+                    address_json={"city": "Portland", "state": "OR"},
+                ),
+                Vendor(name="Birch Supply", phone="555-0100"),
+            ]
+        )
+        await session.commit()
+
+    response = await client.get("/vendors")
+    assert response.status_code == 200
+    vendors = response.json()
+    assert [vendor["name"] for vendor in vendors] == ["Birch Supply", "Oak Mill"]
+    assert vendors[1]["city"] == "Portland"
+    assert vendors[1]["state"] == "OR"
+    assert vendors[0]["city"] is None
+    assert vendors[0]["active"] is True
+
+    search = await client.get("/vendors", params={"q": "oakmill"})
+    assert [vendor["name"] for vendor in search.json()] == ["Oak Mill"]
+
+
+@pytest.mark.asyncio
+async def test_list_vendors_pages_with_limit_and_offset(client) -> None:
+    async with SessionLocal() as session:
+        session.add_all([Vendor(name=f"Vendor {index:02d}") for index in range(5)])
+        await session.commit()
+
+    first = await client.get("/vendors", params={"limit": 2})
+    last = await client.get("/vendors", params={"limit": 2, "offset": 4})
+    assert [vendor["name"] for vendor in first.json()] == ["Vendor 00", "Vendor 01"]
+    assert [vendor["name"] for vendor in last.json()] == ["Vendor 04"]
+
+    at_max = await client.get("/vendors", params={"limit": vendors.MAX_PAGE_SIZE})
+    over_max = await client.get("/vendors", params={"limit": vendors.MAX_PAGE_SIZE + 1})
+    assert len(at_max.json()) == 5
+    assert over_max.status_code == 422
@@ -1,9 +1,99 @@
 """Utilities for keeping the runtime database schema aligned with expectations."""
 from __future__ import annotations
 
-from sqlalchemy import inspect, text
+import time
+from typing import Any
+
+from sqlalchemy import event, inspect, text
 
 from ..db import engine
+from ..models.base import Base
+
+# A miss re-reflects at most once per window, so tables created by an out-of-process
+# ``alembic upgrade`` show up without a restart while absent tables stay cheap to check.
+KNOWN_TABLES_TTL_SECONDS = 60.0
+
+_known_tables: set[str] | None = None
+_known_tables_refreshed_at = 0.0
+_COLUMN_CACHE: dict[str, tuple[float, frozenset[str]]] = {}
+
+
+async def refresh_known_tables() -> frozenset[str]:
+    """Reflect the table names present in the database and cache them."""
+
+    global _known_tables, _known_tables_refreshed_at
+
+    async with engine.connect() as conn:
+        table_names = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).get_table_names()
+        )
+
+    _known_tables = set(table_names)
+    _known_tables_refreshed_at = time.monotonic()
+    return frozenset(_known_tables)
+
+
+async def table_exists(table_name: str) -> bool:
+    """Return whether ``table_name`` exists according to the cached reflection.
+
+    Before :func:`refresh_known_tables` has run every table is assumed to exist so
+    callers fall back to executing their query and handling errors themselves. A
+    table missing from the cache is looked up again once the cached reflection is
+    older than :data:`KNOWN_TABLES_TTL_SECONDS`.
+    """
+
+    if _known_tables is None or table_name in _known_tables:
+        return True
+    if time.monotonic() - _known_tables_refreshed_at < KNOWN_TABLES_TTL_SECONDS:
+        return False
+    return table_name in await refresh_known_tables()
+
+
+def forget_table(table_name: str) -> None:
+    """Mark ``table_name`` as missing after the database reported it absent.
+
+    The table is checked again by the next :func:`table_exists` miss once the
+    cached reflection expires.
+    """
+
+    if _known_tables is not None:
+        _known_tables.discard(table_name)
+
+
+async def column_exists(table_name: str, column_name: str) -> bool:
+    """Return whether ``table_name`` has ``column_name``, cached per table.
+
+    Used for columns that only migrations provision, so callers can fall back
+    when a deployment has not run them. Cached columns are reflected again once
+    they are older than :data:`KNOWN_TABLES_TTL_SECONDS`.
+    """
+
+    now = time.monotonic()
+    cached = _COLUMN_CACHE.get(table_name)
+    if cached is None or now >= cached[0]:
+        async with engine.connect() as conn:
+            columns = await conn.run_sync(
+                lambda sync_conn: {
+                    column["name"] for column in inspect(sync_conn).get_columns(table_name)
+                }
+            )
+        cached = (now + KNOWN_TABLES_TTL_SECONDS, frozenset(columns))
+        _COLUMN_CACHE[table_name] = cached
+    return column_name in cached[1]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _remember_created_tables(target: Any, connection: Any, **kw: Any) -> None:
+    _COLUMN_CACHE.clear()
+    if _known_tables is not None:
+        _known_tables.update(target.tables.keys())
+
+
+@event.listens_for(Base.metadata, "after_drop")
+def _forget_dropped_tables(target: Any, connection: Any, **kw: Any) -> None:
+    _COLUMN_CACHE.clear()
+    if _known_tables is not None:
+        _known_tables.difference_update(target.tables.keys())
 
 
 async def ensure_vendor_model_column() -> None:
@@ -79,7 +79,11 @@ export function DashboardMetrics() {
             aria-label={`View ${metric.label} details`}
           >
             <p className="text-xs uppercase tracking-[0.35em] text-slate-400">{metric.label}</p>
-            <p className="mt-4 text-3xl font-semibold text-white">
+            <p
+              className="mt-4 text-3xl font-semibold text-white"
+              title={metric.approximate ? 'Estimated count, rounded to the nearest 10' : undefined}
+            >
+              {metric.approximate ? '~' : ''}
               {typeof metric.value === 'number' ? metric.value.toLocaleString() : metric.value}
             </p>
             <p className="mt-2 text-xs font-semibold text-emerald-300">{metric.change}</p>
@@ -3,6 +3,7 @@ export type DashboardMetric = {
   value: number;
   change: string;
   status: string;
+  approximate?: boolean;
 };
 
 export type DashboardActivity = {